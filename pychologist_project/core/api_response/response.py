@@ -225,3 +225,21 @@ class DjangoResponseWrapper:
         return Response(data=asdict(reponse_body), status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     
+
+    @staticmethod
+    def service_unavailable(message=None, retry_after=None):
+        if not message:
+            message = 'Service Unavailable'
+
+        reponse_body = ApiResponse(
+            data=None,
+            timestamp= datetime.now().isoformat(),
+            success= False,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=message
+        )
+
+        response = Response(data=asdict(reponse_body), status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        if retry_after:
+            response['Retry-After'] = str(retry_after)
+        return response
@@ -1,5 +1,8 @@
+import hashlib
+import json
+import time
 from django.core.cache import cache
-from typing import Dict, List, Any
+from typing import Callable, Dict, Hashable, Iterable, List, Any
 
 class CacheManager:
     def __init__(self, cache_prefix):
@@ -13,6 +16,38 @@ class CacheManager:
     def get(self, key: str) -> Any:
         return cache.get(key)
 
+    def get_multi(self, keys: List[str]) -> Dict[str, Any]:
+        """Returns the cached entries among keys in one round trip; missing keys are left out."""
+        return cache.get_many(keys)
+
+    def get_or_load_many(
+        self,
+        ids: Iterable[Hashable],
+        load_many: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        key_fn: Callable[[Hashable], str] = None,
+        timeout: int = None
+    ) -> Dict[Hashable, Any]:
+        """
+        Batch read-through: one get_many for all ids, one load_many call for the ids that missed and
+        one set_many to backfill them. Ids that load_many does not return are left out of the result.
+        """
+        key_fn = key_fn or self.get_cache_key
+        keys = {item_id: key_fn(item_id) for item_id in dict.fromkeys(ids)}
+        if not keys:
+            return {}
+
+        cached = self.get_multi(list(keys.values()))
+        found = {item_id: cached[key] for item_id, key in keys.items() if key in cached}
+
+        missing = [item_id for item_id in keys if item_id not in found]
+        if missing:
+            loaded = load_many(missing)
+            if loaded:
+                self.set_multi({keys[item_id]: value for item_id, value in loaded.items()}, timeout)
+                found.update(loaded)
+
+        return found
+
     def set(self, key: str, value: Any, timeout: int = None):
         cache.set(key, value, timeout or self.CACHE_TIMEOUT)
 
@@ -26,4 +61,34 @@ class CacheManager:
         cache.delete_many(keys)
 
     def generate_search_key(self, filters: dict) -> str:
-        return f"search_{hash(frozenset(filters.items()))}"
\ No newline at end of file
+        # Stable across processes (unlike hash()) so every worker shares the same cached pages
+        serialized = json.dumps(filters or {}, sort_keys=True, default=str)
+        digest = hashlib.md5(serialized.encode('utf-8')).hexdigest()
+        return f"{self.cache_prefix}search_{digest}"
+
+    def generate_versioned_search_key(self, filters: dict) -> str:
+        """Search key tied to the current version, so `bump_version` drops all of them in one write."""
+        return f"{self.cache_prefix}v{self.get_version()}_{self.generate_search_key(filters)}"
+
+    def get_version(self) -> int:
+        """
+        Version of the cached searches under this prefix. Bumping it invalidates every search key at once,
+        the old entries simply expire.
+
+        The counter is seeded from the clock rather than 1, so if it is evicted or the cache restarts it never
+        comes back at a value whose search keys may still hold stale pages.
+        """
+        version_key = f"{self.cache_prefix}version"
+        version = cache.get(version_key)
+        if version is None:
+            seed = time.time_ns()
+            cache.add(version_key, seed, None)
+            version = cache.get(version_key, seed)
+        return version
+
+    def bump_version(self):
+        version_key = f"{self.cache_prefix}version"
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, time.time_ns(), None)
@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+PER_PROCESS_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+    if backend in PER_PROCESS_CACHE_BACKENDS:
+        return [Warning(
+            f"CACHES['default'] uses {backend}, which is not shared between workers.",
+            hint="Set CACHE_URL to a shared backend such as redis:// so cache invalidation reaches every worker.",
+            id='core.W001',
+        )]
+    return []
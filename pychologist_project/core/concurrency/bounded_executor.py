@@ -0,0 +1,113 @@
+import os
+import random
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+from core.exceptions.custom_exceptions import ServiceUnavailableError
+
+try:
+    import fcntl
+except ImportError:  # Windows development machines
+    fcntl = None
+
+# How often a queued call looks for a free slot
+POLL_INTERVAL = 0.005
+# Slot handle of the semaphore fallback, which has no file descriptor
+SEMAPHORE_SLOT = -1
+
+
+class BoundedExecutor:
+    """
+    Runs CPU-heavy calls with at most `max_concurrency` of them at once on the host.
+
+    Gunicorn sync workers are separate processes, so a thread semaphore would not bound anything.
+    Every slot is an flock-ed file under `lock_dir`: a call takes the first free slot, waits up to
+    `queue_timeout` seconds for one to free up and otherwise fails fast with ServiceUnavailableError,
+    leaving the remaining workers to answer cheap requests. Locks are released by the kernel if a
+    worker dies. Without fcntl it falls back to a per-process semaphore.
+    """
+    def __init__(self, name: str, max_concurrency: int, queue_timeout: float, lock_dir: Optional[str] = None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency debe ser al menos 1")
+
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self.lock_dir = lock_dir or os.path.join(tempfile.gettempdir(), f"pychologist-{name}")
+        self._semaphore = threading.BoundedSemaphore(max_concurrency) if fcntl is None else None
+
+        if fcntl is not None:
+            os.makedirs(self.lock_dir, exist_ok=True)
+
+    def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        slot = self._acquire()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._release(slot)
+
+    @contextmanager
+    def reserve(self, count: int) -> Iterator[int]:
+        """
+        Holds up to `count` slots for a block that runs its own workers, e.g. a process pool sized to the
+        slots it got. The first slot is waited for like in run(); the rest are only taken if free right now.
+        Yields the number of slots held.
+        """
+        slots = [self._acquire()]
+        try:
+            while len(slots) < min(count, self.max_concurrency):
+                slot = self._try_acquire()
+                if slot is None:
+                    break
+                slots.append(slot)
+            yield len(slots)
+        finally:
+            for slot in slots:
+                self._release(slot)
+
+    def _acquire(self) -> int:
+        if self._semaphore is not None:
+            if not self._semaphore.acquire(timeout=self.queue_timeout):
+                raise ServiceUnavailableError(f"{self.name}: capacidad agotada")
+            return SEMAPHORE_SLOT
+
+        deadline = time.monotonic() + self.queue_timeout
+        while True:
+            slot = self._try_acquire()
+            if slot is not None:
+                return slot
+
+            if time.monotonic() >= deadline:
+                raise ServiceUnavailableError(f"{self.name}: capacidad agotada")
+            time.sleep(POLL_INTERVAL)
+
+    def _try_acquire(self) -> Optional[int]:
+        if self._semaphore is not None:
+            return SEMAPHORE_SLOT if self._semaphore.acquire(blocking=False) else None
+
+        # Starting at a random slot spreads concurrent callers instead of all probing slot 0
+        first = random.randrange(self.max_concurrency)
+        for offset in range(self.max_concurrency):
+            slot = self._try_lock((first + offset) % self.max_concurrency)
+            if slot is not None:
+                return slot
+        return None
+
+    def _try_lock(self, index: int) -> Optional[int]:
+        fd = os.open(os.path.join(self.lock_dir, f"slot-{index}.lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        return fd
+
+    def _release(self, slot: int) -> None:
+        if self._semaphore is not None:
+            self._semaphore.release()
+            return
+
+        fcntl.flock(slot, fcntl.LOCK_UN)
+        os.close(slot)
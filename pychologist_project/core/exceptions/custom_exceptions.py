@@ -39,4 +39,13 @@ class InvalidOperationError(Exception):
         message = f"Operación inválida: {operation}"
         if details:
             message += f". Detalles: {details}"
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+class ServiceUnavailableError(Exception):
+    """
+    Custom exception for requests rejected because a bounded resource is saturated.
+    """
+    def __init__(self, message: str, retry_after: int = 1):
+        self.message = message
+        self.retry_after = retry_after
+        super().__init__(message)
@@ -3,8 +3,9 @@ from rest_framework import status
 from rest_framework.response import Response
 import logging
 from rest_framework.exceptions import ValidationError
-from .custom_exceptions import EntityNotFoundError, BusinessLogicError, InvalidOperationError
+from .custom_exceptions import EntityNotFoundError, BusinessLogicError, InvalidOperationError, ServiceUnavailableError
 from core.api_response.response import ApiResponse
+from dataclasses import asdict
 from datetime import datetime
 from core.api_response.response import DjangoResponseWrapper
 
@@ -69,6 +70,16 @@ def custom_exception_handler(exc, context):
         )
         return DjangoResponseWrapper.conflict(str(exc))
 
+    elif isinstance(exc, ServiceUnavailableError):
+        audit_logger.warning(
+            "ServiceUnavailableError - View: %(view)s, User: %(user_id)s, IP: %(ip)s, Error: %(exception)s",
+            log_context
+        )
+        return DjangoResponseWrapper.service_unavailable(
+            message="The server is busy. Please try again in a moment.",
+            retry_after=exc.retry_after
+        )
+
     elif response is None:
         audit_logger.critical(
             "UnhandledException - View: %(view)s, User: %(user_id)s, IP: %(ip)s, Error: %(exception)s",
@@ -79,10 +90,15 @@ def custom_exception_handler(exc, context):
             message="An unexpected error occurred. Please try again later."
         )
 
-    # Format existing DRF responses with ApiResponse
+    # Format existing DRF responses (authentication, permissions, throttling...) with ApiResponse
     if response is not None:
-        response.data = Response(
+        detail = getattr(exc, 'detail', None)
+        response.data = asdict(ApiResponse(
             data=response.data if hasattr(response, 'data') else None,
-        )
+            timestamp=datetime.now().isoformat(),
+            success=False,
+            status_code=response.status_code,
+            message=str(detail) if isinstance(detail, str) else str(exc),
+        ))
     
     return response
\ No newline at end of file
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import time
+import uuid
+from datetime import timedelta
+from functools import wraps
+from typing import Any, Dict, Optional
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.response import Response
+from core.idempotency.models import IdempotencyRecord
+from core.api_response.response import DjangoResponseWrapper as ResponseWrapper
+
+IDEMPOTENCY_HEADER = 'HTTP_IDEMPOTENCY_KEY'
+IDEMPOTENCY_REPLAY_HEADER = 'Idempotent-Replayed'
+MAX_KEY_LENGTH = 255
+
+DEFAULT_TTL = 60 * 60 * 24  # 24 hours
+DEFAULT_LOCK_TIMEOUT = 30
+DEFAULT_LOCK_WAIT = 5
+LOCK_POLL_INTERVAL = 0.05
+PURGE_BATCH_SIZE = 1000
+
+
+class IdempotencyStore:
+    """
+    TTL store for idempotent requests backed by the `IdempotencyRecord` table.
+
+    Each (scope, key) row holds the request fingerprint and the response that was returned the first time.
+    The unique constraint on (scope, key) is the lock: only one worker can insert the row, so concurrent
+    requests that share the same Idempotency-Key are serialized across processes and hosts.
+    """
+    def __init__(self, scope: str, ttl: int = None, lock_timeout: int = None):
+        self.scope = scope
+        self.ttl = ttl or getattr(settings, 'IDEMPOTENCY_TTL', DEFAULT_TTL)
+        self.lock_timeout = lock_timeout or getattr(settings, 'IDEMPOTENCY_LOCK_TIMEOUT', DEFAULT_LOCK_TIMEOUT)
+
+    def _rows(self, key: str):
+        return IdempotencyRecord.objects.filter(scope=self.scope, key=key)
+
+    def get_record(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._rows(key).filter(
+            status_code__isnull=False,
+            expires_at__gt=timezone.now(),
+        ).values('fingerprint', 'status_code', 'data').first()
+
+    def save_record(self, key: str, fingerprint: str, response: Response) -> None:
+        self._rows(key).update(
+            fingerprint=fingerprint,
+            status_code=response.status_code,
+            data=response.data,
+            lock_token='',
+            locked_until=None,
+            expires_at=timezone.now() + timedelta(seconds=self.ttl),
+        )
+
+    def acquire_lock(self, key: str) -> Optional[str]:
+        token = uuid.uuid4().hex
+        now = timezone.now()
+        claim = {
+            'fingerprint': '',
+            'status_code': None,
+            'data': None,
+            'lock_token': token,
+            'locked_until': now + timedelta(seconds=self.lock_timeout),
+            'expires_at': now + timedelta(seconds=self.ttl),
+        }
+        try:
+            with transaction.atomic():
+                IdempotencyRecord.objects.create(scope=self.scope, key=key, **claim)
+            return token
+        except IntegrityError:
+            pass
+
+        # The row exists: take it over only if its record expired or its owner died holding the lock
+        claimed = self._rows(key).filter(
+            Q(expires_at__lte=now) | Q(status_code__isnull=True, locked_until__lte=now)
+        ).update(**claim)
+        return token if claimed else None
+
+    def release_lock(self, key: str, token: str) -> None:
+        # Drops the row only when no response was saved, so the client can retry from scratch
+        self._rows(key).filter(lock_token=token, status_code__isnull=True).delete()
+
+    def wait_for_record(self, key: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Polls until the lock owner saves its response. Returns None as soon as the key is free again
+        (the owner failed and released the lock, or died holding it) or when the timeout expires, so
+        the caller can try to take the lock itself.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            now = timezone.now()
+            row = self._rows(key).values('fingerprint', 'status_code', 'data', 'locked_until', 'expires_at').first()
+            if row is None or row['expires_at'] <= now:
+                return None
+            if row['status_code'] is not None:
+                return row
+            if row['locked_until'] <= now or time.monotonic() >= deadline:
+                return None
+            time.sleep(LOCK_POLL_INTERVAL)
+
+    @staticmethod
+    def purge_expired(batch_size: int = PURGE_BATCH_SIZE) -> int:
+        deleted = 0
+        while True:
+            ids = list(
+                IdempotencyRecord.objects.filter(expires_at__lte=timezone.now())
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                return deleted
+            deleted += IdempotencyRecord.objects.filter(id__in=ids).delete()[0]
+
+
+def get_request_fingerprint(request) -> str:
+    """
+    Hash of the parts of the request that must match for a replay to be valid.
+    """
+    try:
+        body = json.dumps(request.data, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        body = request.body.decode('utf-8', errors='replace')
+
+    raw = f"{request.method}|{request.path}|{body}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def replay_response(record: Dict[str, Any]) -> Response:
+    response = Response(data=record['data'], status=record['status_code'])
+    response[IDEMPOTENCY_REPLAY_HEADER] = 'true'
+    return response
+
+
+def idempotent(scope: str):
+    """
+    Makes a view method idempotent when the client sends an `Idempotency-Key` header.
+
+    The first request runs the view and stores its response. Retries with the same key and payload
+    get the stored response back without running the view again. A retry that arrives while the first
+    request is still running waits for it to finish instead of running in parallel; if the first request
+    fails without a response to store, the waiting retry takes the key over and runs the view itself.
+    Requests without the header are not affected.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(view, request, *args, **kwargs):
+            key = request.META.get(IDEMPOTENCY_HEADER)
+            if not key:
+                return view_method(view, request, *args, **kwargs)
+
+            if len(key) > MAX_KEY_LENGTH:
+                return ResponseWrapper.bad_request(message=f"Idempotency-Key must be at most {MAX_KEY_LENGTH} characters")
+
+            user_id = getattr(request.user, 'id', None) or 'anonymous'
+            store_key = f"{user_id}_{key}"
+            store = IdempotencyStore(scope)
+            fingerprint = get_request_fingerprint(request)
+
+            record = store.get_record(store_key)
+            deadline = time.monotonic() + getattr(settings, 'IDEMPOTENCY_LOCK_WAIT', DEFAULT_LOCK_WAIT)
+            while record is None:
+                token = store.acquire_lock(store_key)
+                if token is not None:
+                    try:
+                        # Another request may have finished between the first read and taking the lock
+                        record = store.get_record(store_key)
+                        if record is None:
+                            response = view_method(view, request, *args, **kwargs)
+                            if response.status_code < 500:
+                                store.save_record(store_key, fingerprint, response)
+                            return response
+                    finally:
+                        store.release_lock(store_key, token)
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return ResponseWrapper.conflict("A request with this Idempotency-Key is still being processed")
+                    # Returns None when the owner failed and freed the key, so this request takes over
+                    record = store.wait_for_record(store_key, remaining)
+
+            if record['fingerprint'] != fingerprint:
+                return ResponseWrapper.conflict("Idempotency-Key was already used with a different request")
+
+            return replay_response(record)
+        return wrapper
+    return decorator
@@ -20,6 +20,10 @@ class AuditLogMiddleware(MiddlewareMixin):
         }
 
     def process_response(self, request, response):
+        # A 304 discloses nothing new; calendar clients revalidate feeds every few minutes
+        if response.status_code == 304:
+            return response
+
         if hasattr(request, 'audit_data'):
             audit_data = request.audit_data
             user = request.user if request.user.is_authenticated else None
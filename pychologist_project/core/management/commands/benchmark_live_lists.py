@@ -0,0 +1,70 @@
+import statistics
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from patients.models import Patient
+
+
+class RollbackBenchmark(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Mide la latencia del listado de pacientes vivos según la fracción de registros borrados lógicamente'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=50000)
+        parser.add_argument('--fractions', type=str, default='0,0.25,0.5,0.75,0.9,0.99')
+        parser.add_argument('--page-size', type=int, default=50)
+        parser.add_argument('--repeat', type=int, default=30)
+
+    def handle(self, *args, **options):
+        fractions = [float(fraction) for fraction in options['fractions'].split(',')]
+
+        # Everything runs inside a transaction that is rolled back, so the database is left untouched
+        try:
+            with transaction.atomic():
+                self._seed(options['rows'])
+                self.stdout.write(f"{'deleted':>8} {'first page ms':>14} {'deep page ms':>13} {'count ms':>9}")
+
+                for fraction in fractions:
+                    self._mark_deleted(fraction)
+                    first_page, deep_page, count = self._measure(options['page_size'], options['repeat'])
+                    self.stdout.write(f"{fraction:>8.0%} {first_page:>14.2f} {deep_page:>13.2f} {count:>9.2f}")
+
+                raise RollbackBenchmark()
+        except RollbackBenchmark:
+            pass
+
+    def _seed(self, rows: int) -> None:
+        Patient.objects.bulk_create(
+            [Patient(name=f"Paciente {index}", is_active=index % 10 != 0) for index in range(rows)],
+            batch_size=5000,
+        )
+
+    def _mark_deleted(self, fraction: float) -> None:
+        ids = list(Patient.objects.order_by('id').values_list('id', flat=True))
+        # Deleted rows are spread over the whole id range, like real churn
+        deleted_per_hundred = round(fraction * 100)
+        deleted_ids = [patient_id for index, patient_id in enumerate(ids) if index % 100 < deleted_per_hundred]
+        Patient.objects.update(deleted_at=None)
+        for start in range(0, len(deleted_ids), 5000):
+            Patient.objects.filter(id__in=deleted_ids[start:start + 5000]).update(deleted_at=timezone.now())
+
+    def _measure(self, page_size: int, repeat: int):
+        live_patients = Patient.live.active().values('id', 'name', 'is_active').order_by('id')
+        last_id = live_patients.values_list('id', flat=True).reverse().first() or 0
+
+        def timed(query):
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                query()
+                samples.append((time.perf_counter() - start) * 1000)
+            return statistics.median(samples)
+
+        first_page = timed(lambda: list(live_patients[:page_size]))
+        deep_page = timed(lambda: list(live_patients.filter(id__gt=last_id // 2)[:page_size]))
+        count = timed(lambda: Patient.live.active().count())
+        return first_page, deep_page, count
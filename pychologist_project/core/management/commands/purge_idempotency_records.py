@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from core.idempotency.idempotency import IdempotencyStore, PURGE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Borra por lotes los registros de Idempotency-Key caducados'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=PURGE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        deleted = IdempotencyStore.purge_expired(options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f"Registros de idempotencia caducados borrados: {deleted}"))
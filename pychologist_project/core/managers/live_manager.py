@@ -0,0 +1,18 @@
+from django.db import models
+
+
+class LiveQuerySet(models.QuerySet):
+    def active(self):
+        return self.filter(is_active=True)
+
+
+class LiveManager(models.Manager.from_queryset(LiveQuerySet)):
+    """
+    Manager for soft-deletable models that only returns rows with `deleted_at` unset.
+
+    The models declare partial indexes with the same `deleted_at IS NULL` condition, so every query
+    built from this manager can use them. Keep `objects` as the default manager for admin, related
+    lookups and queries that need deleted rows.
+    """
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
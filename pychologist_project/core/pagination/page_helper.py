@@ -1,13 +1,20 @@
-from typing import List, TypeVar, Generic, Tuple
+import base64
+from typing import List, TypeVar, Generic, Tuple, Optional
 from django.core.paginator import Paginator, EmptyPage
 from dataclasses import dataclass
 
 T = TypeVar('T')
 
 class PaginationInput:
-    def __init__(self, page_number: int = 1, page_size: int = 10):
+    def __init__(self, page_number: int = 1, page_size: int = 10, cursor: Optional[str] = None):
         self.page_number = page_number
         self.page_size = page_size
+        # When set (an empty string means the first page) keyset pagination is used instead of offsets
+        self.cursor = cursor
+
+    @property
+    def uses_cursor(self) -> bool:
+        return self.cursor is not None
 
 @dataclass
 class PaginationMetadata:
@@ -66,6 +73,58 @@ class PaginationHelper:
             )
 
 
+@dataclass
+class CursorPaginatedResponse(Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str]
+    page_size: int
+    has_next: bool
+
+
+def encode_cursor(value) -> str:
+    return base64.urlsafe_b64encode(str(value).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> str:
+    try:
+        return base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor")
+
+
+class CursorPaginationHelper:
+    @staticmethod
+    def get_cursor_response(
+        pagination_input: PaginationInput,
+        queryset,
+        mapper_fn=lambda x: x,
+        key: str = 'id'
+    ) -> CursorPaginatedResponse:
+        """
+        Keyset pagination over an ascending unique `key`: no OFFSET and no COUNT, so every page costs
+        the same no matter how deep the client goes.
+        """
+        queryset = queryset.order_by(key)
+        if pagination_input.cursor:
+            queryset = queryset.filter(**{f'{key}__gt': decode_cursor(pagination_input.cursor)})
+
+        rows = list(queryset[:pagination_input.page_size + 1])
+        has_next = len(rows) > pagination_input.page_size
+        rows = rows[:pagination_input.page_size]
+
+        next_cursor = None
+        if has_next:
+            last_row = rows[-1]
+            next_cursor = encode_cursor(last_row[key] if isinstance(last_row, dict) else getattr(last_row, key))
+
+        return CursorPaginatedResponse(
+            items=[mapper_fn(row) for row in rows],
+            next_cursor=next_cursor,
+            page_size=pagination_input.page_size,
+            has_next=has_next
+        )
+
+
 def get_pagination_data(request) -> PaginationInput:
     try:
         page_number = int(request.query_params.get('page', 1))
@@ -74,4 +133,4 @@ def get_pagination_data(request) -> PaginationInput:
         page_number = 1
         page_size = 10
 
-    return PaginationInput(page_number=page_number, page_size=page_size)
\ No newline at end of file
+    return PaginationInput(page_number=page_number, page_size=page_size, cursor=request.query_params.get('cursor'))
\ No newline at end of file
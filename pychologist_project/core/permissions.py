@@ -1,11 +1,53 @@
 from rest_framework.permissions import BasePermission
+from therapy.models import TherapyParticipant
+from users.core.presentation.api.authentication import get_user_principal
+
 
 class IsTherapistOrAdmin(BasePermission):
-  class IsTherapistOrAdmin(BasePermission):
     """
-    Permite el acceso solo a usuarios con roles 'therapist' o 'admin'.
+    Permite el acceso solo a usuarios con rol de terapeuta o administrador.
+    El rol sale del principal cacheado, sin consultar la base de datos.
     """
     def has_permission(self, request, view):
-        user_roles = getattr(request.user, 'roles', [])
-        
-        return 'therapist' in user_roles or 'admin' in user_roles
\ No newline at end of file
+        principal = get_user_principal(request.user)
+
+        return principal is not None and principal.role in ('THERAPIST', 'ADMIN')
+
+
+class IsOwnTherapistOrAdmin(BasePermission):
+    """
+    Para rutas de un terapeuta concreto (`pk` en la URL): solo ese terapeuta o un administrador.
+    """
+    def has_permission(self, request, view):
+        principal = get_user_principal(request.user)
+        if principal is None:
+            return False
+
+        if principal.role == 'ADMIN':
+            return True
+
+        return principal.therapist_id is not None and str(principal.therapist_id) == str(view.kwargs.get('pk'))
+
+
+class IsPatientCareTeamOrAdmin(BasePermission):
+    """
+    Para rutas de un paciente concreto (`pk` en la URL): el propio paciente, un terapeuta que lo haya
+    tratado en alguna sesión o un administrador.
+    """
+    def has_permission(self, request, view):
+        principal = get_user_principal(request.user)
+        if principal is None:
+            return False
+
+        if principal.role == 'ADMIN':
+            return True
+
+        patient_id = str(view.kwargs.get('pk'))
+        if principal.patient_id is not None and str(principal.patient_id) == patient_id:
+            return True
+
+        return principal.therapist_id is not None and patient_id.isdigit() and TherapyParticipant.objects.filter(
+            patient_id=patient_id,
+            therapy_session__therapist_id=principal.therapist_id,
+            therapy_session__deleted_at__isnull=True,
+        ).exists()
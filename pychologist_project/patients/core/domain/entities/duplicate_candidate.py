@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import combinations
+from typing import List, Optional, Set
+
+DUPLICATE_PENDING = 'PENDING'
+DUPLICATE_CONFIRMED = 'CONFIRMED'
+DUPLICATE_DISMISSED = 'DISMISSED'
+
+DUPLICATE_STATUSES = (DUPLICATE_PENDING, DUPLICATE_CONFIRMED, DUPLICATE_DISMISSED)
+
+# Only the first tokens of a name take part in blocking, so a patient never has more than 6 keys
+MAX_BLOCKING_TOKENS = 4
+PHONETIC_CODE_LENGTH = 6
+
+# Spanish-oriented sound classes: spellings that sound alike get the same code
+PHONETIC_REPLACEMENTS = (
+    ('ch', 'X'),
+    ('qu', 'k'),
+    ('ll', 'y'),
+    ('ce', 'se'), ('ci', 'si'),
+    ('ge', 'je'), ('gi', 'ji'),
+    ('gue', 'ge'), ('gui', 'gi'),
+    ('ph', 'f'),
+)
+PHONETIC_LETTERS = str.maketrans({
+    'h': '', 'v': 'b', 'w': 'b', 'z': 's', 'c': 'k', 'q': 'k', 'x': 's',
+})
+VOWELS = frozenset('aeiouy')
+
+
+@dataclass
+class DuplicateCandidate:
+    """Par de pacientes que probablemente son la misma persona, pendiente de revisión."""
+    patient_id: int
+    duplicate_id: int
+    score: float
+    status: str = DUPLICATE_PENDING
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        # A pair is stored once, lowest id first
+        if self.patient_id > self.duplicate_id:
+            self.patient_id, self.duplicate_id = self.duplicate_id, self.patient_id
+
+
+def phonetic_code(token: str) -> str:
+    """
+    Código fonético de una palabra ya normalizada (minúsculas, sin acentos): conserva la primera letra
+    y el esqueleto de consonantes, de modo que "gonzalez" y "gonsales" o "jimenez" y "gimenez" coinciden.
+    """
+    for spelling, sound in PHONETIC_REPLACEMENTS:
+        token = token.replace(spelling, sound)
+    token = token.translate(PHONETIC_LETTERS).lower()
+    if not token:
+        return ''
+
+    code = [token[0] if token[0] not in VOWELS else 'a']
+    for char in token[1:]:
+        if char in VOWELS or char == code[-1]:
+            continue
+        code.append(char)
+    return ''.join(code)[:PHONETIC_CODE_LENGTH]
+
+
+def blocking_keys(name_key: str) -> Set[str]:
+    """
+    Claves de bloqueo de un nombre normalizado. Solo se comparan pacientes que comparten alguna clave:
+    los pares de palabras con igual sonido, en cualquier orden ("luis gomez" y "gomes luis").
+    """
+    codes = sorted({phonetic_code(token) for token in name_key.split()[:MAX_BLOCKING_TOKENS] if len(token) > 1} - {''})
+    if len(codes) == 1:
+        return {codes[0]}
+    return {f"{first}|{second}" for first, second in combinations(codes, 2)}
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def name_similarity(first_key: str, second_key: str) -> float:
+    """
+    Similitud entre 0 y 1 de dos nombres normalizados. Promedia el coeficiente de Jaccard de sus trigramas
+    (errores de escritura) y el de sus códigos fonéticos (variantes de grafía), ignorando el orden de las palabras.
+    """
+    first_tokens, second_tokens = sorted(first_key.split()), sorted(second_key.split())
+    if not first_tokens or not second_tokens:
+        return 0.0
+
+    first_codes = {phonetic_code(token) for token in first_tokens}
+    second_codes = {phonetic_code(token) for token in second_tokens}
+
+    return (
+        _jaccard(trigrams(' '.join(first_tokens)), trigrams(' '.join(second_tokens)))
+        + _jaccard(first_codes, second_codes)
+    ) / 2
+
+
+def _jaccard(first: Set[str], second: Set[str]) -> float:
+    return len(first & second) / len(first | second)
+
+
+def score_candidates(patient_id: int, name_key: str, candidates: List[tuple], threshold: float) -> List[DuplicateCandidate]:
+    """Puntúa a un paciente frente a los (id, name_key) de su bloque y devuelve los pares por encima del umbral."""
+    scored = []
+    for candidate_id, candidate_key in candidates:
+        if candidate_id == patient_id:
+            continue
+        score = name_similarity(name_key, candidate_key)
+        if score >= threshold:
+            scored.append(DuplicateCandidate(patient_id=patient_id, duplicate_id=candidate_id, score=round(score, 4)))
+    return scored
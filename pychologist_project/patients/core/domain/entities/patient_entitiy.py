@@ -38,3 +38,11 @@ class Patient:
         
         self.is_active = True
         self.updated_at = datetime.now()
+
+
+@dataclass
+class PatientSummary:
+    """Proyección ligera de un paciente para listados."""
+    id: int
+    name: str
+    is_active: bool
@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict
+
+TIMELINE_SESSION = 'session'
+TIMELINE_PAYMENT = 'payment'
+
+# Tie-break between kinds at the same instant; higher ranks come first in the timeline
+TIMELINE_KIND_RANK = {
+    TIMELINE_PAYMENT: 0,
+    TIMELINE_SESSION: 1,
+}
+
+
+@dataclass
+class TimelineEntry:
+    """Evento del historial de un paciente: una sesión o un pago."""
+    kind: str
+    id: int
+    occurred_at: datetime
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def sort_key(self):
+        return (self.occurred_at, TIMELINE_KIND_RANK[self.kind], self.id)
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Set, Tuple
+from core.pagination.page_helper import PaginationInput, PaginatedResponse
+from ..entities.duplicate_candidate import DuplicateCandidate
+
+
+class PatientDuplicateRepository(ABC):
+    """Interfaz para el índice de bloqueo y los pares candidatos de la detección de duplicados."""
+
+    @abstractmethod
+    def get_patients_to_check(self, after_id: int, limit: int, only_pending: bool) -> List[Tuple[int, str]]:
+        """Obtiene (id, name_key) de los siguientes pacientes a revisar, ordenados por id."""
+        pass
+
+    @abstractmethod
+    def replace_blocking_keys(self, keys_by_patient: Dict[int, Set[str]]) -> None:
+        """Sustituye las claves de bloqueo de los pacientes indicados."""
+        pass
+
+    @abstractmethod
+    def get_block_members(self, keys: Iterable[str], max_block_size: int) -> Dict[str, List[Tuple[int, str]]]:
+        """Obtiene los pacientes (id, name_key) de cada clave, omitiendo los bloques mayores que max_block_size."""
+        pass
+
+    @abstractmethod
+    def save_candidates(self, candidates: List[DuplicateCandidate]) -> int:
+        """Guarda los pares nuevos, ignorando los ya registrados, y devuelve cuántos se han creado."""
+        pass
+
+    @abstractmethod
+    def mark_checked(self, patient_ids: List[int]) -> None:
+        """Marca los pacientes como revisados para el modo incremental."""
+        pass
+
+    @abstractmethod
+    def clear_index(self) -> None:
+        """Vacía el índice de bloqueo antes de una detección completa."""
+        pass
+
+    @abstractmethod
+    def get_candidates(self, status: str, pagination_input: PaginationInput) -> PaginatedResponse[DuplicateCandidate]:
+        """Obtiene los pares con el estado indicado, de mayor a menor puntuación."""
+        pass
+
+    @abstractmethod
+    def update_status(self, candidate_id: int, status: str) -> DuplicateCandidate:
+        """Actualiza el estado de revisión de un par."""
+        pass
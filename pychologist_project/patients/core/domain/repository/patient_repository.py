@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
-from ..entities.patient_entitiy import Patient
+from datetime import datetime
+from typing import List, Dict, Optional, Any, Union, Tuple, Iterator, Iterable
+from ..entities.patient_entitiy import Patient, PatientSummary
+from core.pagination.page_helper import PaginationInput, PaginatedResponse, CursorPaginatedResponse
 
 class PatientRepository(ABC):
     """Interfaz para el repositorio de pacientes."""
@@ -21,8 +23,33 @@ class PatientRepository(ABC):
         pass
     
     @abstractmethod
-    def search(self, filters: Optional[Dict[str, Any]] = None) -> List[Patient]:
-        """Busca pacientes según filtros especificados."""
+    def get_many_by_ids(self, patient_ids: Iterable[int]) -> Dict[int, Patient]:
+        """Obtiene varios pacientes por ID en una sola lectura de caché; los inexistentes se omiten."""
+        pass
+    
+    @abstractmethod
+    def search(self, filters: Optional[Dict[str, Any]], pagination_input: PaginationInput) -> Union[PaginatedResponse[PatientSummary], CursorPaginatedResponse[PatientSummary]]:
+        """Busca pacientes según filtros especificados, paginando por offset o por cursor."""
+        pass
+    
+    @abstractmethod
+    def full_text_search(self, query: str, pagination_input: PaginationInput) -> PaginatedResponse[Patient]:
+        """Busca pacientes por nombre y descripción, ordenados por relevancia."""
+        pass
+    
+    @abstractmethod
+    def record_completed_therapy(self, patient_ids: List[int], therapy_time: datetime) -> None:
+        """Actualiza first_therapy/last_therapy de los pacientes con una sesión completada."""
+        pass
+    
+    @abstractmethod
+    def bulk_create(self, patients: List[Patient]) -> Tuple[List[Patient], List[Patient]]:
+        """Crea pacientes en bloque. Devuelve (creados, posibles duplicados por nombre entre los creados)."""
+        pass
+    
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[Patient]:
+        """Recorre todos los pacientes activos por bloques, sin cargarlos en memoria."""
         pass
     
     @abstractmethod
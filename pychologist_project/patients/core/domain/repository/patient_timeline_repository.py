@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from core.pagination.page_helper import PaginationInput, CursorPaginatedResponse
+from ..entities.patient_timeline import TimelineEntry
+
+
+class PatientTimelineRepository(ABC):
+    """Interfaz para el historial combinado de sesiones y pagos de un paciente."""
+
+    @abstractmethod
+    def get_timeline(self, patient_id: int, pagination_input: PaginationInput) -> CursorPaginatedResponse[TimelineEntry]:
+        """Obtiene el historial del paciente, del evento más reciente al más antiguo."""
+        pass
@@ -20,7 +20,7 @@ class PatientMapper:
             created_at=patient_model.created_at,
             updated_at=patient_model.updated_at,
             deleted_at=patient_model.deleted_at,
-            user_id=patient_model.user_id if patient_model.user else None
+            user_id=patient_model.user_id
         )
     
     @staticmethod
@@ -1,11 +1,31 @@
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from typing import Dict, List, Optional, Any, Union, Iterable, Iterator
 from datetime import datetime
 from dataclasses import asdict
-from ...core.domain.entities.patient_entitiy import Patient
+from ...core.domain.entities.patient_entitiy import Patient, PatientSummary
 from ...core.domain.repository.patient_repository import PatientRepository
+from ...core.domain.repository.patient_timeline_repository import PatientTimelineRepository
+from ...core.domain.repository.patient_duplicate_repository import PatientDuplicateRepository
+from ...core.domain.entities.patient_timeline import TimelineEntry
+from ...core.domain.entities.duplicate_candidate import (
+    DuplicateCandidate,
+    DUPLICATE_STATUSES,
+    blocking_keys,
+    score_candidates,
+)
 from ...core.mappers.payment_mappers import PatientMapper
 from ...application.dtos.patient_dto import PatientDTO
 from core.exceptions.custom_exceptions import EntityNotFoundError
+from core.pagination.page_helper import PaginationInput, PaginatedResponse, CursorPaginatedResponse
+
+MIN_SEARCH_QUERY_LENGTH = 2
+MAX_PAGE_SIZE = 100
+IMPORT_CHUNK_SIZE = 1000
+MAX_REPORTED_IMPORT_ERRORS = 100
+DEDUP_BATCH_SIZE = 1000
+DUPLICATE_SCORE_THRESHOLD = 0.7
+# Blocks larger than this (very common names) are too unspecific to be worth comparing
+MAX_BLOCK_SIZE = 500
 
 class CreatePatientUseCase:    
     def __init__(self, patient_repository: PatientRepository):
@@ -55,8 +75,174 @@ class SearchPatientsUseCase:
     def __init__(self, patient_repository: PatientRepository):
         self.patient_repository = patient_repository
     
-    def execute(self, filters: Optional[Dict[str, Any]] = None) -> List[Patient]:
-        return self.patient_repository.search(filters)
+    def execute(self, filters: Optional[Dict[str, Any]], pagination_input: PaginationInput) -> Union[PaginatedResponse[PatientSummary], CursorPaginatedResponse[PatientSummary]]:
+        if not 1 <= pagination_input.page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"El tamaño de página debe estar entre 1 y {MAX_PAGE_SIZE}")
+
+        if pagination_input.page_number < 1:
+            raise ValueError("El número de página debe ser mayor a 0")
+
+        return self.patient_repository.search(filters, pagination_input)
+
+
+class FullTextSearchPatientsUseCase:
+    def __init__(self, patient_repository: PatientRepository):
+        self.patient_repository = patient_repository
+
+    def execute(self, query: str, pagination_input: PaginationInput) -> PaginatedResponse[Patient]:
+        if not query or len(query.strip()) < MIN_SEARCH_QUERY_LENGTH:
+            raise ValueError(f"La búsqueda debe tener al menos {MIN_SEARCH_QUERY_LENGTH} caracteres")
+
+        if not 1 <= pagination_input.page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"El tamaño de página debe estar entre 1 y {MAX_PAGE_SIZE}")
+
+        return self.patient_repository.full_text_search(query.strip(), pagination_input)
+
+
+class GetPatientTimelineUseCase:
+    def __init__(self, patient_repository: PatientRepository, timeline_repository: PatientTimelineRepository):
+        self.patient_repository = patient_repository
+        self.timeline_repository = timeline_repository
+
+    def execute(self, patient_id: int, pagination_input: PaginationInput) -> CursorPaginatedResponse[TimelineEntry]:
+        if not 1 <= pagination_input.page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"El tamaño de página debe estar entre 1 y {MAX_PAGE_SIZE}")
+
+        try:
+            self.patient_repository.get_by_id(patient_id)
+        except ValueError:
+            raise EntityNotFoundError('Patient', patient_id)
+
+        return self.timeline_repository.get_timeline(patient_id, pagination_input)
+
+
+class ImportPatientsUseCase:
+    """
+    Imports patients in chunks: each chunk is validated, checked for likely duplicates with one query and
+    written with one bulk insert, so memory stays bounded no matter how large the file is. Likely duplicates
+    are inserted and counted; the duplicate detection job queues them for review.
+    """
+    def __init__(self, patient_repository: PatientRepository):
+        self.patient_repository = patient_repository
+
+    def execute(self, rows: Iterable[Dict[str, Any]], chunk_size: int = IMPORT_CHUNK_SIZE) -> Dict[str, Any]:
+        summary = {'created': 0, 'likely_duplicates': 0, 'invalid': 0, 'errors': []}
+        numbered_rows = enumerate(rows, start=1)
+
+        while True:
+            chunk = list(islice(numbered_rows, chunk_size))
+            if not chunk:
+                return summary
+
+            patients = []
+            for row_number, row in chunk:
+                try:
+                    patients.append(self._to_patient(row))
+                except (KeyError, ValueError, TypeError) as e:
+                    summary['invalid'] += 1
+                    if len(summary['errors']) < MAX_REPORTED_IMPORT_ERRORS:
+                        summary['errors'].append({'row': row_number, 'error': str(e)})
+
+            created, likely_duplicates = self.patient_repository.bulk_create(patients)
+            summary['created'] += len(created)
+            summary['likely_duplicates'] += len(likely_duplicates)
+
+    def _to_patient(self, row: Dict[str, Any]) -> Patient:
+        name = (row.get('name') or '').strip()
+        if not name:
+            raise ValueError("El nombre es obligatorio")
+        if len(name) > 100:
+            raise ValueError("El nombre no puede superar los 100 caracteres")
+
+        is_active = row.get('is_active', True)
+        if isinstance(is_active, str):
+            is_active = is_active.strip().lower() not in ('false', '0', 'no', '')
+
+        return PatientMapper.dict_to_domain({
+            'name': name,
+            'description': row.get('description') or '',
+            'first_therapy': row.get('first_therapy') or None,
+            'last_therapy': row.get('last_therapy') or None,
+            'is_active': bool(is_active),
+        })
+
+
+class ExportPatientsUseCase:
+    def __init__(self, patient_repository: PatientRepository):
+        self.patient_repository = patient_repository
+
+    def execute(self) -> Iterator[Patient]:
+        return self.patient_repository.iter_all()
+
+
+class DetectDuplicatePatientsUseCase:
+    """
+    Finds likely duplicate patients without comparing every pair: each patient is indexed under its
+    blocking keys and only scored against the patients sharing a key. Patients are processed in id
+    batches; the incremental mode only visits those created or renamed since the last run.
+    """
+    def __init__(self, duplicate_repository: PatientDuplicateRepository):
+        self.duplicate_repository = duplicate_repository
+
+    def execute(
+        self,
+        full: bool = False,
+        batch_size: int = DEDUP_BATCH_SIZE,
+        threshold: float = DUPLICATE_SCORE_THRESHOLD,
+        max_block_size: int = MAX_BLOCK_SIZE,
+    ) -> Dict[str, int]:
+        if full:
+            self.duplicate_repository.clear_index()
+
+        summary = {'checked': 0, 'candidates': 0}
+        last_id = 0
+        while True:
+            batch = self.duplicate_repository.get_patients_to_check(last_id, batch_size, only_pending=not full)
+            if not batch:
+                return summary
+
+            keys_by_patient = {patient_id: blocking_keys(name_key) for patient_id, name_key in batch}
+            self.duplicate_repository.replace_blocking_keys(keys_by_patient)
+
+            members = self.duplicate_repository.get_block_members(set().union(*keys_by_patient.values()), max_block_size)
+
+            candidates = []
+            for patient_id, name_key in batch:
+                block = {member for key in keys_by_patient[patient_id] for member in members.get(key, ())}
+                candidates.extend(score_candidates(patient_id, name_key, block, threshold))
+
+            summary['candidates'] += self.duplicate_repository.save_candidates(candidates)
+            self.duplicate_repository.mark_checked([patient_id for patient_id, _ in batch])
+
+            summary['checked'] += len(batch)
+            last_id = batch[-1][0]
+
+
+class GetDuplicateCandidatesUseCase:
+    def __init__(self, duplicate_repository: PatientDuplicateRepository):
+        self.duplicate_repository = duplicate_repository
+
+    def execute(self, status: str, pagination_input: PaginationInput) -> PaginatedResponse[DuplicateCandidate]:
+        if status not in DUPLICATE_STATUSES:
+            raise ValueError(f"Estado no válido. Opciones válidas: {DUPLICATE_STATUSES}")
+        if not 1 <= pagination_input.page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"El tamaño de página debe estar entre 1 y {MAX_PAGE_SIZE}")
+
+        return self.duplicate_repository.get_candidates(status, pagination_input)
+
+
+class ReviewDuplicateCandidateUseCase:
+    def __init__(self, duplicate_repository: PatientDuplicateRepository):
+        self.duplicate_repository = duplicate_repository
+
+    def execute(self, candidate_id: int, status: str) -> DuplicateCandidate:
+        if status not in DUPLICATE_STATUSES:
+            raise ValueError(f"Estado no válido. Opciones válidas: {DUPLICATE_STATUSES}")
+
+        try:
+            return self.duplicate_repository.update_status(candidate_id, status)
+        except ValueError:
+            raise EntityNotFoundError('Duplicate candidate', candidate_id)
 
 
 class DeletePatientUseCase:    
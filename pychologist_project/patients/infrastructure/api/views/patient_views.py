@@ -1,20 +1,44 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAdminUser
+from django.http import StreamingHttpResponse
+from dataclasses import asdict
+from core.pagination.page_helper import get_pagination_data
+from core.permissions import IsPatientCareTeamOrAdmin, IsTherapistOrAdmin
 from core.api_response.response import DjangoResponseWrapper as ResponseWrapper
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 from ..serializers.serializers import PatientSerializer
 from ...repositories.django_patient_repository import DjangoPatientRepository
+from ...repositories.django_patient_timeline_repository import DjangoPatientTimelineRepository
+from ...repositories.django_patient_duplicate_repository import DjangoPatientDuplicateRepository
+from ...io.patient_files import (
+    read_patient_rows,
+    stream_patients_csv,
+    stream_patients_json,
+    FILE_FORMAT_CSV,
+    FILE_FORMATS,
+)
 from ....core.use_cases.patient_use_cases import (
     CreatePatientUseCase,
     UpdatePatientUseCase,
     GetPatientUseCase,
     SearchPatientsUseCase,
+    FullTextSearchPatientsUseCase,
+    GetPatientTimelineUseCase,
+    ImportPatientsUseCase,
+    ExportPatientsUseCase,
+    GetDuplicateCandidatesUseCase,
+    ReviewDuplicateCandidateUseCase,
     DeletePatientUseCase,
     DeactivatePatientUseCase,
     ActivatePatientUseCase,
     GetDeletedPatientsUseCase
 )
 
+PAGINATION_PARAMS = ('page', 'page_size', 'cursor')
+
+
 class PatientViewSet(viewsets.ViewSet):    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -23,6 +47,13 @@ class PatientViewSet(viewsets.ViewSet):
         self.update_patient_use_case = UpdatePatientUseCase(self.repository)
         self.get_patient_use_case = GetPatientUseCase(self.repository)
         self.search_patients_use_case = SearchPatientsUseCase(self.repository)
+        self.full_text_search_patients_use_case = FullTextSearchPatientsUseCase(self.repository)
+        self.get_patient_timeline_use_case = GetPatientTimelineUseCase(self.repository, DjangoPatientTimelineRepository())
+        self.import_patients_use_case = ImportPatientsUseCase(self.repository)
+        self.export_patients_use_case = ExportPatientsUseCase(self.repository)
+        self.duplicate_repository = DjangoPatientDuplicateRepository()
+        self.get_duplicate_candidates_use_case = GetDuplicateCandidatesUseCase(self.duplicate_repository)
+        self.review_duplicate_candidate_use_case = ReviewDuplicateCandidateUseCase(self.duplicate_repository)
         self.delete_patient_use_case = DeletePatientUseCase(self.repository)
         self.deactivate_patient_use_case = DeactivatePatientUseCase(self.repository)
         self.activate_patient_use_case = ActivatePatientUseCase(self.repository)
@@ -99,9 +130,12 @@ class PatientViewSet(viewsets.ViewSet):
 
     @extend_schema(
         summary="List patients",
-        description="Lists all patients with optional filters applied via query parameters.",
+        description="Lists patients (id, name and is_active) with optional filters applied via query parameters. "
+                    "Uses page/page_size by default; send `cursor` (empty for the first page) to page by cursor "
+                    "and follow `next_cursor` for the next one.",
         responses={
-            200: PatientSerializer(many=True),
+            200: OpenApiTypes.OBJECT,
+            400: OpenApiTypes.OBJECT,
         },
         parameters=[
             OpenApiParameter(
@@ -118,14 +152,244 @@ class PatientViewSet(viewsets.ViewSet):
                 description='Filter patients by active status',
                 required=False,
             ),
-            # ADD THE PARAMS
+            OpenApiParameter(
+                name='page',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Page number (offset pagination)',
+                required=False,
+            ),
+            OpenApiParameter(
+                name='page_size',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Number of patients per page (max 100)',
+                required=False,
+            ),
+            OpenApiParameter(
+                name='cursor',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Cursor returned as next_cursor by the previous page',
+                required=False,
+            ),
         ],
     )
     def list(self, request):
-        filters = request.query_params.dict()
-        patients = self.search_patients_use_case.execute(filters)
-        return ResponseWrapper.found([self._entity_to_dict(patient) for patient in patients], 'Patients')
+        filters = {
+            key: value for key, value in request.query_params.dict().items()
+            if key not in PAGINATION_PARAMS
+        }
+        page_input = get_pagination_data(request)
+
+        patients_page = self.search_patients_use_case.execute(filters, page_input)
+
+        return ResponseWrapper.found(asdict(patients_page), 'Patients')
     
+    @extend_schema(
+        summary="Search patients",
+        description="Full-text search over patient names and descriptions. Every word is matched as a prefix, "
+                    "ignoring case and accents; results are ordered by relevance and paginated. "
+                    "Therapists and admins only.",
+        responses={
+            200: PatientSerializer(many=True),
+            400: OpenApiTypes.OBJECT,
+        },
+        parameters=[
+            OpenApiParameter(
+                name='q',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Text to search (at least 2 characters)',
+                required=True,
+            ),
+            OpenApiParameter(
+                name='page',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Page number',
+                required=False,
+            ),
+            OpenApiParameter(
+                name='page_size',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Number of patients per page (max 100)',
+                required=False,
+            ),
+        ],
+    )
+    @action(detail=False, methods=['get'], permission_classes=[IsTherapistOrAdmin])
+    def search(self, request):
+        page_input = get_pagination_data(request)
+        paginated_patients = self.full_text_search_patients_use_case.execute(request.query_params.get('q', ''), page_input)
+
+        return ResponseWrapper.found({
+            'items': [self._entity_to_dict(patient) for patient in paginated_patients.items],
+            'metadata': asdict(paginated_patients.metadata),
+        }, 'Patients')
+
+    @extend_schema(
+        summary="Patient timeline",
+        description="Sessions and payments of the patient merged in time order, newest first. "
+                    "Paginated by cursor: follow `next_cursor` to load older events. "
+                    "Only the patient, a therapist who has treated them, or an admin can read it.",
+        responses={
+            200: OpenApiTypes.OBJECT,
+            404: OpenApiTypes.OBJECT,
+        },
+        parameters=[
+            OpenApiParameter(
+                name='pk',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.PATH,
+                description='ID of the patient',
+                required=True,
+            ),
+            OpenApiParameter(
+                name='cursor',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Cursor returned as next_cursor by the previous page',
+                required=False,
+            ),
+            OpenApiParameter(
+                name='page_size',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Number of events per page (max 100)',
+                required=False,
+            ),
+        ],
+    )
+    @action(detail=True, methods=['get'], permission_classes=[IsPatientCareTeamOrAdmin])
+    def timeline(self, request, pk=None):
+        page_input = get_pagination_data(request)
+        timeline_page = self.get_patient_timeline_use_case.execute(int(pk), page_input)
+
+        return ResponseWrapper.found(asdict(timeline_page), 'Patient Timeline', 'ID', pk)
+
+    @extend_schema(
+        summary="Import patients",
+        description="Creates patients in bulk from a CSV file (header: name, description, first_therapy, "
+                    "last_therapy, is_active) or a JSON file (array or JSON Lines). Every valid row is created; "
+                    "rows whose normalized name already exists are counted as likely duplicates and queued "
+                    "for duplicate review. Admin only.",
+        request={
+            'multipart/form-data': {
+                'type': 'object',
+                'properties': {
+                    'file': {'type': 'string', 'format': 'binary'},
+                    'file_format': {'type': 'string', 'enum': FILE_FORMATS},
+                },
+            },
+        },
+        responses={
+            201: OpenApiTypes.OBJECT,
+            400: OpenApiTypes.OBJECT,
+            401: OpenApiTypes.OBJECT,
+            403: OpenApiTypes.OBJECT,
+        },
+    )
+    @action(detail=False, methods=['post'], url_path='import', parser_classes=[MultiPartParser], permission_classes=[IsAdminUser])
+    def bulk_import(self, request):
+        uploaded_file = request.FILES.get('file')
+        if not uploaded_file:
+            return ResponseWrapper.bad_request(message="File is required")
+
+        file_format = request.data.get('file_format') or uploaded_file.name.rsplit('.', 1)[-1].lower()
+        if file_format not in FILE_FORMATS:
+            return ResponseWrapper.bad_request(message=f"Invalid format. Valid options: {FILE_FORMATS}")
+
+        summary = self.import_patients_use_case.execute(read_patient_rows(uploaded_file.file, file_format))
+
+        return ResponseWrapper.created(data=summary, entity='Patients')
+
+    @extend_schema(
+        summary="Export patients",
+        description="Streams every patient as CSV or JSON. Admin only.",
+        responses={
+            200: OpenApiTypes.BINARY,
+            401: OpenApiTypes.OBJECT,
+            403: OpenApiTypes.OBJECT,
+        },
+        parameters=[
+            OpenApiParameter(
+                name='file_format',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='csv (default) or json',
+                required=False,
+            ),
+        ],
+    )
+    @action(detail=False, methods=['get'], permission_classes=[IsAdminUser])
+    def export(self, request):
+        file_format = request.query_params.get('file_format', FILE_FORMAT_CSV)
+        if file_format not in FILE_FORMATS:
+            return ResponseWrapper.bad_request(message=f"Invalid format. Valid options: {FILE_FORMATS}")
+
+        patients = self.export_patients_use_case.execute()
+        if file_format == FILE_FORMAT_CSV:
+            response = StreamingHttpResponse(stream_patients_csv(patients), content_type='text/csv')
+        else:
+            response = StreamingHttpResponse(stream_patients_json(patients), content_type='application/json')
+
+        response['Content-Disposition'] = f'attachment; filename="patients.{file_format}"'
+        return response
+
+    @extend_schema(
+        summary="List duplicate candidates",
+        description="Pairs of patients that the duplicate detection job scored as likely the same person, "
+                    "highest score first. Admin only.",
+        responses={
+            200: OpenApiTypes.OBJECT,
+            400: OpenApiTypes.OBJECT,
+            401: OpenApiTypes.OBJECT,
+            403: OpenApiTypes.OBJECT,
+        },
+        parameters=[
+            OpenApiParameter(
+                name='status',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='PENDING (default), CONFIRMED or DISMISSED',
+                required=False,
+            ),
+        ],
+    )
+    @action(detail=False, methods=['get'], permission_classes=[IsAdminUser])
+    def duplicates(self, request):
+        page_input = get_pagination_data(request)
+        candidates_page = self.get_duplicate_candidates_use_case.execute(request.query_params.get('status', 'PENDING'), page_input)
+
+        return ResponseWrapper.found(asdict(candidates_page), 'Duplicate Candidates')
+
+    @extend_schema(
+        summary="Review a duplicate candidate",
+        description="Confirms or dismisses a pair of possible duplicate patients. Admin only.",
+        request={
+            'application/json': {
+                'type': 'object',
+                'properties': {
+                    'status': {'type': 'string', 'enum': ['CONFIRMED', 'DISMISSED', 'PENDING']},
+                },
+            },
+        },
+        responses={
+            200: OpenApiTypes.OBJECT,
+            400: OpenApiTypes.OBJECT,
+            401: OpenApiTypes.OBJECT,
+            403: OpenApiTypes.OBJECT,
+            404: OpenApiTypes.OBJECT,
+        },
+    )
+    @action(detail=False, methods=['patch'], url_path=r'duplicates/(?P<candidate_id>[0-9]+)', permission_classes=[IsAdminUser])
+    def review_duplicate(self, request, candidate_id=None):
+        candidate = self.review_duplicate_candidate_use_case.execute(int(candidate_id), request.data.get('status'))
+
+        return ResponseWrapper.updated(asdict(candidate), 'Duplicate Candidate')
+
     @extend_schema(
         summary="Soft delete a patient",
         description="Logically deletes a patient by setting the deleted_at field.",
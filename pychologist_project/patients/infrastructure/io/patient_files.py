@@ -0,0 +1,72 @@
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator
+from ...core.domain.entities.patient_entitiy import Patient
+
+FILE_FORMAT_CSV = 'csv'
+FILE_FORMAT_JSON = 'json'
+FILE_FORMATS = [FILE_FORMAT_CSV, FILE_FORMAT_JSON]
+
+EXPORT_FIELDS = ['id', 'name', 'description', 'first_therapy', 'last_therapy', 'is_active', 'created_at', 'user_id']
+
+
+def read_patient_rows(binary_file, file_format: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yields one dict per patient from an uploaded file.
+
+    CSV is read row by row. JSON accepts either JSON Lines (one object per line, streamed) or a single
+    array, which has to be parsed as a whole.
+    """
+    text_file = io.TextIOWrapper(binary_file, encoding='utf-8-sig', newline='')
+
+    if file_format == FILE_FORMAT_CSV:
+        yield from csv.DictReader(text_file)
+        return
+
+    if file_format != FILE_FORMAT_JSON:
+        raise ValueError(f"Formato no soportado. Opciones válidas: {FILE_FORMATS}")
+
+    first_line = text_file.readline()
+    if first_line.lstrip().startswith('['):
+        rows = json.loads(first_line + text_file.read())
+        if not isinstance(rows, list):
+            raise ValueError("El archivo JSON debe contener una lista de pacientes")
+        yield from rows
+        return
+
+    for line in _prepend(first_line, text_file):
+        if line.strip():
+            yield json.loads(line)
+
+
+def stream_patients_csv(patients: Iterable[Patient]) -> Iterator[str]:
+    buffer = _LineBuffer()
+    writer = csv.writer(buffer)
+    yield writer.writerow(EXPORT_FIELDS)
+    for patient in patients:
+        yield writer.writerow([_export_value(getattr(patient, field)) for field in EXPORT_FIELDS])
+
+
+def stream_patients_json(patients: Iterable[Patient]) -> Iterator[str]:
+    yield '['
+    separator = ''
+    for patient in patients:
+        yield separator + json.dumps({field: _export_value(getattr(patient, field)) for field in EXPORT_FIELDS})
+        separator = ','
+    yield ']'
+
+
+def _export_value(value):
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+def _prepend(first_line: str, lines: Iterable[str]) -> Iterator[str]:
+    yield first_line
+    yield from lines
+
+
+class _LineBuffer:
+    """csv.writer target that hands back each written row instead of storing it."""
+    def write(self, value: str) -> str:
+        return value
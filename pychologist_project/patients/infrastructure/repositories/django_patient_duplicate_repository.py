@@ -0,0 +1,119 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+from django.db import transaction
+from django.db.models import Count
+from ...core.domain.entities.duplicate_candidate import DuplicateCandidate
+from ...core.domain.repository.patient_duplicate_repository import PatientDuplicateRepository
+from ...models import Patient as PatientModel, PatientBlockingKey, PatientDuplicateCandidate
+from core.pagination.page_helper import PaginationHelper, PaginationInput, PaginatedResponse
+
+BULK_CREATE_BATCH_SIZE = 1000
+
+
+class DjangoPatientDuplicateRepository(PatientDuplicateRepository):
+    """Blocking index and candidate pairs stored in PatientBlockingKey and PatientDuplicateCandidate."""
+
+    def get_patients_to_check(self, after_id: int, limit: int, only_pending: bool) -> List[Tuple[int, str]]:
+        queryset = PatientModel.live.filter(id__gt=after_id)
+        if only_pending:
+            # Served by the partial patient_needs_dedup_idx, so it stays cheap when few patients changed
+            queryset = queryset.filter(needs_dedup=True)
+
+        return list(queryset.order_by('id').values_list('id', 'name_key')[:limit])
+
+    def replace_blocking_keys(self, keys_by_patient: Dict[int, Set[str]]) -> None:
+        with transaction.atomic():
+            PatientBlockingKey.objects.filter(patient_id__in=list(keys_by_patient)).delete()
+            PatientBlockingKey.objects.bulk_create(
+                [
+                    PatientBlockingKey(patient_id=patient_id, key=key)
+                    for patient_id, keys in keys_by_patient.items()
+                    for key in keys
+                ],
+                batch_size=BULK_CREATE_BATCH_SIZE,
+            )
+
+    def get_block_members(self, keys: Iterable[str], max_block_size: int) -> Dict[str, List[Tuple[int, str]]]:
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        # Very common names (a block bigger than max_block_size) are skipped instead of compared all-pairs
+        block_sizes = (
+            PatientBlockingKey.objects
+            .filter(key__in=keys)
+            .values('key')
+            .annotate(size=Count('patient_id'))
+        )
+        searchable_keys = [block['key'] for block in block_sizes if block['size'] <= max_block_size]
+
+        members = defaultdict(list)
+        rows = (
+            PatientBlockingKey.objects
+            .filter(key__in=searchable_keys, patient__deleted_at__isnull=True)
+            .values_list('key', 'patient_id', 'patient__name_key')
+        )
+        for key, patient_id, name_key in rows:
+            members[key].append((patient_id, name_key))
+        return members
+
+    def save_candidates(self, candidates: List[DuplicateCandidate]) -> int:
+        if not candidates:
+            return 0
+
+        pairs = {(candidate.patient_id, candidate.duplicate_id): candidate for candidate in candidates}
+        existing = set(
+            PatientDuplicateCandidate.objects
+            .filter(patient_id__in={patient_id for patient_id, _ in pairs})
+            .values_list('patient_id', 'duplicate_id')
+        )
+        new_pairs = [candidate for pair, candidate in pairs.items() if pair not in existing]
+
+        PatientDuplicateCandidate.objects.bulk_create(
+            [
+                PatientDuplicateCandidate(
+                    patient_id=candidate.patient_id,
+                    duplicate_id=candidate.duplicate_id,
+                    score=candidate.score,
+                    status=candidate.status,
+                )
+                for candidate in new_pairs
+            ],
+            batch_size=BULK_CREATE_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        return len(new_pairs)
+
+    def mark_checked(self, patient_ids: List[int]) -> None:
+        PatientModel.objects.filter(id__in=patient_ids).update(needs_dedup=False)
+
+    def clear_index(self) -> None:
+        PatientBlockingKey.objects.all().delete()
+
+    def get_candidates(self, status: str, pagination_input: PaginationInput) -> PaginatedResponse[DuplicateCandidate]:
+        queryset = (
+            PatientDuplicateCandidate.objects
+            .filter(status=status, patient__deleted_at__isnull=True, duplicate__deleted_at__isnull=True)
+            .order_by('-score', 'id')
+        )
+        return PaginationHelper.get_paginated_response(pagination_input, queryset, self._to_entity)
+
+    def update_status(self, candidate_id: int, status: str) -> DuplicateCandidate:
+        try:
+            model = PatientDuplicateCandidate.objects.get(id=candidate_id)
+        except PatientDuplicateCandidate.DoesNotExist:
+            raise ValueError(f"Duplicate candidate with ID {candidate_id} not found.")
+
+        model.status = status
+        model.save(update_fields=['status'])
+        return self._to_entity(model)
+
+    def _to_entity(self, model: PatientDuplicateCandidate) -> DuplicateCandidate:
+        return DuplicateCandidate(
+            id=model.id,
+            patient_id=model.patient_id,
+            duplicate_id=model.duplicate_id,
+            score=model.score,
+            status=model.status,
+            created_at=model.created_at,
+        )
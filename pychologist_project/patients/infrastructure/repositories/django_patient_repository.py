@@ -1,10 +1,26 @@
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Union, Tuple, Iterator, Iterable
 from datetime import datetime
-from django.db.models import Q
-from ...core.domain.entities.patient_entitiy import Patient as PatientEntity
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection, transaction
+from django.db.models import F, Case, When, Value, FloatField
+from django.db.models.functions import Coalesce, Greatest, Least
+from ...core.domain.entities.patient_entitiy import Patient as PatientEntity, PatientSummary
 from ...core.domain.repository.patient_repository import PatientRepository
-from ...models import Patient as PatientModel
+from ...core.mappers.payment_mappers import PatientMapper
+from ...models import Patient as PatientModel, normalize_search_text
 from core.cache.cache_manager import CacheManager
+from core.pagination.page_helper import (
+    PaginationHelper,
+    PaginationInput,
+    PaginatedResponse,
+    CursorPaginationHelper,
+    CursorPaginatedResponse
+)
+
+# Columns loaded for list views; the full patient is fetched through get_by_id
+SUMMARY_FIELDS = ('id', 'name', 'is_active')
+
+BULK_CREATE_BATCH_SIZE = 1000
 
 CACHE_PREFIX = 'patient_'
 
@@ -22,7 +38,7 @@ class DjangoPatientRepository(PatientRepository):
             return cached_patient
 
         try:
-            patient_model = PatientModel.objects.get(id=patient_id, deleted_at__isnull=True)
+            patient_model = PatientModel.live.get(id=patient_id)
             patient_entity = self._to_entity(patient_model)
 
             self.cache_manager.set(cache_key, patient_entity)
@@ -30,20 +46,38 @@ class DjangoPatientRepository(PatientRepository):
         except PatientModel.DoesNotExist:
             raise ValueError(f"Patient with ID {patient_id} not found.")
 
-    def search(self, filters: Optional[Dict[str, Any]] = None) -> List[PatientEntity]:
-        cache_key = self.cache_manager.generate_search_key(filters)
+    def get_many_by_ids(self, patient_ids: Iterable[int]) -> Dict[int, PatientEntity]:
+        return self.cache_manager.get_or_load_many(patient_ids, self._load_many)
+
+    def _load_many(self, patient_ids: List[int]) -> Dict[int, PatientEntity]:
+        patients = PatientModel.live.defer('search_document', 'search_vector').in_bulk(patient_ids)
+        return {patient_id: self._to_entity(patient) for patient_id, patient in patients.items()}
+
+    def search(self, filters: Optional[Dict[str, Any]], pagination_input: PaginationInput) -> Union[PaginatedResponse[PatientSummary], CursorPaginatedResponse[PatientSummary]]:
+        filters = filters or {}
+        cache_key = self.cache_manager.generate_versioned_search_key({
+            **filters,
+            "page_number": pagination_input.page_number,
+            "page_size": pagination_input.page_size,
+            "cursor": pagination_input.cursor,
+        })
+
+        cached_page = self.cache_manager.get(cache_key)
+        if cached_page is not None:
+            return cached_page
 
-        cached_patients = self.cache_manager.get(cache_key)
-        if cached_patients:
-            return cached_patients
+        queryset = self._apply_filters(PatientModel.live.all(), filters)
+        queryset = queryset.values(*SUMMARY_FIELDS)
 
-        queryset = PatientModel.objects.filter(deleted_at__isnull=True)
+        if pagination_input.uses_cursor:
+            page = CursorPaginationHelper.get_cursor_response(pagination_input, queryset, self._to_summary)
+        else:
+            page = PaginationHelper.get_paginated_response(pagination_input, queryset.order_by('id'), self._to_summary)
 
-        if not filters:
-            patients = [self._to_entity(model) for model in queryset]
-            self.cache_manager.set(cache_key, patients)
-            return patients
+        self.cache_manager.set(cache_key, page)
+        return page
 
+    def _apply_filters(self, queryset, filters: Dict[str, Any]):
         if 'name' in filters:
             queryset = queryset.filter(name__icontains=filters['name'])
 
@@ -51,7 +85,10 @@ class DjangoPatientRepository(PatientRepository):
             queryset = queryset.filter(description__icontains=filters['description'])
 
         if 'is_active' in filters:
-            queryset = queryset.filter(is_active=filters['is_active'])
+            is_active = filters['is_active']
+            if isinstance(is_active, str):
+                is_active = is_active.lower() in ('true', '1')
+            queryset = queryset.active() if is_active else queryset.filter(is_active=False)
 
         if 'created_after' in filters:
             try:
@@ -82,16 +119,50 @@ class DjangoPatientRepository(PatientRepository):
                 raise ValueError("The format of 'last_therapy_before' must be 'YYYY-MM-DD'.")
 
         if 'search_term' in filters:
-            search_term = filters['search_term']
-            queryset = queryset.filter(
-                Q(name__icontains=search_term) |
-                Q(description__icontains=search_term)
+            queryset = self._filter_by_text(queryset, filters['search_term'])
+
+        return queryset
+
+    def full_text_search(self, query: str, pagination_input: PaginationInput) -> PaginatedResponse[PatientEntity]:
+        terms = normalize_search_text(query).split()
+        if not terms:
+            return PaginatedResponse.empty(pagination_input.page_number, pagination_input.page_size)
+
+        queryset = self._filter_by_text(PatientModel.live.all(), query)
+
+        if connection.vendor == 'postgresql':
+            rank = SearchRank(F('search_vector'), self._build_search_query(terms))
+        else:
+            # Without a text index, rank names starting with the query above any other match
+            rank = Case(
+                When(search_document__startswith=f" {' '.join(terms)}", then=Value(1.0)),
+                default=Value(0.5),
+                output_field=FloatField(),
             )
 
-        patients = [self._to_entity(model) for model in queryset]
+        queryset = queryset.annotate(rank=rank).order_by('-rank', 'name', 'id')
 
-        self.cache_manager.set(cache_key, patients)
-        return patients
+        return PaginationHelper.get_paginated_response(pagination_input, queryset, self._to_entity)
+
+    def _filter_by_text(self, queryset, query: str):
+        """
+        Filters by every term of the query as a word prefix, ignoring case and accents.
+        On PostgreSQL it uses the GIN-indexed search_vector; elsewhere it falls back to search_document.
+        """
+        terms = normalize_search_text(query).split()
+        if not terms:
+            return queryset
+
+        if connection.vendor == 'postgresql':
+            return queryset.filter(search_vector=self._build_search_query(terms))
+
+        for term in terms:
+            queryset = queryset.filter(search_document__contains=f" {term}")
+        return queryset
+
+    def _build_search_query(self, terms: List[str]) -> SearchQuery:
+        # Terms are already reduced to [a-z0-9], so they are safe inside a raw tsquery
+        return SearchQuery(' & '.join(f"{term}:*" for term in terms), config='simple', search_type='raw')
 
     def create(self, patient: PatientEntity) -> PatientEntity:
         model = self._to_model(patient)
@@ -101,17 +172,24 @@ class DjangoPatientRepository(PatientRepository):
 
         cache_key = self.cache_manager.get_cache_key(entity.id)
         self.cache_manager.set(cache_key, entity)
+        self.cache_manager.bump_version()
 
         return entity
 
     def update(self, patient: PatientEntity) -> PatientEntity:
         model = self._to_model(patient)
+        # The entity carries no dedup state; start from the stored one so only a real rename re-flags the patient
+        stored = PatientModel.objects.filter(id=model.id).values('name_key', 'needs_dedup').first()
+        if stored:
+            model.name_key = stored['name_key']
+            model.needs_dedup = stored['needs_dedup']
         model.save()
 
         entity = self._to_entity(model)
 
         cache_key = self.cache_manager.get_cache_key(entity.id)
         self.cache_manager.set(cache_key, entity)
+        self.cache_manager.bump_version()
 
         return entity
 
@@ -136,6 +214,75 @@ class DjangoPatientRepository(PatientRepository):
         self.update(patient)
 
         
+    def record_completed_therapy(self, patient_ids: List[int], therapy_time: datetime) -> None:
+        if not patient_ids:
+            return
+
+        # One UPDATE for all patients; LEAST/GREATEST keep it correct when sessions complete out of order
+        PatientModel.objects.filter(id__in=patient_ids).update(
+            first_therapy=Least(Coalesce('first_therapy', Value(therapy_time)), Value(therapy_time)),
+            last_therapy=Greatest(Coalesce('last_therapy', Value(therapy_time)), Value(therapy_time)),
+        )
+
+        self.cache_manager.delete_multi([self.cache_manager.get_cache_key(patient_id) for patient_id in patient_ids])
+        # Cached list and search pages carry the dates too
+        self.cache_manager.bump_version()
+
+    def bulk_create(self, patients: List[PatientEntity]) -> Tuple[List[PatientEntity], List[PatientEntity]]:
+        # A shared name does not make two people the same patient, so every row is inserted; the ones whose
+        # normalized name is already taken are only reported. They keep needs_dedup set, so the duplicate
+        # detection job scores them and a reviewer decides.
+        models = []
+        for patient in patients:
+            model = self._to_model(patient)
+            model.refresh_search_fields()
+            models.append(model)
+
+        # One indexed lookup for the whole chunk instead of a query per patient
+        seen_keys = set(
+            PatientModel.live.filter(name_key__in={model.name_key for model in models}).values_list('name_key', flat=True)
+        )
+
+        with transaction.atomic():
+            created_models = PatientModel.objects.bulk_create(models, batch_size=BULK_CREATE_BATCH_SIZE)
+
+        created = []
+        likely_duplicates = []
+        for model in created_models:
+            entity = self._to_entity(model)
+            created.append(entity)
+            if model.name_key in seen_keys:
+                likely_duplicates.append(entity)
+            seen_keys.add(model.name_key)
+
+        if created:
+            self.cache_manager.set_multi({self.cache_manager.get_cache_key(entity.id): entity for entity in created})
+            self.cache_manager.bump_version()
+
+        return created, likely_duplicates
+
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[PatientEntity]:
+        queryset = PatientModel.live.defer('search_document', 'search_vector').order_by('id')
+
+        last_id = 0
+        while True:
+            batch = list(queryset.filter(id__gt=last_id)[:chunk_size])
+            if not batch:
+                return
+
+            for model in batch:
+                yield self._to_entity(model)
+            last_id = batch[-1].id
+
     def get_deleted(self) -> List[PatientEntity]:
         patients_deleted = PatientModel.objects.filter(deleted_at__isnull=False)
-        return [self._to_entity(patient) for patient in patients_deleted]
\ No newline at end of file
+        return [self._to_entity(patient) for patient in patients_deleted]
+
+    def _to_summary(self, row: Dict[str, Any]) -> PatientSummary:
+        return PatientSummary(id=row['id'], name=row['name'], is_active=row['is_active'])
+
+    def _to_entity(self, patient_model: PatientModel) -> PatientEntity:
+        return PatientMapper.model_to_entity(patient_model)
+
+    def _to_model(self, patient_entity: PatientEntity) -> PatientModel:
+        return PatientMapper.domain_to_model(patient_entity)
@@ -0,0 +1,125 @@
+import heapq
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Optional, Tuple
+from django.db.models import Q, QuerySet
+from django.db.models.functions import Coalesce
+from ...core.domain.entities.patient_timeline import (
+    TimelineEntry,
+    TIMELINE_SESSION,
+    TIMELINE_PAYMENT,
+    TIMELINE_KIND_RANK,
+)
+from ...core.domain.repository.patient_timeline_repository import PatientTimelineRepository
+from core.pagination.page_helper import PaginationInput, CursorPaginatedResponse, encode_cursor, decode_cursor
+from payments.models import Payment
+from therapy.models import TherapyParticipant
+
+Cursor = Tuple[datetime, int, int]
+
+
+class DjangoPatientTimelineRepository(PatientTimelineRepository):
+    """
+    Merges the patient's sessions and payments, newest first.
+
+    Each source is read with keyset pagination on its (patient, time) index, fetching at most one page
+    plus one row, and the two sorted streams are combined with a k-way merge. The cost of a page does
+    not depend on how long the patient's history is.
+    """
+    def get_timeline(self, patient_id: int, pagination_input: PaginationInput) -> CursorPaginatedResponse[TimelineEntry]:
+        cursor = self._decode(pagination_input.cursor)
+        limit = pagination_input.page_size + 1
+
+        streams = [
+            self._session_entries(patient_id, cursor, limit),
+            self._payment_entries(patient_id, cursor, limit),
+        ]
+        merged = heapq.merge(*streams, key=lambda entry: entry.sort_key, reverse=True)
+        entries = list(islice(merged, limit))
+
+        has_next = len(entries) > pagination_input.page_size
+        entries = entries[:pagination_input.page_size]
+
+        return CursorPaginatedResponse(
+            items=entries,
+            next_cursor=self._encode(entries[-1]) if has_next else None,
+            page_size=pagination_input.page_size,
+            has_next=has_next
+        )
+
+    def _session_entries(self, patient_id: int, cursor: Optional[Cursor], limit: int) -> Iterable[TimelineEntry]:
+        participants = (
+            TherapyParticipant.objects
+            .filter(patient_id=patient_id, therapy_session__deleted_at__isnull=True)
+            .select_related('therapy_session')
+        )
+        participants = self._after_cursor(
+            participants, cursor, TIMELINE_SESSION, 'session_start_time', 'therapy_session_id'
+        ).order_by('-session_start_time', '-therapy_session_id')
+
+        for participant in participants[:limit]:
+            session = participant.therapy_session
+            yield TimelineEntry(
+                kind=TIMELINE_SESSION,
+                id=session.id,
+                occurred_at=participant.session_start_time,
+                details={
+                    'therapist_id': session.therapist_id,
+                    'end_time': session.end_time,
+                    'status': session.status,
+                    'attended': participant.attended,
+                },
+            )
+
+    def _payment_entries(self, patient_id: int, cursor: Optional[Cursor], limit: int) -> Iterable[TimelineEntry]:
+        payments = (
+            Payment.live
+            .filter(patient_id=patient_id)
+            .annotate(occurred_at=Coalesce('paid_at', 'created_at'))
+            .only('id', 'amount', 'payment_type', 'receipt_number', 'paid_to_id', 'paid_at', 'created_at')
+        )
+        payments = self._after_cursor(payments, cursor, TIMELINE_PAYMENT, 'occurred_at', 'id').order_by('-occurred_at', '-id')
+
+        for payment in payments[:limit]:
+            yield TimelineEntry(
+                kind=TIMELINE_PAYMENT,
+                id=payment.id,
+                occurred_at=payment.occurred_at,
+                details={
+                    'amount': payment.amount,
+                    'payment_type': payment.payment_type,
+                    'receipt_number': payment.receipt_number,
+                    'paid_to_id': payment.paid_to_id,
+                },
+            )
+
+    def _after_cursor(self, queryset: QuerySet, cursor: Optional[Cursor], kind: str, time_field: str, id_field: str) -> QuerySet:
+        """Keeps the rows that come after the cursor in (time, kind rank, id) descending order."""
+        if cursor is None:
+            return queryset
+
+        cursor_time, cursor_rank, cursor_id = cursor
+        rank = TIMELINE_KIND_RANK[kind]
+
+        if rank < cursor_rank:
+            return queryset.filter(**{f'{time_field}__lte': cursor_time})
+        if rank > cursor_rank:
+            return queryset.filter(**{f'{time_field}__lt': cursor_time})
+
+        return queryset.filter(
+            Q(**{f'{time_field}__lt': cursor_time}) |
+            Q(**{time_field: cursor_time, f'{id_field}__lt': cursor_id})
+        )
+
+    def _encode(self, entry: TimelineEntry) -> str:
+        return encode_cursor(f"{entry.occurred_at.isoformat()}|{entry.kind}|{entry.id}")
+
+    def _decode(self, cursor: Optional[str]) -> Optional[Cursor]:
+        if not cursor:
+            return None
+
+        try:
+            occurred_at, kind, entry_id = decode_cursor(cursor).split('|')
+            return datetime.fromisoformat(occurred_at), TIMELINE_KIND_RANK[kind], int(entry_id)
+        except (KeyError, ValueError):
+            raise ValueError("Invalid cursor")
@@ -0,0 +1,75 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Exists, Max, Min, OuterRef, Q
+from core.cache.cache_manager import CacheManager
+from patients.infrastructure.repositories.django_patient_repository import CACHE_PREFIX
+from patients.models import Patient
+from therapy.models import TherapyParticipant
+
+
+class Command(BaseCommand):
+    help = 'Recalcula first_therapy/last_therapy de los pacientes a partir de sus sesiones completadas'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        cache_manager = CacheManager(CACHE_PREFIX)
+        completed_participants = TherapyParticipant.objects.filter(
+            therapy_session__status='COMPLETED',
+            therapy_session__deleted_at__isnull=True,
+        )
+
+        # One grouped query, read in keyset batches of patient_id so memory stays bounded
+        therapy_dates = (
+            completed_participants
+            .values('patient_id')
+            .annotate(first=Min('therapy_session__start_time'), last=Max('therapy_session__start_time'))
+            .order_by('patient_id')
+        )
+
+        updated = 0
+        last_patient_id = 0
+        while True:
+            batch = list(therapy_dates.filter(patient_id__gt=last_patient_id)[:batch_size])
+            if not batch:
+                break
+
+            patients = [
+                Patient(id=row['patient_id'], first_therapy=row['first'], last_therapy=row['last'])
+                for row in batch
+            ]
+            Patient.objects.bulk_update(patients, ['first_therapy', 'last_therapy'])
+            cache_manager.delete_multi([cache_manager.get_cache_key(patient.id) for patient in patients])
+
+            updated += len(patients)
+            last_patient_id = batch[-1]['patient_id']
+            self.stdout.write(f"Pacientes actualizados: {updated}")
+
+        # Patients whose completed sessions were all cancelled or deleted keep dates they no longer have
+        stale_patients = (
+            Patient.objects
+            .filter(Q(first_therapy__isnull=False) | Q(last_therapy__isnull=False))
+            .exclude(Exists(completed_participants.filter(patient_id=OuterRef('pk'))))
+            .order_by('id')
+            .values_list('id', flat=True)
+        )
+
+        cleared = 0
+        while True:
+            patient_ids = list(stale_patients[:batch_size])
+            if not patient_ids:
+                break
+
+            Patient.objects.filter(id__in=patient_ids).update(first_therapy=None, last_therapy=None)
+            cache_manager.delete_multi([cache_manager.get_cache_key(patient_id) for patient_id in patient_ids])
+
+            cleared += len(patient_ids)
+            self.stdout.write(f"Pacientes sin sesiones completadas: {cleared}")
+
+        cache_manager.bump_version()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Fechas de terapia recalculadas para {updated} pacientes y borradas para {cleared}"
+        ))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from patients.core.use_cases.patient_use_cases import (
+    DetectDuplicatePatientsUseCase,
+    DEDUP_BATCH_SIZE,
+    DUPLICATE_SCORE_THRESHOLD,
+    MAX_BLOCK_SIZE,
+)
+from patients.infrastructure.repositories.django_patient_duplicate_repository import DjangoPatientDuplicateRepository
+
+
+class Command(BaseCommand):
+    help = 'Detecta pacientes posiblemente duplicados; por defecto solo revisa los nuevos o renombrados'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Reconstruye el índice y revisa todos los pacientes')
+        parser.add_argument('--batch-size', type=int, default=DEDUP_BATCH_SIZE)
+        parser.add_argument('--threshold', type=float, default=DUPLICATE_SCORE_THRESHOLD)
+        parser.add_argument('--max-block-size', type=int, default=MAX_BLOCK_SIZE)
+
+    def handle(self, *args, **options):
+        use_case = DetectDuplicatePatientsUseCase(DjangoPatientDuplicateRepository())
+        summary = use_case.execute(
+            full=options['full'],
+            batch_size=options['batch_size'],
+            threshold=options['threshold'],
+            max_block_size=options['max_block_size'],
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Pacientes revisados: {summary['checked']}, nuevos posibles duplicados: {summary['candidates']}"
+        ))
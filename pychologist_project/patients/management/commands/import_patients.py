@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+from patients.core.use_cases.patient_use_cases import ImportPatientsUseCase
+from patients.infrastructure.io.patient_files import read_patient_rows, FILE_FORMATS
+from patients.infrastructure.repositories.django_patient_repository import DjangoPatientRepository
+
+
+class Command(BaseCommand):
+    help = 'Importa pacientes en bloque desde un archivo CSV o JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=FILE_FORMATS, help='Por defecto se deduce de la extensión')
+        parser.add_argument('--chunk-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        file_format = options['format'] or options['path'].rsplit('.', 1)[-1].lower()
+        if file_format not in FILE_FORMATS:
+            raise CommandError(f"Formato no soportado. Opciones válidas: {FILE_FORMATS}")
+
+        use_case = ImportPatientsUseCase(DjangoPatientRepository())
+        with open(options['path'], 'rb') as patients_file:
+            summary = use_case.execute(read_patient_rows(patients_file, file_format), options['chunk_size'])
+
+        for error in summary['errors']:
+            self.stderr.write(f"Fila {error['row']}: {error['error']}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Creados: {summary['created']}, posibles duplicados: {summary['likely_duplicates']}, inválidos: {summary['invalid']}"
+        ))
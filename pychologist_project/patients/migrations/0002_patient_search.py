@@ -0,0 +1,86 @@
+# Generated by Django 5.1.2 on 2026-10-19 11:11
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+BACKFILL_BATCH_SIZE = 2000
+
+SEARCH_INDEX_NAME = 'patients_patient_search_vector_gin'
+SEARCH_TRIGGER_NAME = 'patients_patient_search_vector_trigger'
+SEARCH_FUNCTION_NAME = 'patients_patient_search_vector_update'
+
+# Names weigh more than descriptions. The 'simple' configuration keeps whole words, so prefix
+# queries (term:*) behave the same for Spanish and non-Spanish names.
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', unaccent(coalesce({row}name, ''))), 'A') || "
+    "setweight(to_tsvector('simple', unaccent(coalesce({row}description, ''))), 'B')"
+)
+
+
+def backfill_search_document(apps, schema_editor):
+    from patients.models import build_search_document
+
+    Patient = apps.get_model('patients', 'Patient')
+    queryset = Patient.objects.only('id', 'name', 'description').order_by('id')
+
+    last_id = 0
+    while True:
+        batch = list(queryset.filter(id__gt=last_id)[:BACKFILL_BATCH_SIZE])
+        if not batch:
+            break
+
+        for patient in batch:
+            patient.search_document = build_search_document(patient.name, patient.description)
+        Patient.objects.bulk_update(batch, ['search_document'])
+        last_id = batch[-1].id
+
+
+def create_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+    schema_editor.execute(
+        f'CREATE OR REPLACE FUNCTION {SEARCH_FUNCTION_NAME}() RETURNS trigger AS $$ '
+        f'BEGIN NEW.search_vector := {SEARCH_VECTOR_SQL.format(row="NEW.")}; RETURN NEW; END '
+        '$$ LANGUAGE plpgsql'
+    )
+    schema_editor.execute(
+        f'CREATE TRIGGER {SEARCH_TRIGGER_NAME} BEFORE INSERT OR UPDATE OF name, description '
+        f'ON patients_patient FOR EACH ROW EXECUTE FUNCTION {SEARCH_FUNCTION_NAME}()'
+    )
+    schema_editor.execute(f'UPDATE patients_patient SET search_vector = {SEARCH_VECTOR_SQL.format(row="")}')
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {SEARCH_INDEX_NAME} ON patients_patient USING gin (search_vector)'
+    )
+
+
+def drop_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(f'DROP INDEX IF EXISTS {SEARCH_INDEX_NAME}')
+    schema_editor.execute(f'DROP TRIGGER IF EXISTS {SEARCH_TRIGGER_NAME} ON patients_patient')
+    schema_editor.execute(f'DROP FUNCTION IF EXISTS {SEARCH_FUNCTION_NAME}()')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='patient',
+            name='search_document',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='patient',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_search_document, migrations.RunPython.noop),
+        migrations.RunPython(create_search_vector, drop_search_vector),
+    ]
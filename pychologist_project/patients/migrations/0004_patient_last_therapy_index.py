@@ -0,0 +1,19 @@
+# Generated by Django 5.1.2 on 2026-10-19 11:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0003_live_partial_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patient',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['last_therapy'], name='patient_live_last_therapy_idx'),
+        ),
+    ]
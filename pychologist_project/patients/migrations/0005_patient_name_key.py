@@ -0,0 +1,39 @@
+# Generated by Django 5.1.2 on 2026-10-19 11:18
+
+from django.db import migrations, models
+
+BACKFILL_BATCH_SIZE = 2000
+
+
+def backfill_name_key(apps, schema_editor):
+    from patients.models import normalize_search_text
+
+    Patient = apps.get_model('patients', 'Patient')
+    queryset = Patient.objects.only('id', 'name').order_by('id')
+
+    last_id = 0
+    while True:
+        batch = list(queryset.filter(id__gt=last_id)[:BACKFILL_BATCH_SIZE])
+        if not batch:
+            break
+
+        for patient in batch:
+            patient.name_key = normalize_search_text(patient.name)[:100]
+        Patient.objects.bulk_update(batch, ['name_key'])
+        last_id = batch[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0004_patient_last_therapy_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='patient',
+            name='name_key',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=100),
+        ),
+        migrations.RunPython(backfill_name_key, migrations.RunPython.noop),
+    ]
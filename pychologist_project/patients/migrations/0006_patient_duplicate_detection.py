@@ -0,0 +1,72 @@
+# Generated by Django 5.1.2 on 2026-10-19 11:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0005_patient_name_key'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PatientBlockingKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=32)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PatientDuplicateCandidate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('CONFIRMED', 'Confirmed'), ('DISMISSED', 'Dismissed')], default='PENDING', max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='patient',
+            name='needs_dedup',
+            field=models.BooleanField(default=True, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='patient',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('needs_dedup', True)), fields=['id'], name='patient_needs_dedup_idx'),
+        ),
+        migrations.AddField(
+            model_name='patientblockingkey',
+            name='patient',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='blocking_keys', to='patients.patient'),
+        ),
+        migrations.AddField(
+            model_name='patientduplicatecandidate',
+            name='duplicate',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='patients.patient'),
+        ),
+        migrations.AddField(
+            model_name='patientduplicatecandidate',
+            name='patient',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='duplicate_candidates', to='patients.patient'),
+        ),
+        migrations.AddIndex(
+            model_name='patientblockingkey',
+            index=models.Index(fields=['key', 'patient'], name='blocking_key_patient_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='patientblockingkey',
+            constraint=models.UniqueConstraint(fields=('patient', 'key'), name='unique_patient_blocking_key'),
+        ),
+        migrations.AddIndex(
+            model_name='patientduplicatecandidate',
+            index=models.Index(condition=models.Q(('status', 'PENDING')), fields=['-score'], name='duplicate_pending_score_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='patientduplicatecandidate',
+            constraint=models.UniqueConstraint(fields=('patient', 'duplicate'), name='unique_duplicate_pair'),
+        ),
+    ]
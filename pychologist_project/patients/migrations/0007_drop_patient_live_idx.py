@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-19 12:04
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0006_patient_duplicate_detection'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='patient',
+            name='patient_live_idx',
+        ),
+    ]
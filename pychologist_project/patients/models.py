@@ -1,5 +1,28 @@
+import re
+import unicodedata
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
+from core.managers.live_manager import LiveManager
+
+SEARCH_TEXT_STRIP = re.compile(r'[^0-9a-z]+')
+
+
+def normalize_search_text(value):
+    """
+    Normaliza texto para búsquedas: minúsculas, sin acentos y solo letras y números separados por espacios.
+    """
+    if not value:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', str(value).lower())
+    without_accents = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return SEARCH_TEXT_STRIP.sub(' ', without_accents).strip()
+
+
+def build_search_document(name, description):
+    # Leading space lets the portable fallback match word prefixes with a plain LIKE '% term%'
+    return f" {normalize_search_text(name)} {normalize_search_text(description)}".rstrip()
+
 
 class Patient(models.Model):
     user = models.OneToOneField('users.User', on_delete=models.CASCADE, related_name='patient_profile', null=True)
@@ -13,6 +36,53 @@ class Patient(models.Model):
     deleted_at = models.DateTimeField(null=True, blank=True)
     is_active = models.BooleanField(default=True)
 
+    # Normalized name, used to detect duplicate patients with an indexed equality lookup
+    name_key = models.CharField(max_length=100, blank=True, default='', db_index=True, editable=False)
+    # Set when the name changes; the incremental duplicate detection job only checks these patients
+    needs_dedup = models.BooleanField(default=True, editable=False)
+    # Normalized name + description, used for searching on backends without full-text search
+    search_document = models.TextField(blank=True, default='', editable=False)
+    # Maintained by a database trigger on PostgreSQL (see migration 0002), GIN indexed
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = models.Manager()
+    live = LiveManager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['id'],
+                name='patient_live_active_idx',
+                condition=models.Q(deleted_at__isnull=True, is_active=True),
+            ),
+            # Retention and follow-up reports ("not seen since ...") are range scans on last_therapy
+            models.Index(
+                fields=['last_therapy'],
+                name='patient_live_last_therapy_idx',
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=['id'],
+                name='patient_needs_dedup_idx',
+                condition=models.Q(deleted_at__isnull=True, needs_dedup=True),
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.refresh_search_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'name', 'description'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'name_key', 'needs_dedup', 'search_document'}
+        super().save(*args, **kwargs)
+
+    def refresh_search_fields(self):
+        """Recomputes the derived search columns; call it before bulk_create, which skips save()."""
+        name_key = normalize_search_text(self.name)[:100]
+        if name_key != self.name_key:
+            self.name_key = name_key
+            self.needs_dedup = True
+        self.search_document = build_search_document(self.name, self.description)
+
     def set_as_deleted(self):
         if self.deleted_at != None:
             raise ValueError("Patient Already Deleted")
@@ -31,4 +101,41 @@ class Patient(models.Model):
         return self.name
 
 
+class PatientBlockingKey(models.Model):
+    """
+    Blocking index for duplicate detection: a patient is only compared with the patients that share
+    one of its keys (see duplicate_candidate.blocking_keys), never with the whole table.
+    """
+    patient = models.ForeignKey(Patient, on_delete=models.CASCADE, related_name='blocking_keys')
+    key = models.CharField(max_length=32)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['patient', 'key'], name='unique_patient_blocking_key'),
+        ]
+        indexes = [
+            models.Index(fields=['key', 'patient'], name='blocking_key_patient_idx'),
+        ]
+
+
+class PatientDuplicateCandidate(models.Model):
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('CONFIRMED', 'Confirmed'),
+        ('DISMISSED', 'Dismissed'),
+    ]
+
+    # Stored once per pair, lowest id in patient
+    patient = models.ForeignKey(Patient, on_delete=models.CASCADE, related_name='duplicate_candidates')
+    duplicate = models.ForeignKey(Patient, on_delete=models.CASCADE, related_name='+')
+    score = models.FloatField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['patient', 'duplicate'], name='unique_duplicate_pair'),
+        ]
+        indexes = [
+            models.Index(fields=['-score'], name='duplicate_pending_score_idx', condition=models.Q(status='PENDING')),
+        ]
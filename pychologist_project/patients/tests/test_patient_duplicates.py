@@ -0,0 +1,120 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import AccessToken
+from ..core.domain.entities.duplicate_candidate import blocking_keys, name_similarity, phonetic_code
+from ..core.use_cases.patient_use_cases import DetectDuplicatePatientsUseCase
+from ..infrastructure.repositories.django_patient_duplicate_repository import DjangoPatientDuplicateRepository
+from ..infrastructure.repositories.django_patient_repository import DjangoPatientRepository
+from ..models import Patient, PatientDuplicateCandidate
+
+
+class DuplicateMatchingTest(TestCase):
+    def test_spelling_variants_share_phonetic_code_and_blocking_keys(self):
+        self.assertEqual(phonetic_code('gonzalez'), phonetic_code('gonsales'))
+        self.assertEqual(phonetic_code('jimenez'), phonetic_code('gimenez'))
+        self.assertEqual(blocking_keys('luis gomez perez'), blocking_keys('perez gomes luis'))
+
+    def test_similarity_ignores_word_order(self):
+        self.assertGreaterEqual(name_similarity('luis gomez', 'gomes luis'), 0.7)
+        self.assertLess(name_similarity('luis gomez', 'luis perez'), 0.7)
+
+
+class DetectDuplicatePatientsTest(TestCase):
+    def setUp(self):
+        self.use_case = DetectDuplicatePatientsUseCase(DjangoPatientDuplicateRepository())
+        self.original = Patient.objects.create(name="Carlos Jiménez Ruiz")
+        self.variant = Patient.objects.create(name="Karlos Gimenez Ruiz")
+        Patient.objects.create(name="Lucía Fernández")
+        Patient.objects.create(name="Carlos Jiménez", deleted_at="2024-01-01T00:00:00Z")
+
+    def _pairs(self):
+        return set(PatientDuplicateCandidate.objects.values_list('patient_id', 'duplicate_id'))
+
+    def test_full_run_finds_spelling_variants_once(self):
+        # Act
+        summary = self.use_case.execute(full=True, batch_size=1)
+
+        # Assert
+        self.assertEqual(summary, {'checked': 3, 'candidates': 1})
+        self.assertEqual(self._pairs(), {(self.original.id, self.variant.id)})
+
+    def test_incremental_run_only_checks_new_or_renamed_patients(self):
+        # Arrange
+        self.use_case.execute()
+        new_patient = Patient.objects.create(name="Lucia Hernandes")
+        renamed = Patient.objects.get(name="Lucía Fernández")
+        renamed.name = "Lucía Hernández"
+        renamed.save()
+
+        # Act
+        summary = self.use_case.execute()
+
+        # Assert
+        self.assertEqual(summary, {'checked': 2, 'candidates': 1})
+        self.assertIn((renamed.id, new_patient.id), self._pairs())
+        self.assertEqual(self.use_case.execute(), {'checked': 0, 'candidates': 0})
+
+    def test_oversized_blocks_are_not_compared(self):
+        # Act
+        summary = self.use_case.execute(full=True, max_block_size=1)
+
+        # Assert
+        self.assertEqual(summary['candidates'], 0)
+
+    def test_list_and_review_endpoints(self):
+        # Arrange
+        self.use_case.execute()
+        candidate = PatientDuplicateCandidate.objects.get()
+        admin_user = get_user_model().objects.create_superuser(email='admin@example.com', password='adminpass')
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(admin_user)}')
+
+        # Act
+        list_response = client.get('/patients/duplicates/')
+        review_response = client.patch(f'/patients/duplicates/{candidate.id}/', {'status': 'DISMISSED'}, format='json')
+
+        # Assert
+        self.assertEqual(list_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list_response.data['data']['items'][0]['duplicate_id'], self.variant.id)
+        self.assertEqual(review_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(PatientDuplicateCandidate.objects.get().status, 'DISMISSED')
+        self.assertEqual(client.get('/patients/duplicates/').data['data']['items'], [])
+
+    def test_duplicate_endpoints_are_admin_only(self):
+        # Arrange
+        self.use_case.execute()
+        candidate = PatientDuplicateCandidate.objects.get()
+        user = get_user_model().objects.create_user(email='user@example.com', password='userpass')
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+
+        # Act
+        anonymous_response = APIClient().get('/patients/duplicates/')
+        list_response = client.get('/patients/duplicates/')
+        review_response = client.patch(f'/patients/duplicates/{candidate.id}/', {'status': 'DISMISSED'}, format='json')
+
+        # Assert
+        self.assertEqual(anonymous_response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(list_response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(review_response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(PatientDuplicateCandidate.objects.get().status, 'PENDING')
+
+    def test_repository_updates_only_flag_real_renames(self):
+        # Arrange
+        self.use_case.execute()
+        repository = DjangoPatientRepository()
+
+        # Act
+        repository.deactivate(self.original.id)
+        patient = repository.get_by_id(self.variant.id)
+        patient.name = "Karlos Gimenez Ruíz"
+        repository.update(patient)
+
+        # Assert
+        self.assertFalse(Patient.objects.get(id=self.original.id).needs_dedup)
+        self.assertFalse(Patient.objects.get(id=self.variant.id).needs_dedup)
+        patient.name = "Karla Gimenez Ruiz"
+        repository.update(patient)
+        self.assertTrue(Patient.objects.get(id=self.variant.id).needs_dedup)
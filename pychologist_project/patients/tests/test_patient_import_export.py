@@ -0,0 +1,109 @@
+import io
+import json
+from django.test import TestCase
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework.test import APIClient
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import AccessToken
+from ..core.use_cases.patient_use_cases import ImportPatientsUseCase
+from ..infrastructure.io.patient_files import read_patient_rows
+from ..infrastructure.repositories.django_patient_repository import DjangoPatientRepository
+from ..models import Patient
+
+
+class PatientImportExportTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.admin_user = User.objects.create_superuser(email='admin@example.com', password='adminpass')
+        cls.regular_user = User.objects.create_user(email='user@example.com', password='userpass')
+
+    def _client(self, user=None):
+        client = APIClient()
+        if user:
+            client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        return client
+
+    def setUp(self):
+        cache.clear()
+        self.repository = DjangoPatientRepository()
+        self.use_case = ImportPatientsUseCase(self.repository)
+        Patient.objects.create(name="José Martínez")
+
+    def test_import_keeps_same_name_patients_and_reports_them(self):
+        # Arrange
+        csv_file = io.BytesIO(
+            "name,description,is_active\n"
+            "Ana Torres,Primera consulta,true\n"
+            "JOSE MARTINEZ,,true\n"
+            "ana  tórres,,false\n"
+            ",Sin nombre,true\n"
+            "Pedro Lima,,false\n".encode('utf-8')
+        )
+
+        # Act
+        summary = self.use_case.execute(read_patient_rows(csv_file, 'csv'), chunk_size=2)
+
+        # Assert
+        self.assertEqual((summary['created'], summary['likely_duplicates'], summary['invalid']), (4, 2, 1))
+        self.assertEqual(Patient.objects.filter(name_key="ana torres").count(), 2)
+        self.assertTrue(Patient.objects.get(name="JOSE MARTINEZ").needs_dedup)
+        self.assertEqual(summary['errors'][0]['row'], 4)
+        self.assertFalse(Patient.objects.get(name="Pedro Lima").is_active)
+        self.assertEqual(Patient.objects.get(name="Ana Torres").name_key, "ana torres")
+
+    def test_import_caches_created_patients(self):
+        # Arrange
+        json_lines = io.BytesIO(b'{"name": "Laura Vidal"}\n{"name": "Carlos Soto"}\n')
+
+        # Act
+        self.use_case.execute(read_patient_rows(json_lines, 'json'))
+
+        # Assert
+        patient_id = Patient.objects.get(name="Laura Vidal").id
+        with self.assertNumQueries(0):
+            self.assertEqual(self.repository.get_by_id(patient_id).name, "Laura Vidal")
+
+    def test_import_and_export_endpoints(self):
+        # Arrange
+        upload = SimpleUploadedFile('patients.json', json.dumps([{"name": "Eva Ríos"}]).encode('utf-8'))
+
+        # Act
+        client = self._client(self.admin_user)
+        import_response = client.post('/patients/import/', {'file': upload}, format='multipart')
+        export_response = client.get('/patients/export/', {'file_format': 'json'})
+        exported = json.loads(b''.join(export_response.streaming_content))
+
+        # Assert
+        self.assertEqual(import_response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(import_response.data['data']['created'], 1)
+        self.assertEqual([patient['name'] for patient in exported], ["José Martínez", "Eva Ríos"])
+
+    def test_import_and_export_require_authentication(self):
+        # Arrange
+        upload = SimpleUploadedFile('patients.json', json.dumps([{"name": "Eva Ríos"}]).encode('utf-8'))
+
+        # Act
+        import_response = self._client().post('/patients/import/', {'file': upload}, format='multipart')
+        export_response = self._client().get('/patients/export/')
+
+        # Assert
+        self.assertEqual(import_response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(export_response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertFalse(Patient.objects.filter(name="Eva Ríos").exists())
+
+    def test_import_and_export_are_admin_only(self):
+        # Arrange
+        upload = SimpleUploadedFile('patients.json', json.dumps([{"name": "Eva Ríos"}]).encode('utf-8'))
+        client = self._client(self.regular_user)
+
+        # Act
+        import_response = client.post('/patients/import/', {'file': upload}, format='multipart')
+        export_response = client.get('/patients/export/')
+
+        # Assert
+        self.assertEqual(import_response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(export_response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Patient.objects.filter(name="Eva Ríos").exists())
@@ -0,0 +1,153 @@
+from django.test import TestCase
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from ..core.domain.entities.patient_entitiy import Patient as PatientEntity, PatientSummary
+from ..infrastructure.repositories.django_patient_repository import DjangoPatientRepository
+from ..models import Patient, normalize_search_text
+from core.pagination.page_helper import PaginationInput
+from users.models import User
+
+
+class PatientFullTextSearchTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.jose = Patient.objects.create(name="José Martínez", description="Ansiedad generalizada")
+        cls.maria = Patient.objects.create(name="María Pérez", description="Terapia de pareja con José")
+        cls.joaquin = Patient.objects.create(name="Joaquín Núñez", description="Duelo")
+        cls.deleted = Patient.objects.create(name="José Eliminado")
+        Patient.objects.filter(id=cls.deleted.id).update(deleted_at=cls.deleted.created_at)
+
+    def setUp(self):
+        cache.clear()
+        self.repository = DjangoPatientRepository()
+
+    def _search(self, query, page_number=1, page_size=10):
+        return self.repository.full_text_search(query, PaginationInput(page_number, page_size))
+
+    def test_normalize_search_text_strips_accents_and_symbols(self):
+        self.assertEqual(normalize_search_text("  Núñez-Pérez, JOSÉ "), "nunez perez jose")
+
+    def test_search_is_accent_insensitive(self):
+        # Act
+        result = self._search("jose martinez")
+
+        # Assert
+        self.assertEqual([patient.id for patient in result.items], [self.jose.id])
+
+    def test_search_matches_word_prefixes(self):
+        # Act
+        result = self._search("Jo")
+
+        # Assert
+        self.assertEqual(
+            {patient.id for patient in result.items},
+            {self.jose.id, self.maria.id, self.joaquin.id}
+        )
+
+    def test_name_matches_rank_before_description_matches(self):
+        # Act
+        result = self._search("josé")
+
+        # Assert
+        self.assertEqual([patient.id for patient in result.items], [self.jose.id, self.maria.id])
+
+    def test_search_is_paginated(self):
+        # Act
+        result = self._search("jo", page_number=2, page_size=2)
+
+        # Assert
+        self.assertEqual(len(result.items), 1)
+        self.assertEqual(result.metadata.total_items, 3)
+        self.assertTrue(result.metadata.has_previous)
+
+    def test_search_document_follows_name_changes(self):
+        # Arrange
+        self.joaquin.name = "Ramón Núñez"
+        self.joaquin.save(update_fields=['name'])
+
+        # Act
+        result = self._search("ramon")
+
+        # Assert
+        self.assertEqual([patient.id for patient in result.items], [self.joaquin.id])
+
+    def test_search_endpoint_requires_a_therapist_or_admin(self):
+        # Arrange
+        therapist_user = User.objects.create_user(email="ana@example.com", password="secret123", role='THERAPIST')
+        patient_user = User.objects.create_user(email="luis@example.com", password="secret123", role='PATIENT')
+        client = APIClient()
+
+        # Act
+        anonymous_response = client.get('/patients/search/', {'q': 'jose'})
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(patient_user)}')
+        patient_response = client.get('/patients/search/', {'q': 'jose'})
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(therapist_user)}')
+        therapist_response = client.get('/patients/search/', {'q': 'jose'})
+        oversized_response = client.get('/patients/search/', {'q': 'jose', 'page_size': 1000})
+
+        # Assert
+        self.assertEqual(anonymous_response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(patient_response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(therapist_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(therapist_response.data['data']['metadata']['total_items'], 2)
+        self.assertEqual(oversized_response.data['status_code'], 400)
+
+
+class PatientPaginatedSearchTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.patients = [Patient.objects.create(name=f"Paciente {index}", description="x" * 500) for index in range(5)]
+
+    def setUp(self):
+        cache.clear()
+        self.repository = DjangoPatientRepository()
+
+    def test_offset_page_returns_summaries(self):
+        # Act
+        page = self.repository.search({}, PaginationInput(page_number=2, page_size=2))
+
+        # Assert
+        self.assertEqual([patient.id for patient in page.items], [self.patients[2].id, self.patients[3].id])
+        self.assertEqual(page.metadata.total_items, 5)
+        self.assertIsInstance(page.items[0], PatientSummary)
+        self.assertFalse(hasattr(page.items[0], 'description'))
+
+    def test_cursor_pages_cover_all_patients(self):
+        # Act
+        seen = []
+        cursor = ''
+        while cursor is not None:
+            page = self.repository.search({}, PaginationInput(page_size=2, cursor=cursor))
+            seen.extend(patient.id for patient in page.items)
+            cursor = page.next_cursor
+
+        # Assert
+        self.assertEqual(seen, [patient.id for patient in self.patients])
+
+    def test_pages_are_cached_until_a_patient_changes(self):
+        # Arrange
+        page_input = PaginationInput(page_number=1, page_size=10)
+        self.repository.search({}, page_input)
+
+        # Act
+        with self.assertNumQueries(0):
+            cached_page = self.repository.search({}, page_input)
+
+        self.repository.create(PatientEntity(name="Nuevo Paciente"))
+        refreshed_page = self.repository.search({}, page_input)
+
+        # Assert
+        self.assertEqual(cached_page.metadata.total_items, 5)
+        self.assertEqual(refreshed_page.metadata.total_items, 6)
+
+    def test_list_endpoint_filters_and_paginates(self):
+        # Act
+        response = APIClient().get('/patients/', {'is_active': 'true', 'page_size': 3, 'cursor': ''})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']['items']), 3)
+        self.assertTrue(response.data['data']['has_next'])
+        self.assertEqual(set(response.data['data']['items'][0]), {'id', 'name', 'is_active'})
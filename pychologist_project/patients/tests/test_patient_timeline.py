@@ -0,0 +1,111 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from payments.models import Payment
+from therapists.models import Therapist
+from therapy.models import TherapySession
+from users.models import User
+from ..infrastructure.repositories.django_patient_timeline_repository import DjangoPatientTimelineRepository
+from ..models import Patient
+from core.pagination.page_helper import PaginationInput
+
+
+class PatientTimelineTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.therapist_user = User.objects.create_user(email="ana@example.com", password="secret123", role='THERAPIST')
+        cls.therapist = Therapist.objects.create(user=cls.therapist_user, name="Ana", license_number="LIC-T", specialization="Clínica")
+        cls.patient_user = User.objects.create_user(email="luis@example.com", password="secret123", role='PATIENT')
+        cls.patient = Patient.objects.create(user=cls.patient_user, name="Luis Gómez")
+        cls.other_patient = Patient.objects.create(name="Marta Ruiz")
+        now = timezone.now().replace(microsecond=0)
+
+        cls.sessions = [cls._create_session(now - timedelta(days=days)) for days in (1, 5, 9)]
+        cls.payments = [
+            Payment.objects.create(patient=cls.patient, amount=100, payment_type='CASH', paid_at=now - timedelta(days=days))
+            for days in (3, 5, 7)
+        ]
+        Payment.objects.create(patient=cls.patient, amount=100, payment_type='CASH', paid_at=now, deleted_at=now)
+        Payment.objects.create(patient=cls.other_patient, amount=100, payment_type='CASH', paid_at=now)
+
+    @classmethod
+    def _create_session(cls, start_time):
+        session = TherapySession.objects.create(
+            therapist=cls.therapist,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=1),
+            status='COMPLETED',
+        )
+        session.patients.set([cls.patient])
+        return session
+
+    def setUp(self):
+        cache.clear()
+        self.repository = DjangoPatientTimelineRepository()
+
+    def _read_all(self, page_size):
+        entries = []
+        cursor = ''
+        while cursor is not None:
+            page = self.repository.get_timeline(self.patient.id, PaginationInput(page_size=page_size, cursor=cursor))
+            entries.extend((entry.kind, entry.id) for entry in page.items)
+            cursor = page.next_cursor
+        return entries
+
+    def test_pages_merge_sessions_and_payments_newest_first(self):
+        # Arrange
+        expected = [
+            ('session', self.sessions[0].id),
+            ('payment', self.payments[0].id),
+            ('session', self.sessions[1].id),
+            ('payment', self.payments[1].id),
+            ('payment', self.payments[2].id),
+            ('session', self.sessions[2].id),
+        ]
+
+        # Act / Assert: page size 3 puts a page boundary between two events at the same instant
+        for page_size in (2, 3, 10):
+            self.assertEqual(self._read_all(page_size), expected)
+
+    def _client(self, user=None):
+        client = APIClient()
+        if user:
+            client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        return client
+
+    def test_timeline_endpoint(self):
+        # Act
+        response = self._client(self.therapist_user).get(f'/patients/{self.patient.id}/timeline/', {'page_size': 4})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']['items']), 4)
+        self.assertTrue(response.data['data']['has_next'])
+        self.assertEqual(response.data['data']['items'][1]['details']['payment_type'], 'CASH')
+
+    def test_timeline_is_limited_to_the_patient_their_therapists_and_admins(self):
+        # Arrange
+        other_user = User.objects.create_user(email="eva@example.com", password="secret123", role='THERAPIST')
+        Therapist.objects.create(user=other_user, name="Eva", license_number="LIC-T2", specialization="Infantil")
+        other_patient_user = User.objects.create_user(email="marta@example.com", password="secret123", role='PATIENT')
+        Patient.objects.filter(pk=self.other_patient.pk).update(user=other_patient_user)
+        admin_user = User.objects.create_superuser(email="admin@example.com", password="adminpass")
+        url = f'/patients/{self.patient.id}/timeline/'
+
+        # Act
+        anonymous_response = self._client().get(url)
+        other_therapist_response = self._client(other_user).get(url)
+        other_patient_response = self._client(other_patient_user).get(url)
+        patient_response = self._client(self.patient_user).get(url)
+        admin_response = self._client(admin_user).get(url)
+
+        # Assert
+        self.assertEqual(anonymous_response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(other_therapist_response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(other_patient_response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(patient_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(admin_response.status_code, status.HTTP_200_OK)
@@ -1,9 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Optional
+
+
+class StripeGatewayError(Exception):
+    """
+    Raised when the Stripe gateway rejects a request or cannot be reached after retries.
+    """
+    def __init__(self, message: str, status_code: Optional[int] = None, retryable: bool = False):
+        self.message = message
+        self.status_code = status_code
+        self.retryable = retryable
+        super().__init__(message)
+
 
 class StripeServiceInterface(ABC):
     @abstractmethod
-    def create_payment_intent(self, amount: float, currency: str) -> Dict:
+    def create_payment_intent(self, amount: float, currency: str, idempotency_key: Optional[str] = None) -> Dict:
         pass
 
     @abstractmethod
@@ -12,4 +24,4 @@ class StripeServiceInterface(ABC):
 
     @abstractmethod
     def create_product(self, name: str, price: float) -> Dict:
-        pass
\ No newline at end of file
+        pass
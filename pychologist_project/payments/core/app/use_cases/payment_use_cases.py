@@ -1,13 +1,24 @@
+import logging
+from decimal import Decimal
 from typing import Dict, List
+from django.db import transaction
+from django.utils import timezone
 from ...domain.repository.payment_repository import PaymentRepository
+from ...domain.repository.stripe_queue_repository import StripeQueueRepository
 from ...domain.entities.payment import PaymentEntity
-from ..stripe_services import StripeServiceInterface
+from ...domain.entities.stripe_queue import StripePaymentIntentEntity
+from ..stripe_services import StripeServiceInterface, StripeGatewayError
 from ....models import Payment as PaymentModel
 from core.pagination.page_helper import PaginatedResponse
 from core.mappers.payment.payment_mappers import PaymentMapper
 from core.pagination.page_helper import PaginationInput
 from ....models import PAYMENT_TYPES
 from core.exceptions.custom_exceptions import EntityNotFoundError
+from ...infrastructure.filters.django_payment_search_filters import RECEIPT_MATCH_MODES
+
+log = logging.getLogger('audit_logger')
+
+STRIPE_MAX_ATTEMPTS = 5
 
 
 # Map?
@@ -77,6 +88,12 @@ class SearchPaymentsUseCase:
             if payment_type not in PAYMENT_TYPES:
                 raise ValueError(f"Tipo de pago inválido. Válidos: {list(PAYMENT_TYPES.keys())}")
 
+        # Validar receipt_match
+        receipt_match = payment_filters.get('receipt_match')
+        if receipt_match is not None:
+            if receipt_match not in RECEIPT_MATCH_MODES:
+                raise ValueError(f"Modo de búsqueda de recibo inválido. Válidos: {RECEIPT_MATCH_MODES}")
+
         # Validar paid_after y paid_before
         paid_after = payment_filters.get('paid_after')
         paid_before = payment_filters.get('paid_before')
@@ -134,11 +151,148 @@ class SoftDeletePaymentUseCase:
 
 
 class ProcessStripePaymentUseCase:
-    def __init__(self, stripe_service: StripeServiceInterface):
+    """
+    Queues a payment intent instead of calling Stripe inside the request; the background
+    processor creates it at Stripe and the client polls for the client secret.
+    """
+    def __init__(self, queue_repository: StripeQueueRepository):
+        self.queue_repository = queue_repository
+
+    def execute(self, amount: float, currency: str = "usd", patient_id: int = None, paid_to_id: int = None,
+                created_by_id: int = None) -> StripePaymentIntentEntity:
+        if not PaymentEntity.MIN_AMOUNT_LIMIT <= amount <= PaymentEntity.MAX_AMOUNT_LIMIT:
+            raise ValueError(
+                f"El monto debe estar entre {PaymentEntity.MIN_AMOUNT_LIMIT} y {PaymentEntity.MAX_AMOUNT_LIMIT}"
+            )
+
+        payment_intent = StripePaymentIntentEntity(
+            amount=Decimal(str(amount)),
+            currency=currency.lower(),
+            patient_id=patient_id,
+            paid_to_id=paid_to_id,
+            created_by_id=created_by_id,
+        )
+        return self.queue_repository.enqueue_payment_intent(payment_intent)
+
+
+class GetStripePaymentIntentUseCase:
+    def __init__(self, queue_repository: StripeQueueRepository):
+        self.queue_repository = queue_repository
+
+    def execute(self, payment_intent_id: int, requester_id: int, is_admin: bool = False) -> StripePaymentIntentEntity:
+        payment_intent = self.queue_repository.get_payment_intent(payment_intent_id)
+        # Someone else's intent answers like a missing one, so IDs cannot be probed
+        if not payment_intent or (not is_admin and payment_intent.created_by_id != requester_id):
+            raise EntityNotFoundError("PaymentIntent", payment_intent_id)
+
+        return payment_intent
+
+
+class DispatchStripePaymentIntentsUseCase:
+    """
+    Creates queued payment intents at Stripe. Each intent is sent with its own idempotency key,
+    so an intent re-claimed after a crash is never created twice.
+    """
+    def __init__(self, stripe_service: StripeServiceInterface, queue_repository: StripeQueueRepository):
         self.stripe_service = stripe_service
+        self.queue_repository = queue_repository
+
+    def execute(self, batch_size: int = 50) -> int:
+        payment_intents = self.queue_repository.claim_payment_intents(batch_size)
+
+        for payment_intent in payment_intents:
+            try:
+                stripe_intent = self.stripe_service.create_payment_intent(
+                    payment_intent.amount,
+                    payment_intent.currency,
+                    idempotency_key=payment_intent.idempotency_key,
+                )
+            except StripeGatewayError as e:
+                retry = e.retryable and payment_intent.attempts < STRIPE_MAX_ATTEMPTS
+                log.warning(f"STRIPE PAYMENT INTENT FAILED | ID: {payment_intent.id}, Retry: {retry}, Error: {e.message}")
+                self.queue_repository.mark_payment_intent_failed(payment_intent.id, e.message, retry)
+                continue
+
+            self.queue_repository.mark_payment_intent_created(
+                payment_intent.id,
+                stripe_intent['id'],
+                stripe_intent.get('client_secret', ''),
+            )
+
+        return len(payment_intents)
+
+
+class IngestStripeWebhookUseCase:
+    """
+    Stores a verified webhook event for background processing. Duplicate deliveries are ignored.
+    """
+    def __init__(self, queue_repository: StripeQueueRepository):
+        self.queue_repository = queue_repository
+
+    def execute(self, event: Dict) -> bool:
+        return self.queue_repository.save_event(event)
+
+
+class ProcessStripeEventsUseCase:
+    HANDLED_EVENTS = ('payment_intent.succeeded', 'payment_intent.payment_failed', 'payment_intent.canceled')
+    FINAL_STATUSES = ('SUCCEEDED', 'CANCELED')
+
+    def __init__(self, queue_repository: StripeQueueRepository, payment_repository: PaymentRepository):
+        self.queue_repository = queue_repository
+        self.payment_repository = payment_repository
+
+    def execute(self, batch_size: int = 100) -> int:
+        events = self.queue_repository.claim_events(batch_size)
+
+        for event in events:
+            try:
+                self._handle(event)
+            except Exception as e:
+                retry = event.attempts < STRIPE_MAX_ATTEMPTS
+                log.error(f"STRIPE EVENT FAILED | Event: {event.stripe_event_id}, Retry: {retry}, Error: {e}")
+                self.queue_repository.mark_event_failed(event.id, str(e), retry)
+                continue
+
+            self.queue_repository.mark_event_processed(event.id)
+
+        return len(events)
+
+    def _handle(self, event) -> None:
+        if event.event_type not in self.HANDLED_EVENTS:
+            return
 
-    def execute(self, amount: float, currency: str = "usd") -> Dict:
-        return self.stripe_service.create_payment_intent(amount, currency)
+        stripe_payment_intent_id = event.data_object.get('id')
+        # The intent row stays locked until the payment is stored, so a redelivered or
+        # reclaimed event waits here and then sees the final status instead of paying twice
+        with transaction.atomic():
+            payment_intent = self.queue_repository.get_payment_intent_by_stripe_id(stripe_payment_intent_id, for_update=True)
+            if not payment_intent:
+                raise EntityNotFoundError("PaymentIntent", stripe_payment_intent_id)
+
+            if event.event_type == 'payment_intent.payment_failed':
+                # Stripe lets the customer retry a failed intent, so it stays open for a later success
+                if payment_intent.status not in self.FINAL_STATUSES:
+                    error = event.data_object.get('last_payment_error') or {}
+                    self.queue_repository.record_payment_intent_error(payment_intent.id, error.get('message') or 'payment_failed')
+                return
+
+            if event.event_type == 'payment_intent.canceled':
+                if payment_intent.status not in self.FINAL_STATUSES:
+                    self.queue_repository.complete_payment_intent(payment_intent.id, 'CANCELED')
+                return
+
+            # A charge that went through always gets its payment, whatever the intent went through before
+            if payment_intent.payment_id:
+                return
+
+            payment = self.payment_repository.save(PaymentEntity(
+                patient_id=payment_intent.patient_id,
+                paid_to_id=payment_intent.paid_to_id,
+                amount=payment_intent.amount,
+                payment_type='CARD',
+                paid_at=timezone.now(),
+            ))
+            self.queue_repository.complete_payment_intent(payment_intent.id, 'SUCCEEDED', payment.id)
 
 
 class ConfirmStripePaymentUseCase:
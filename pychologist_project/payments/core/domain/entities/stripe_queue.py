@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Optional
+
+
+@dataclass
+class StripePaymentIntentEntity:
+    """Payment intent waiting for, or already sent to, the Stripe gateway."""
+    amount: Decimal
+    currency: str = 'usd'
+    status: str = 'QUEUED'
+    id: Optional[int] = None
+    stripe_payment_intent_id: Optional[str] = None
+    client_secret: str = ''
+    patient_id: Optional[int] = None
+    paid_to_id: Optional[int] = None
+    payment_id: Optional[int] = None
+    created_by_id: Optional[int] = None
+    attempts: int = 0
+    last_error: str = ''
+    created_at: Optional[datetime] = None
+
+    @property
+    def idempotency_key(self) -> str:
+        """Key sent to Stripe so re-dispatching the same intent never creates a second one."""
+        return f"payment_intent_{self.id}"
+
+
+@dataclass
+class StripeEventEntity:
+    """Webhook event received from Stripe."""
+    stripe_event_id: str
+    event_type: str
+    payload: Dict = field(default_factory=dict)
+    status: str = 'PENDING'
+    id: Optional[int] = None
+    attempts: int = 0
+
+    @property
+    def data_object(self) -> Dict:
+        return self.payload.get('data', {}).get('object', {})
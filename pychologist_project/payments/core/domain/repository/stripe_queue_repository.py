@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from payments.core.domain.entities.stripe_queue import StripePaymentIntentEntity, StripeEventEntity
+
+
+class StripeQueueRepository(ABC):
+    @abstractmethod
+    def enqueue_payment_intent(self, payment_intent: StripePaymentIntentEntity) -> StripePaymentIntentEntity:
+        """Stores a payment intent to be created at Stripe by the background processor."""
+        pass
+
+    @abstractmethod
+    def get_payment_intent(self, payment_intent_id: int) -> Optional[StripePaymentIntentEntity]:
+        """Retrieves a queued payment intent by its ID."""
+        pass
+
+    @abstractmethod
+    def claim_payment_intents(self, limit: int) -> List[StripePaymentIntentEntity]:
+        """Marks up to `limit` queued payment intents as processing and returns them."""
+        pass
+
+    @abstractmethod
+    def mark_payment_intent_created(self, payment_intent_id: int, stripe_payment_intent_id: str, client_secret: str) -> None:
+        """Records the Stripe ID and client secret of a dispatched payment intent."""
+        pass
+
+    @abstractmethod
+    def mark_payment_intent_failed(self, payment_intent_id: int, error: str, retry: bool) -> None:
+        """Records a dispatch error. With retry the intent goes back to the queue."""
+        pass
+
+    @abstractmethod
+    def get_payment_intent_by_stripe_id(self, stripe_payment_intent_id: str, for_update: bool = False) -> Optional[StripePaymentIntentEntity]:
+        """Retrieves a payment intent by the ID Stripe assigned to it. With for_update the row stays locked until the transaction ends."""
+        pass
+
+    @abstractmethod
+    def record_payment_intent_error(self, payment_intent_id: int, error: str) -> None:
+        """Records a failed charge without changing the status, so the customer can retry it."""
+        pass
+
+    @abstractmethod
+    def complete_payment_intent(self, payment_intent_id: int, status: str, payment_id: Optional[int] = None) -> None:
+        """Moves a payment intent to its final status."""
+        pass
+
+    @abstractmethod
+    def save_event(self, event: Dict) -> bool:
+        """Stores a webhook event. Returns False if the event was already received."""
+        pass
+
+    @abstractmethod
+    def claim_events(self, limit: int) -> List[StripeEventEntity]:
+        """Marks up to `limit` pending events as processing and returns them."""
+        pass
+
+    @abstractmethod
+    def mark_event_processed(self, event_id: int) -> None:
+        pass
+
+    @abstractmethod
+    def mark_event_failed(self, event_id: int, error: str, retry: bool) -> None:
+        pass
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .....models import Payment
+from ...filters.django_payment_search_filters import RECEIPT_MATCH_MODES
 
 class PaymentSerializer(serializers.ModelSerializer):
     class Meta:
@@ -126,6 +127,12 @@ class PaymentSearchSerializer(serializers.Serializer):
         help_text="Filter payments by receipt number."
     )
 
+    receipt_match = serializers.ChoiceField(
+        choices=RECEIPT_MATCH_MODES,
+        required=False,
+        help_text="Receipt number match mode (contains, exact, prefix). Defaults to contains; exact and prefix use the indexed normalized receipt number."
+    )
+
     paid_after = serializers.DateField(
         required=False,
         help_text="Filter payments paid after this date (YYYY-MM-DD)."
@@ -134,4 +141,40 @@ class PaymentSearchSerializer(serializers.Serializer):
     paid_before = serializers.DateField(
         required=False,
         help_text="Filter payments paid before this date (YYYY-MM-DD)."
-    )
\ No newline at end of file
+    )
+
+class StripePaymentIntentSerializer(serializers.Serializer):
+    """Serializer to validate a new Stripe payment intent request."""
+    amount = serializers.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        help_text="Amount to charge. Must be greater than 0."
+    )
+
+    currency = serializers.CharField(
+        max_length=3,
+        required=False,
+        default='usd',
+        help_text="Three-letter ISO currency code."
+    )
+
+    patient_id = serializers.IntegerField(
+        required=False,
+        help_text="Patient being charged."
+    )
+
+    paid_to_id = serializers.IntegerField(
+        required=False,
+        help_text="Therapist receiving the payment."
+    )
+
+
+class StripePaymentIntentOutputSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    currency = serializers.CharField()
+    status = serializers.CharField(help_text="QUEUED, PROCESSING, CREATED, SUCCEEDED, CANCELED or FAILED.")
+    stripe_payment_intent_id = serializers.CharField(allow_null=True)
+    client_secret = serializers.CharField(allow_blank=True, help_text="Available once the status is CREATED.")
+    payment_id = serializers.IntegerField(allow_null=True)
+    last_error = serializers.CharField(allow_blank=True)
@@ -6,6 +6,7 @@ import logging
 from core.pagination.page_helper import get_pagination_data
 from core.pagination.serializers.paginations_serializers import PaginatedResponseSerializer
 from core.api_response.response import DjangoResponseWrapper as ResponseWrapper
+from core.idempotency.idempotency import idempotent
 from ..serializers.serializers import PaymentSerializer, PaymentSearchSerializer, PaymentOutputSerializer
 from ...repository.django_payment_repository import DjangoPaymentRepository
 from ....app.use_cases.payment_use_cases import (
@@ -61,6 +62,12 @@ class PaymentViewSet(ViewSet):
                 location=OpenApiParameter.QUERY,
                 description='Filter payments by receipt number.',
             ),
+            OpenApiParameter(
+                name='receipt_match',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Receipt number match mode: contains (default), exact or prefix.",
+            ),
             OpenApiParameter(
                 name='paid_after',
                 type=OpenApiTypes.DATE,
@@ -141,14 +148,25 @@ class PaymentViewSet(ViewSet):
 
     @extend_schema(
         summary="Create a new payment",
-        description="Creates a new payment record.",
+        description="Creates a new payment record. Send an `Idempotency-Key` header to make retries safe: "
+                    "a retried request with the same key returns the original response instead of creating a duplicate.",
         request=PaymentSerializer,
         responses={
             201: PaymentSerializer,
             400: OpenApiTypes.OBJECT,
+            409: OpenApiTypes.OBJECT,
         },
+        parameters=[
+            OpenApiParameter(
+                name='Idempotency-Key',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.HEADER,
+                description='Unique key for this payment request. Retries with the same key are replayed.',
+            ),
+        ],
     )
-    def post(self, request):
+    @idempotent('payment_create')
+    def create(self, request):
         user = request.user if request.user.is_authenticated else None
         ip_address = request.META.get('REMOTE_ADDR')
 
@@ -157,7 +175,7 @@ class PaymentViewSet(ViewSet):
         serializer = PaymentSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        payment = self.create_payment_use_case.execute(**serializer.validated_data)
+        payment = self.create_payment_use_case.execute(serializer.validated_data)
 
         log.info(f"CREATE PAYMENT SUCCESS | Payment ID: {payment.id}")
 
@@ -0,0 +1,143 @@
+from rest_framework.views import APIView
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
+from django.conf import settings
+import logging
+from core.api_response.response import DjangoResponseWrapper as ResponseWrapper
+from core.idempotency.idempotency import idempotent
+from users.core.presentation.api.authentication import get_user_principal
+from ..serializers.serializers import StripePaymentIntentSerializer, StripePaymentIntentOutputSerializer
+from ...repository.django_stripe_queue_repository import DjangoStripeQueueRepository
+from ...stripe.stripe_webhooks import parse_stripe_event
+from ....app.use_cases.payment_use_cases import (
+    ProcessStripePaymentUseCase,
+    GetStripePaymentIntentUseCase,
+    IngestStripeWebhookUseCase,
+)
+
+log = logging.getLogger('audit_logger')
+
+
+class StripePaymentIntentView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def __init__(self, **kwargs):
+        self.queue_repository = DjangoStripeQueueRepository()
+        self.process_stripe_payment_use_case = ProcessStripePaymentUseCase(queue_repository=self.queue_repository)
+        self.get_stripe_payment_intent_use_case = GetStripePaymentIntentUseCase(queue_repository=self.queue_repository)
+        super().__init__(**kwargs)
+
+    @extend_schema(
+        summary="Queue a Stripe payment intent",
+        description="Queues a payment intent that is created at Stripe by the background processor. "
+                    "Poll the GET endpoint with the returned id until the status is CREATED to obtain the client secret.",
+        request=StripePaymentIntentSerializer,
+        responses={
+            201: StripePaymentIntentOutputSerializer,
+            400: OpenApiTypes.OBJECT,
+        },
+        parameters=[
+            OpenApiParameter(
+                name='Idempotency-Key',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.HEADER,
+                description='Unique key for this request. Retries with the same key are replayed.',
+            ),
+        ],
+    )
+    @idempotent('stripe_payment_intent_create')
+    def post(self, request):
+        user = request.user
+        ip_address = request.META.get('REMOTE_ADDR')
+
+        log.info(f"QUEUE STRIPE PAYMENT INTENT REQUEST | User: {user}, IP: {ip_address}, Data: {request.data}")
+
+        serializer = StripePaymentIntentSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        payment_intent = self.process_stripe_payment_use_case.execute(**serializer.validated_data, created_by_id=user.id)
+
+        log.info(f"QUEUE STRIPE PAYMENT INTENT SUCCESS | ID: {payment_intent.id}")
+
+        return ResponseWrapper.created(
+            data=StripePaymentIntentOutputSerializer(payment_intent).data,
+            entity='Payment Intent'
+        )
+
+    @extend_schema(
+        summary="Get a Stripe payment intent",
+        description="Returns the current status of a queued payment intent. Only the user who queued it "
+                    "and admins can read it; anyone else gets a 404.",
+        responses={
+            200: StripePaymentIntentOutputSerializer,
+            404: OpenApiTypes.OBJECT,
+        },
+        parameters=[
+            OpenApiParameter(
+                name='id',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='ID returned when the payment intent was queued.',
+                required=True,
+            ),
+        ],
+    )
+    def get(self, request):
+        payment_intent_id = request.query_params.get('id')
+        if not payment_intent_id or not payment_intent_id.isdigit():
+            return ResponseWrapper.bad_request(message="Parameter 'id' is required")
+
+        principal = get_user_principal(request.user)
+        payment_intent = self.get_stripe_payment_intent_use_case.execute(
+            int(payment_intent_id),
+            requester_id=principal.id,
+            is_admin=principal.role == 'ADMIN'
+        )
+
+        return ResponseWrapper.found(
+            data=StripePaymentIntentOutputSerializer(payment_intent).data,
+            entity='Payment Intent',
+            param='ID',
+            value=payment_intent_id
+        )
+
+
+class StripeWebhookView(APIView):
+    """
+    Receives Stripe webhooks. The event is verified and stored, then acknowledged right away;
+    the `process_stripe_queue` command applies it in the background.
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    throttle_classes = []
+
+    def __init__(self, **kwargs):
+        self.ingest_stripe_webhook_use_case = IngestStripeWebhookUseCase(queue_repository=DjangoStripeQueueRepository())
+        super().__init__(**kwargs)
+
+    @extend_schema(
+        summary="Stripe webhook",
+        description="Endpoint called by Stripe. Requires a valid `Stripe-Signature` header.",
+        request=OpenApiTypes.OBJECT,
+        responses={
+            200: OpenApiTypes.OBJECT,
+            400: OpenApiTypes.OBJECT,
+            503: OpenApiTypes.OBJECT,
+        },
+    )
+    def post(self, request):
+        if not settings.STRIPE_WEBHOOK_SECRET:
+            log.error("STRIPE WEBHOOK REJECTED | STRIPE_WEBHOOK_SECRET is not configured")
+            return ResponseWrapper.service_unavailable(message="Stripe webhooks are not configured")
+
+        event = parse_stripe_event(
+            request.body,
+            request.META.get('HTTP_STRIPE_SIGNATURE'),
+            settings.STRIPE_WEBHOOK_SECRET,
+        )
+
+        created = self.ingest_stripe_webhook_use_case.execute(event)
+
+        log.info(f"STRIPE WEBHOOK RECEIVED | Event: {event['id']}, Type: {event['type']}, Duplicate: {not created}")
+
+        return ResponseWrapper.success(data={'received': True, 'duplicate': not created})
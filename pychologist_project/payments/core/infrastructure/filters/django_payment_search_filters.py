@@ -2,6 +2,17 @@ from typing import Optional
 from datetime import datetime
 from dataclasses import dataclass
 from django.db.models import Q
+from payments.models import normalize_receipt_number
+
+RECEIPT_MATCH_EXACT = 'exact'
+RECEIPT_MATCH_PREFIX = 'prefix'
+RECEIPT_MATCH_CONTAINS = 'contains'
+
+RECEIPT_MATCH_MODES = [
+    RECEIPT_MATCH_CONTAINS,
+    RECEIPT_MATCH_EXACT,
+    RECEIPT_MATCH_PREFIX,
+]
 
 @dataclass
 class PaymentSearchFilters:
@@ -9,6 +20,7 @@ class PaymentSearchFilters:
     amount_max: Optional[float] = None
     payment_type: Optional[str] = None
     receipt_number: Optional[str] = None
+    receipt_match: str = RECEIPT_MATCH_CONTAINS
     paid_after: Optional[datetime] = None
     paid_before: Optional[datetime] = None
     therapist_id: Optional[int] = None
@@ -33,7 +45,7 @@ class PaymentSearchFilters:
             query &= Q(payment_type=self.payment_type)
             
         if self.receipt_number:
-            query &= Q(receipt_number__icontains=self.receipt_number)
+            query &= self.receipt_query()
             
         if self.paid_after:
             query &= Q(paid_at__gte=self.paid_after)
@@ -47,4 +59,24 @@ class PaymentSearchFilters:
         if self.patient_id:
             query &= Q(patient_id=self.patient_id)
             
-        return query
\ No newline at end of file
+        return query
+
+    def receipt_query(self) -> Q:
+        """
+        Construye el filtro del número de recibo según el modo de búsqueda.
+
+        Los modos exacto y por prefijo usan la columna normalizada `receipt_number_key`: en PostgreSQL
+        `startswith` se resuelve con su índice `varchar_pattern_ops`. El modo 'contains' usa `icontains`,
+        que en PostgreSQL está cubierto por el índice GIN pg_trgm.
+        """
+        if self.receipt_match == RECEIPT_MATCH_CONTAINS:
+            return Q(receipt_number__icontains=self.receipt_number)
+
+        receipt_key = normalize_receipt_number(self.receipt_number)
+        if not receipt_key:
+            return Q(receipt_number__icontains=self.receipt_number)
+
+        if self.receipt_match == RECEIPT_MATCH_EXACT:
+            return Q(receipt_number_key=receipt_key)
+
+        return Q(receipt_number_key__startswith=receipt_key)
@@ -3,7 +3,7 @@ from core.cache.cache_manager import CacheManager
 from payments.core.domain.entities.payment import PaymentEntity
 from payments.core.domain.repository.payment_repository import PaymentRepository
 from ....models import Payment                      
-from ..filters.django_payment_search_filters import PaymentSearchFilters
+from ..filters.django_payment_search_filters import PaymentSearchFilters, RECEIPT_MATCH_CONTAINS
 from core.mappers.payment.payment_mappers import PaymentMapper
 from core.exceptions.custom_exceptions import EntityNotFoundError
 from core.pagination.page_helper import PaginationHelper, PaginationInput, PaginatedResponse
@@ -63,13 +63,14 @@ class DjangoPaymentRepository(PaymentRepository):
             amount_max=payment_filters.get('amount_max'),
             payment_type=payment_filters.get('payment_type'),
             receipt_number=payment_filters.get('receipt_number'),
+            receipt_match=payment_filters.get('receipt_match') or RECEIPT_MATCH_CONTAINS,
             paid_after=payment_filters.get('paid_after'),
             paid_before=payment_filters.get('paid_before'),
             therapist_id=payment_filters.get('therapist_id'),
             patient_id=payment_filters.get('patient_id'),
         )
 
-        payments = Payment.objects.filter(filters.to_query()).order_by('-paid_at')
+        payments = Payment.live.filter(filters.to_query()).order_by('-paid_at')
         
         return PaginationHelper.get_paginated_response(
             pagination_input,
@@ -77,7 +78,7 @@ class DjangoPaymentRepository(PaymentRepository):
             PaymentMapper.to_entity)
 
     def get_pageable_by_therapist_id(self, therapist_id: int, pagination_input : PaginationInput) -> PaginatedResponse[PaymentEntity]:            
-        queryset = Payment.objects.filter(
+        queryset = Payment.live.filter(
             paid_to_id=therapist_id
         ).order_by('-paid_at')
 
@@ -101,7 +102,7 @@ class DjangoPaymentRepository(PaymentRepository):
         return paginated_response
 
     def get_pageable_by_patient_id(self, patient_id: int,  pagination_input : PaginationInput) -> PaginatedResponse[PaymentEntity]:
-        queryset = Payment.objects.filter(
+        queryset = Payment.live.filter(
             patient_id=patient_id
         ).order_by('-paid_at')
         
@@ -171,7 +172,7 @@ class DjangoPaymentRepository(PaymentRepository):
         
     def _get_payment(self, payment_id) -> Optional[Payment]:
         try:
-            return Payment.objects.get(id=payment_id)
+            return Payment.live.get(id=payment_id)
         except Payment.DoesNotExist:
            return None
 
@@ -0,0 +1,139 @@
+from datetime import timedelta
+from typing import Dict, List, Optional
+from django.db import transaction, IntegrityError
+from django.db.models import F, Q
+from django.utils import timezone
+from payments.core.domain.entities.stripe_queue import StripePaymentIntentEntity, StripeEventEntity
+from payments.core.domain.repository.stripe_queue_repository import StripeQueueRepository
+from ....models import StripePaymentIntent, StripeEvent
+
+# Rows left in PROCESSING longer than this (crashed worker) are claimed again
+STALE_PROCESSING_AFTER = timedelta(minutes=5)
+
+
+class DjangoStripeQueueRepository(StripeQueueRepository):
+    """
+    Database-backed queue for Stripe work. Workers claim rows with SELECT ... FOR UPDATE SKIP LOCKED
+    so several processors can run side by side without picking the same row.
+    """
+    def enqueue_payment_intent(self, payment_intent: StripePaymentIntentEntity) -> StripePaymentIntentEntity:
+        model = StripePaymentIntent.objects.create(
+            amount=payment_intent.amount,
+            currency=payment_intent.currency,
+            patient_id=payment_intent.patient_id,
+            paid_to_id=payment_intent.paid_to_id,
+            created_by_id=payment_intent.created_by_id,
+        )
+        return self._intent_to_entity(model)
+
+    def get_payment_intent(self, payment_intent_id: int) -> Optional[StripePaymentIntentEntity]:
+        model = StripePaymentIntent.objects.filter(id=payment_intent_id).first()
+        return self._intent_to_entity(model) if model else None
+
+    def get_payment_intent_by_stripe_id(self, stripe_payment_intent_id: str, for_update: bool = False) -> Optional[StripePaymentIntentEntity]:
+        queryset = StripePaymentIntent.objects.filter(stripe_payment_intent_id=stripe_payment_intent_id)
+        if for_update:
+            queryset = queryset.select_for_update()
+        model = queryset.first()
+        return self._intent_to_entity(model) if model else None
+
+    def claim_payment_intents(self, limit: int) -> List[StripePaymentIntentEntity]:
+        claimable = Q(status='QUEUED') | Q(status='PROCESSING', updated_at__lt=timezone.now() - STALE_PROCESSING_AFTER)
+        with transaction.atomic():
+            ids = list(
+                StripePaymentIntent.objects.select_for_update(skip_locked=True)
+                .filter(claimable)
+                .order_by('created_at')
+                .values_list('id', flat=True)[:limit]
+            )
+            StripePaymentIntent.objects.filter(id__in=ids).update(
+                status='PROCESSING',
+                attempts=F('attempts') + 1,
+                updated_at=timezone.now(),
+            )
+        return [self._intent_to_entity(model) for model in StripePaymentIntent.objects.filter(id__in=ids).order_by('created_at')]
+
+    def mark_payment_intent_created(self, payment_intent_id: int, stripe_payment_intent_id: str, client_secret: str) -> None:
+        StripePaymentIntent.objects.filter(id=payment_intent_id).update(
+            status='CREATED',
+            stripe_payment_intent_id=stripe_payment_intent_id,
+            client_secret=client_secret,
+            last_error='',
+            updated_at=timezone.now(),
+        )
+
+    def mark_payment_intent_failed(self, payment_intent_id: int, error: str, retry: bool) -> None:
+        StripePaymentIntent.objects.filter(id=payment_intent_id).update(
+            status='QUEUED' if retry else 'FAILED',
+            last_error=error,
+            updated_at=timezone.now(),
+        )
+
+    def record_payment_intent_error(self, payment_intent_id: int, error: str) -> None:
+        StripePaymentIntent.objects.filter(id=payment_intent_id).update(last_error=error, updated_at=timezone.now())
+
+    def complete_payment_intent(self, payment_intent_id: int, status: str, payment_id: Optional[int] = None) -> None:
+        StripePaymentIntent.objects.filter(id=payment_intent_id).update(
+            status=status,
+            payment_id=payment_id,
+            updated_at=timezone.now(),
+        )
+
+    def save_event(self, event: Dict) -> bool:
+        try:
+            with transaction.atomic():
+                StripeEvent.objects.create(
+                    stripe_event_id=event['id'],
+                    event_type=event['type'],
+                    payload=event,
+                )
+        except IntegrityError:
+            return False
+        return True
+
+    def claim_events(self, limit: int) -> List[StripeEventEntity]:
+        # A PROCESSING event claimed long ago was abandoned by its worker
+        now = timezone.now()
+        claimable = Q(status='PENDING') | Q(status='PROCESSING', claimed_at__lt=now - STALE_PROCESSING_AFTER)
+        with transaction.atomic():
+            ids = list(
+                StripeEvent.objects.select_for_update(skip_locked=True)
+                .filter(claimable)
+                .order_by('received_at')
+                .values_list('id', flat=True)[:limit]
+            )
+            StripeEvent.objects.filter(id__in=ids).update(status='PROCESSING', attempts=F('attempts') + 1, claimed_at=now)
+        return [self._event_to_entity(model) for model in StripeEvent.objects.filter(id__in=ids).order_by('received_at')]
+
+    def mark_event_processed(self, event_id: int) -> None:
+        StripeEvent.objects.filter(id=event_id).update(status='PROCESSED', last_error='', processed_at=timezone.now())
+
+    def mark_event_failed(self, event_id: int, error: str, retry: bool) -> None:
+        StripeEvent.objects.filter(id=event_id).update(status='PENDING' if retry else 'FAILED', last_error=error)
+
+    def _intent_to_entity(self, model: StripePaymentIntent) -> StripePaymentIntentEntity:
+        return StripePaymentIntentEntity(
+            id=model.id,
+            amount=model.amount,
+            currency=model.currency,
+            status=model.status,
+            stripe_payment_intent_id=model.stripe_payment_intent_id,
+            client_secret=model.client_secret,
+            patient_id=model.patient_id,
+            paid_to_id=model.paid_to_id,
+            payment_id=model.payment_id,
+            created_by_id=model.created_by_id,
+            attempts=model.attempts,
+            last_error=model.last_error,
+            created_at=model.created_at,
+        )
+
+    def _event_to_entity(self, model: StripeEvent) -> StripeEventEntity:
+        return StripeEventEntity(
+            id=model.id,
+            stripe_event_id=model.stripe_event_id,
+            event_type=model.event_type,
+            payload=model.payload,
+            status=model.status,
+            attempts=model.attempts,
+        )
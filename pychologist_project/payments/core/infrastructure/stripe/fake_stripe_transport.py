@@ -0,0 +1,150 @@
+import json
+import re
+import threading
+import time
+import uuid
+from typing import Dict, Tuple
+from urllib.parse import urlparse, parse_qsl
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+PAYMENT_INTENT_PATH = re.compile(r'^/v1/payment_intents/(?P<intent_id>[^/]+)$')
+CONFIRM_PATH = re.compile(r'^/v1/payment_intents/(?P<intent_id>[^/]+)/confirm$')
+
+
+class FakeStripeTransport(BaseAdapter):
+    """
+    In-memory stand-in for the Stripe REST API, mounted on a `requests.Session`.
+
+    Supports the endpoints used by `StripeHttpService`, honours Idempotency-Key like Stripe does,
+    and can inject latency or failures so tests and benchmarks can exercise timeouts and retries.
+    """
+    def __init__(self, latency: float = 0.0, failures: int = 0, failure_status: int = 500):
+        super().__init__()
+        self.latency = latency
+        self.failures = failures
+        self.failure_status = failure_status
+        self.payment_intents: Dict[str, Dict] = {}
+        self.products: Dict[str, Dict] = {}
+        self.prices: Dict[str, Dict] = {}
+        self.request_log = []
+        self._idempotent_responses: Dict[str, Tuple[int, Dict]] = {}
+        self._lock = threading.Lock()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.latency:
+            time.sleep(self.latency)
+
+        path = urlparse(request.url).path
+        body = request.body.decode('utf-8') if isinstance(request.body, bytes) else (request.body or '')
+        data = dict(parse_qsl(body))
+        idempotency_key = request.headers.get('Idempotency-Key')
+
+        with self._lock:
+            self.request_log.append((request.method, path, idempotency_key))
+
+            if self.failures > 0:
+                self.failures -= 1
+                return self._build_response(request, self.failure_status, self._error('Injected failure'))
+
+            if idempotency_key and idempotency_key in self._idempotent_responses:
+                status_code, payload = self._idempotent_responses[idempotency_key]
+                return self._build_response(request, status_code, payload)
+
+            status_code, payload = self._route(request.method, path, data)
+            if idempotency_key and request.method == 'POST':
+                self._idempotent_responses[idempotency_key] = (status_code, payload)
+
+        return self._build_response(request, status_code, payload)
+
+    def close(self):
+        pass
+
+    def _route(self, method: str, path: str, data: Dict) -> Tuple[int, Dict]:
+        if method == 'POST' and path == '/v1/payment_intents':
+            return self._create_payment_intent(data)
+
+        if method == 'POST' and (match := CONFIRM_PATH.match(path)):
+            return self._confirm_payment_intent(match.group('intent_id'))
+
+        if method == 'GET' and (match := PAYMENT_INTENT_PATH.match(path)):
+            intent = self.payment_intents.get(match.group('intent_id'))
+            return (200, intent) if intent else (404, self._error('No such payment_intent'))
+
+        if method == 'POST' and path == '/v1/products':
+            product = {'id': f'prod_{uuid.uuid4().hex[:14]}', 'object': 'product', 'name': data.get('name', '')}
+            self.products[product['id']] = product
+            return 200, product
+
+        if method == 'POST' and path == '/v1/prices':
+            if data.get('product') not in self.products:
+                return 400, self._error('No such product')
+            price = {
+                'id': f'price_{uuid.uuid4().hex[:14]}',
+                'object': 'price',
+                'product': data['product'],
+                'unit_amount': int(data.get('unit_amount', 0)),
+                'currency': data.get('currency', 'usd'),
+            }
+            self.prices[price['id']] = price
+            return 200, price
+
+        return 404, self._error(f'Unrecognized request URL ({method}: {path})')
+
+    def _create_payment_intent(self, data: Dict) -> Tuple[int, Dict]:
+        if not data.get('amount') or int(data['amount']) <= 0:
+            return 400, self._error('Amount must be a positive integer')
+
+        intent_id = f'pi_{uuid.uuid4().hex[:24]}'
+        intent = {
+            'id': intent_id,
+            'object': 'payment_intent',
+            'amount': int(data['amount']),
+            'currency': data.get('currency', 'usd'),
+            'status': 'requires_confirmation',
+            'client_secret': f'{intent_id}_secret_{uuid.uuid4().hex[:24]}',
+        }
+        self.payment_intents[intent_id] = intent
+        return 200, intent
+
+    def _confirm_payment_intent(self, intent_id: str) -> Tuple[int, Dict]:
+        intent = self.payment_intents.get(intent_id)
+        if not intent:
+            return 404, self._error('No such payment_intent')
+
+        intent['status'] = 'succeeded'
+        return 200, intent
+
+    def _error(self, message: str) -> Dict:
+        return {'error': {'type': 'invalid_request_error', 'message': message}}
+
+    def _build_response(self, request, status_code: int, payload: Dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = json.dumps(payload).encode('utf-8')
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.reason = 'OK' if status_code < 400 else 'Error'
+        return response
+
+
+_fake_session = None
+
+
+def build_fake_stripe_session(transport: FakeStripeTransport = None) -> requests.Session:
+    session = requests.Session()
+    transport = transport or FakeStripeTransport()
+    session.mount('https://', transport)
+    session.mount('http://', transport)
+    return session
+
+
+def get_fake_stripe_session() -> requests.Session:
+    """Shared fake session so objects created by one request are visible to the next one in the process."""
+    global _fake_session
+    if _fake_session is None:
+        _fake_session = build_fake_stripe_session()
+    return _fake_session
@@ -0,0 +1,123 @@
+import time
+import uuid
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+from payments.core.app.stripe_services import StripeServiceInterface, StripeGatewayError
+
+RETRYABLE_STATUS_CODES = {409, 429, 500, 502, 503, 504}
+
+_shared_session = None
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Process-wide HTTP session so every request reuses pooled keep-alive connections to Stripe.
+    """
+    global _shared_session
+    if _shared_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=settings.STRIPE_POOL_CONNECTIONS,
+            pool_maxsize=settings.STRIPE_POOL_MAXSIZE,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _shared_session = session
+    return _shared_session
+
+
+def to_minor_units(amount) -> int:
+    """Stripe expects amounts as integers in the currency's smallest unit (cents)."""
+    return int((Decimal(str(amount)) * 100).quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+
+
+class StripeHttpService(StripeServiceInterface):
+    """
+    Stripe REST client over a pooled `requests` session with timeouts and retries.
+
+    POST requests always carry an Idempotency-Key, so a retry after a timeout never creates a second
+    object at Stripe.
+    """
+    def __init__(
+        self,
+        api_key: str = None,
+        api_base: str = None,
+        session: requests.Session = None,
+        timeout: tuple = None,
+        max_retries: int = None,
+        backoff: float = None,
+    ):
+        self.api_key = api_key or settings.STRIPE_SECRET_KEY
+        self.api_base = (api_base or settings.STRIPE_API_BASE).rstrip('/')
+        self.session = session or get_shared_session()
+        self.timeout = timeout or (settings.STRIPE_CONNECT_TIMEOUT, settings.STRIPE_READ_TIMEOUT)
+        self.max_retries = settings.STRIPE_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff = settings.STRIPE_RETRY_BACKOFF if backoff is None else backoff
+
+    def create_payment_intent(self, amount: float, currency: str, idempotency_key: Optional[str] = None) -> Dict:
+        return self._request('POST', '/v1/payment_intents', {
+            'amount': to_minor_units(amount),
+            'currency': currency,
+        }, idempotency_key=idempotency_key)
+
+    def confirm_payment(self, payment_intent_id: str) -> bool:
+        payment_intent = self._request('POST', f'/v1/payment_intents/{payment_intent_id}/confirm')
+        return payment_intent.get('status') == 'succeeded'
+
+    def create_product(self, name: str, price: float) -> Dict:
+        product = self._request('POST', '/v1/products', {'name': name})
+        stripe_price = self._request('POST', '/v1/prices', {
+            'product': product['id'],
+            'unit_amount': to_minor_units(price),
+            'currency': 'usd',
+        })
+        return {**product, 'default_price': stripe_price['id']}
+
+    def _request(self, method: str, path: str, data: Dict = None, idempotency_key: Optional[str] = None) -> Dict:
+        headers = {'Authorization': f'Bearer {self.api_key}'}
+        if method == 'POST':
+            headers['Idempotency-Key'] = idempotency_key or uuid.uuid4().hex
+
+        url = f'{self.api_base}{path}'
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(method, url, data=data, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise StripeGatewayError(f"Stripe no disponible: {e}", retryable=True) from e
+            else:
+                if response.status_code < 400:
+                    return response.json()
+
+                retryable = response.status_code in RETRYABLE_STATUS_CODES
+                if not retryable or attempt >= self.max_retries:
+                    raise StripeGatewayError(
+                        self._error_message(response),
+                        status_code=response.status_code,
+                        retryable=retryable,
+                    )
+
+            attempt += 1
+            time.sleep(self.backoff * (2 ** (attempt - 1)))
+
+    def _error_message(self, response: requests.Response) -> str:
+        try:
+            return response.json().get('error', {}).get('message') or response.reason
+        except ValueError:
+            return response.reason or f"Stripe error {response.status_code}"
+
+
+def get_stripe_service() -> StripeServiceInterface:
+    """
+    Returns the Stripe service configured for this environment. With STRIPE_USE_FAKE the requests
+    never leave the process and are answered by the in-memory fake transport.
+    """
+    if settings.STRIPE_USE_FAKE:
+        from .fake_stripe_transport import get_fake_stripe_session
+        return StripeHttpService(api_key='sk_test_fake', session=get_fake_stripe_session())
+
+    return StripeHttpService()
@@ -0,0 +1,58 @@
+import hashlib
+import hmac
+import json
+import time
+from typing import Dict
+from django.core.exceptions import ImproperlyConfigured
+from core.exceptions.custom_exceptions import BusinessLogicError
+
+DEFAULT_TOLERANCE = 300  # seconds
+
+
+def compute_stripe_signature(payload: bytes, secret: str, timestamp: int) -> str:
+    signed_payload = f"{timestamp}.".encode('utf-8') + payload
+    return hmac.new(secret.encode('utf-8'), signed_payload, hashlib.sha256).hexdigest()
+
+
+def parse_stripe_event(payload: bytes, signature_header: str, secret: str, tolerance: int = DEFAULT_TOLERANCE) -> Dict:
+    """
+    Verifies the `Stripe-Signature` header (v1 scheme) and returns the decoded event.
+
+    Raises:
+        ImproperlyConfigured: If no webhook secret is configured; an empty key would accept forged events.
+        BusinessLogicError: If the signature is missing, invalid, too old, or the payload is not JSON.
+    """
+    if not secret:
+        raise ImproperlyConfigured("STRIPE_WEBHOOK_SECRET no está configurado")
+
+    if not signature_header:
+        raise BusinessLogicError("Falta la cabecera Stripe-Signature")
+
+    timestamp = None
+    signatures = []
+    for item in signature_header.split(','):
+        key, _, value = item.strip().partition('=')
+        if key == 't':
+            timestamp = value
+        elif key == 'v1':
+            signatures.append(value)
+
+    if not timestamp or not timestamp.isdigit() or not signatures:
+        raise BusinessLogicError("Cabecera Stripe-Signature inválida")
+
+    if tolerance and abs(time.time() - int(timestamp)) > tolerance:
+        raise BusinessLogicError("La firma del webhook de Stripe ha expirado")
+
+    expected = compute_stripe_signature(payload, secret, int(timestamp))
+    if not any(hmac.compare_digest(expected, signature) for signature in signatures):
+        raise BusinessLogicError("Firma del webhook de Stripe inválida")
+
+    try:
+        event = json.loads(payload)
+    except ValueError:
+        raise BusinessLogicError("El cuerpo del webhook de Stripe no es JSON válido")
+
+    if not event.get('id') or not event.get('type'):
+        raise BusinessLogicError("El evento de Stripe no tiene id o type")
+
+    return event
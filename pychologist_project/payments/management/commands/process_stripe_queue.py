@@ -0,0 +1,36 @@
+import time
+from django.core.management.base import BaseCommand
+from payments.core.infrastructure.repository.django_stripe_queue_repository import DjangoStripeQueueRepository
+from payments.core.infrastructure.repository.django_payment_repository import DjangoPaymentRepository
+from payments.core.infrastructure.stripe.stripe_http_service import get_stripe_service
+from payments.core.app.use_cases.payment_use_cases import (
+    DispatchStripePaymentIntentsUseCase,
+    ProcessStripeEventsUseCase,
+)
+
+
+class Command(BaseCommand):
+    help = 'Crea en Stripe los payment intents en cola y procesa los webhooks recibidos'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument('--loop', action='store_true', help='Sigue procesando hasta ser detenido')
+        parser.add_argument('--interval', type=float, default=1.0, help='Segundos de espera cuando la cola está vacía')
+
+    def handle(self, *args, **options):
+        queue_repository = DjangoStripeQueueRepository()
+        dispatch_use_case = DispatchStripePaymentIntentsUseCase(get_stripe_service(), queue_repository)
+        process_events_use_case = ProcessStripeEventsUseCase(queue_repository, DjangoPaymentRepository())
+
+        while True:
+            dispatched = dispatch_use_case.execute(options['batch_size'])
+            processed = process_events_use_case.execute(options['batch_size'])
+
+            if dispatched or processed:
+                self.stdout.write(f"Payment intents enviados: {dispatched}, eventos procesados: {processed}")
+
+            if not options['loop']:
+                break
+
+            if not dispatched and not processed:
+                time.sleep(options['interval'])
@@ -0,0 +1,61 @@
+# Generated by Django 5.1.2 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+BACKFILL_BATCH_SIZE = 2000
+
+TRIGRAM_INDEX_NAME = 'payments_receipt_number_trgm'
+
+
+def backfill_receipt_number_key(apps, schema_editor):
+    from payments.models import normalize_receipt_number
+
+    Payment = apps.get_model('payments', 'Payment')
+    queryset = Payment.objects.exclude(receipt_number__isnull=True).only('id', 'receipt_number').order_by('id')
+
+    last_id = 0
+    while True:
+        batch = list(queryset.filter(id__gt=last_id)[:BACKFILL_BATCH_SIZE])
+        if not batch:
+            break
+
+        for payment in batch:
+            payment.receipt_number_key = normalize_receipt_number(payment.receipt_number)
+        Payment.objects.bulk_update(batch, ['receipt_number_key'])
+        last_id = batch[-1].id
+
+
+def create_trigram_index(apps, schema_editor):
+    # The expression matches the SQL Django emits for receipt_number__icontains on PostgreSQL
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {TRIGRAM_INDEX_NAME} ON payments_payment '
+        'USING gin (UPPER(receipt_number::text) gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(f'DROP INDEX IF EXISTS {TRIGRAM_INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0003_alter_payment_paid_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='receipt_number_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=50, null=True),
+        ),
+        migrations.RunPython(backfill_receipt_number_key, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.2 on 2026-10-19 11:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0003_live_partial_indexes'),
+        ('payments', '0005_stripe_queue'),
+        ('therapists', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['-paid_at'], name='payment_live_paid_at_idx'),
+        ),
+    ]
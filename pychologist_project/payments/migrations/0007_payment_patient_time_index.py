@@ -0,0 +1,20 @@
+# Generated by Django 5.1.2 on 2026-10-19 11:17
+
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0004_patient_last_therapy_index'),
+        ('payments', '0006_live_partial_indexes'),
+        ('therapists', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(models.F('patient'), models.OrderBy(django.db.models.functions.comparison.Coalesce('paid_at', 'created_at'), descending=True), models.OrderBy(models.F('id'), descending=True), condition=models.Q(('deleted_at__isnull', True)), name='payment_patient_time_idx'),
+        ),
+    ]
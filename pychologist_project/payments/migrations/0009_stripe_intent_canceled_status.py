@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-19 12:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0008_stripe_event_claimed_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='stripepaymentintent',
+            name='status',
+            field=models.CharField(choices=[('QUEUED', 'En cola'), ('PROCESSING', 'Procesando'), ('CREATED', 'Creado'), ('SUCCEEDED', 'Exitoso'), ('CANCELED', 'Cancelado'), ('FAILED', 'Fallido')], default='QUEUED', max_length=10),
+        ),
+    ]
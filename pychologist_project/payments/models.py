@@ -1,5 +1,8 @@
+import re
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.utils import timezone
+from core.managers.live_manager import LiveManager
 
 PAYMENT_TYPES = [
         ('FREE', 'Gratis'),
@@ -8,6 +11,18 @@ PAYMENT_TYPES = [
         ('CARD', 'Tarjeta'),
     ]
 
+RECEIPT_KEY_STRIP = re.compile(r'[^0-9A-Z]')
+
+
+def normalize_receipt_number(value):
+    """
+    Normaliza un número de recibo para búsquedas indexadas: mayúsculas y sin separadores.
+    """
+    if value is None:
+        return None
+    return RECEIPT_KEY_STRIP.sub('', str(value).upper())
+
+
 class Payment(models.Model):
     PAYMENT_TYPES = PAYMENT_TYPES
     patient = models.ForeignKey('patients.Patient', on_delete=models.CASCADE, null=True)  
@@ -15,14 +30,39 @@ class Payment(models.Model):
     payment_type = models.CharField(max_length=10, choices=PAYMENT_TYPES)
     paid_at = models.DateTimeField(null=True)
     receipt_number = models.CharField(max_length=50, unique=True, blank=True, null=True)
+    # B-tree key used for exact/prefix receipt lookups on every backend
+    receipt_number_key = models.CharField(max_length=50, blank=True, null=True, db_index=True, editable=False)
     
     paid_to = models.ForeignKey('therapists.Therapist', on_delete=models.CASCADE, null=True)  
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True)
 
+    objects = models.Manager()
+    live = LiveManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-paid_at'], name='payment_live_paid_at_idx', condition=models.Q(deleted_at__isnull=True)),
+            # Patient timeline: payments ordered by when they happened (paid_at, or created_at while unpaid)
+            models.Index(
+                models.F('patient'),
+                Coalesce('paid_at', 'created_at').desc(),
+                models.F('id').desc(),
+                name='payment_patient_time_idx',
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
+
     def set_as_deleted(self):
         self.deleted_at = timezone.now()
+
+    def save(self, *args, **kwargs):
+        self.receipt_number_key = normalize_receipt_number(self.receipt_number)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'receipt_number' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'receipt_number_key'}
+        super().save(*args, **kwargs)
         
 
     def __str__(self):
@@ -36,4 +76,74 @@ class StripeProduct(models.Model):
     active = models.BooleanField(default=True)
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+class StripePaymentIntent(models.Model):
+    """
+    Payment intent queued for the Stripe gateway. The background processor creates it at Stripe,
+    webhooks move it to its final state (SUCCEEDED or CANCELED). A failed charge leaves it CREATED,
+    since the customer can retry the same intent; FAILED means it could not be created at Stripe.
+    """
+    STATUS_CHOICES = [
+        ('QUEUED', 'En cola'),
+        ('PROCESSING', 'Procesando'),
+        ('CREATED', 'Creado'),
+        ('SUCCEEDED', 'Exitoso'),
+        ('CANCELED', 'Cancelado'),
+        ('FAILED', 'Fallido'),
+    ]
+
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    currency = models.CharField(max_length=3, default='usd')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='QUEUED')
+    stripe_payment_intent_id = models.CharField(max_length=100, unique=True, null=True, blank=True)
+    client_secret = models.CharField(max_length=255, blank=True, default='')
+    patient = models.ForeignKey('patients.Patient', on_delete=models.SET_NULL, null=True, blank=True)
+    paid_to = models.ForeignKey('therapists.Therapist', on_delete=models.SET_NULL, null=True, blank=True)
+    payment = models.OneToOneField(Payment, on_delete=models.SET_NULL, null=True, blank=True)
+    # Only this user (or an admin) can poll the intent and read its client secret
+    created_by = models.ForeignKey('users.User', on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"PaymentIntent {self.stripe_payment_intent_id or self.id} - {self.status}"
+
+
+class StripeEvent(models.Model):
+    """
+    Webhook event received from Stripe, stored as-is and processed in the background.
+    """
+    STATUS_CHOICES = [
+        ('PENDING', 'Pendiente'),
+        ('PROCESSING', 'Procesando'),
+        ('PROCESSED', 'Procesado'),
+        ('FAILED', 'Fallido'),
+    ]
+
+    stripe_event_id = models.CharField(max_length=100, unique=True)
+    event_type = models.CharField(max_length=100)
+    payload = models.JSONField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+
+    received_at = models.DateTimeField(auto_now_add=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'received_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} ({self.stripe_event_id}) - {self.status}"
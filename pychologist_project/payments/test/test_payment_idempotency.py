@@ -0,0 +1,163 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.utils import timezone
+from django.core.cache import cache
+from unittest.mock import patch
+from rest_framework.test import APIClient
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import AccessToken
+from ..models import Payment
+from core.idempotency.idempotency import IdempotencyStore
+from core.idempotency.models import IdempotencyRecord
+
+
+class PaymentIdempotencyTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.admin_user = User.objects.create_superuser(
+            password='adminpass',
+            email='admin@example.com'
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.api_client = APIClient()
+        self.api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.admin_user)}')
+        self.payment_data = {
+            'receipt_number': 'IDEM-001',
+            'amount': 150.00,
+            'payment_type': 'CASH',
+        }
+
+    def test_retry_with_same_key_replays_response(self):
+        # Act
+        first = self.api_client.post('/payments/', data=self.payment_data, format='json', HTTP_IDEMPOTENCY_KEY='key-1')
+        second = self.api_client.post('/payments/', data=self.payment_data, format='json', HTTP_IDEMPOTENCY_KEY='key-1')
+
+        # Assert
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second['Idempotent-Replayed'], 'true')
+        self.assertEqual(first.data['data'], second.data['data'])
+        self.assertEqual(Payment.objects.filter(receipt_number='IDEM-001').count(), 1)
+
+    def test_retry_does_not_run_use_case_again(self):
+        # Arrange
+        self.api_client.post('/payments/', data=self.payment_data, format='json', HTTP_IDEMPOTENCY_KEY='key-2')
+
+        # Act
+        with patch('payments.core.app.use_cases.payment_use_cases.CreatePaymentUseCase.execute') as mock_execute:
+            response = self.api_client.post('/payments/', data=self.payment_data, format='json', HTTP_IDEMPOTENCY_KEY='key-2')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        mock_execute.assert_not_called()
+
+    def test_same_key_with_different_payload_is_rejected(self):
+        # Arrange
+        self.api_client.post('/payments/', data=self.payment_data, format='json', HTTP_IDEMPOTENCY_KEY='key-3')
+
+        # Act
+        other_payment = {**self.payment_data, 'amount': 200.00}
+        response = self.api_client.post('/payments/', data=other_payment, format='json', HTTP_IDEMPOTENCY_KEY='key-3')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(Payment.objects.count(), 1)
+
+    def test_concurrent_duplicate_in_progress_is_rejected(self):
+        # Arrange
+        store = IdempotencyStore('payment_create')
+        token = store.acquire_lock(f"{self.admin_user.id}_key-4")
+
+        # Act
+        with self.settings(IDEMPOTENCY_LOCK_WAIT=0):
+            response = self.api_client.post('/payments/', data=self.payment_data, format='json', HTTP_IDEMPOTENCY_KEY='key-4')
+
+        # Assert
+        self.assertIsNotNone(token)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(Payment.objects.exists())
+
+    def test_waiting_duplicate_takes_over_when_the_owner_fails(self):
+        # Arrange
+        store = IdempotencyStore('payment_create')
+        store_key = f"{self.admin_user.id}_key-6"
+        token = store.acquire_lock(store_key)
+
+        def owner_raises(seconds):
+            # The first request raised while this one was waiting: its finally block frees the key
+            store.release_lock(store_key, token)
+
+        # Act
+        with patch('core.idempotency.idempotency.time.sleep', side_effect=owner_raises):
+            response = self.api_client.post('/payments/', data=self.payment_data, format='json', HTTP_IDEMPOTENCY_KEY='key-6')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Payment.objects.filter(receipt_number='IDEM-001').count(), 1)
+        self.assertEqual(IdempotencyRecord.objects.get(key=store_key).status_code, status.HTTP_201_CREATED)
+
+    def test_record_survives_a_cache_flush(self):
+        # Arrange
+        self.api_client.post('/payments/', data=self.payment_data, format='json', HTTP_IDEMPOTENCY_KEY='key-5')
+        cache.clear()
+
+        # Act
+        response = self.api_client.post('/payments/', data=self.payment_data, format='json', HTTP_IDEMPOTENCY_KEY='key-5')
+
+        # Assert
+        self.assertEqual(response['Idempotent-Replayed'], 'true')
+        self.assertEqual(Payment.objects.filter(receipt_number='IDEM-001').count(), 1)
+
+
+class IdempotencyStoreTest(TestCase):
+    def setUp(self):
+        self.store = IdempotencyStore('store_test', ttl=60, lock_timeout=30)
+
+    def test_second_lock_on_same_key_is_refused(self):
+        # Act
+        first = self.store.acquire_lock('k')
+        second = self.store.acquire_lock('k')
+
+        # Assert
+        self.assertIsNotNone(first)
+        self.assertIsNone(second)
+
+    def test_lock_held_past_its_timeout_can_be_taken_over(self):
+        # Arrange
+        self.store.acquire_lock('k')
+        IdempotencyRecord.objects.filter(key='k').update(locked_until=timezone.now() - timedelta(seconds=1))
+
+        # Act
+        token = self.store.acquire_lock('k')
+
+        # Assert
+        self.assertIsNotNone(token)
+        self.assertEqual(IdempotencyRecord.objects.get(key='k').lock_token, token)
+
+    def test_releasing_without_a_record_frees_the_key(self):
+        # Arrange
+        token = self.store.acquire_lock('k')
+
+        # Act
+        self.store.release_lock('k', token)
+
+        # Assert
+        self.assertFalse(IdempotencyRecord.objects.exists())
+        self.assertIsNotNone(self.store.acquire_lock('k'))
+
+    def test_purge_expired_keeps_live_records(self):
+        # Arrange
+        self.store.acquire_lock('old')
+        self.store.acquire_lock('new')
+        IdempotencyRecord.objects.filter(key='old').update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        # Act
+        deleted = IdempotencyStore.purge_expired()
+
+        # Assert
+        self.assertEqual(deleted, 1)
+        self.assertEqual(list(IdempotencyRecord.objects.values_list('key', flat=True)), ['new'])
@@ -317,4 +317,67 @@ class TestPaymentRepository(TestCase):
         self.assertEqual(result.metadata.total_items, 2)
         
         # Verificar que se guardó en caché
-        self.mock_cache.set.assert_called_once_with(cache_key, result)
\ No newline at end of file
+        self.mock_cache.set.assert_called_once_with(cache_key, result)
+
+    def test_search_receipt_number_exact_uses_normalized_key(self):
+        # Arrange
+        Payment.objects.create(amount=100.00, receipt_number='abc-0001', paid_at=timezone.now())
+        Payment.objects.create(amount=100.00, receipt_number='ABC-00010', paid_at=timezone.now())
+        pagination_input = PaginationInput(page_number=1, page_size=10)
+
+        # Act
+        result = self.repository.search({'receipt_number': 'ABC0001', 'receipt_match': 'exact'}, pagination_input)
+
+        # Assert
+        self.assertEqual(result.metadata.total_items, 1)
+        self.assertEqual(result.items[0].receipt_number, 'abc-0001')
+
+    def test_search_receipt_number_prefix_uses_normalized_key(self):
+        # Arrange
+        Payment.objects.create(amount=100.00, receipt_number='REC-2024-001', paid_at=timezone.now())
+        Payment.objects.create(amount=100.00, receipt_number='REC-2024-002', paid_at=timezone.now())
+        Payment.objects.create(amount=100.00, receipt_number='XREC-2024-003', paid_at=timezone.now())
+        pagination_input = PaginationInput(page_number=1, page_size=10)
+
+        # Act
+        result = self.repository.search({'receipt_number': 'rec 2024', 'receipt_match': 'prefix'}, pagination_input)
+
+        # Assert
+        self.assertEqual(result.metadata.total_items, 2)
+        self.assertNotIn('XREC-2024-003', [payment.receipt_number for payment in result.items])
+
+    def test_search_receipt_number_defaults_to_contains(self):
+        # Arrange
+        Payment.objects.create(amount=100.00, receipt_number='REC-2024-001', paid_at=timezone.now())
+        Payment.objects.create(amount=100.00, receipt_number='2024-001-B', paid_at=timezone.now())
+        pagination_input = PaginationInput(page_number=1, page_size=10)
+
+        # Act
+        result = self.repository.search({'receipt_number': '2024-001'}, pagination_input)
+
+        # Assert
+        self.assertEqual(result.metadata.total_items, 2)
+
+    def test_receipt_number_key_is_kept_in_sync(self):
+        # Arrange
+        payment = Payment.objects.create(amount=100.00, receipt_number='ab-12')
+
+        # Act
+        payment.receipt_number = 'cd-34'
+        payment.save(update_fields=['receipt_number'])
+
+        # Assert
+        payment.refresh_from_db()
+        self.assertEqual(payment.receipt_number_key, 'CD34')
+
+    def test_search_excludes_soft_deleted_payments(self):
+        # Arrange
+        Payment.objects.create(amount=100.00, receipt_number='LIVE-001', paid_at=timezone.now())
+        Payment.objects.create(amount=100.00, receipt_number='LIVE-002', paid_at=timezone.now(), deleted_at=timezone.now())
+        pagination_input = PaginationInput(page_number=1, page_size=10)
+
+        # Act
+        result = self.repository.search({'receipt_number': 'LIVE'}, pagination_input)
+
+        # Assert
+        self.assertEqual([payment.receipt_number for payment in result.items], ['LIVE-001'])
@@ -0,0 +1,242 @@
+import json
+import time
+from datetime import timedelta
+from django.test import TestCase
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import AccessToken
+from ..models import Payment, StripePaymentIntent, StripeEvent
+from ..core.app.stripe_services import StripeGatewayError
+from ..core.infrastructure.stripe.stripe_http_service import StripeHttpService
+from ..core.infrastructure.repository.django_stripe_queue_repository import DjangoStripeQueueRepository
+from ..core.infrastructure.stripe.fake_stripe_transport import FakeStripeTransport, build_fake_stripe_session
+from ..core.infrastructure.stripe.stripe_webhooks import compute_stripe_signature, parse_stripe_event
+
+WEBHOOK_URL = '/payments/stripe/webhook/'
+PAYMENT_INTENTS_URL = '/payments/stripe/payment-intents/'
+
+
+def build_service(transport: FakeStripeTransport, max_retries: int = 2) -> StripeHttpService:
+    return StripeHttpService(
+        api_key='sk_test',
+        session=build_fake_stripe_session(transport),
+        max_retries=max_retries,
+        backoff=0,
+    )
+
+
+class StripeHttpServiceTest(TestCase):
+    def test_create_payment_intent_in_minor_units(self):
+        # Arrange
+        transport = FakeStripeTransport()
+
+        # Act
+        intent = build_service(transport).create_payment_intent(12.5, 'usd')
+
+        # Assert
+        self.assertEqual(intent['amount'], 1250)
+        self.assertTrue(intent['client_secret'])
+
+    def test_retries_server_errors_with_same_idempotency_key(self):
+        # Arrange
+        transport = FakeStripeTransport(failures=2, failure_status=503)
+
+        # Act
+        intent = build_service(transport).create_payment_intent(20, 'usd', idempotency_key='pi-key')
+
+        # Assert
+        self.assertEqual(len(transport.request_log), 3)
+        self.assertEqual({entry[2] for entry in transport.request_log}, {'pi-key'})
+        self.assertEqual(len(transport.payment_intents), 1)
+        self.assertTrue(intent['id'].startswith('pi_'))
+
+    def test_raises_retryable_error_when_retries_exhausted(self):
+        # Arrange
+        transport = FakeStripeTransport(failures=5, failure_status=503)
+
+        # Act / Assert
+        with self.assertRaises(StripeGatewayError) as context:
+            build_service(transport, max_retries=1).create_payment_intent(20, 'usd')
+
+        self.assertTrue(context.exception.retryable)
+        self.assertEqual(len(transport.request_log), 2)
+
+
+class StripePipelineTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.admin_user = User.objects.create_superuser(
+            password='adminpass',
+            email='admin@example.com'
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.api_client = APIClient()
+        self.api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.admin_user)}')
+
+    def _send_webhook(self, event: dict, secret: str = 'whsec_test'):
+        payload = json.dumps(event).encode('utf-8')
+        timestamp = int(time.time())
+        signature = compute_stripe_signature(payload, secret, timestamp)
+        return APIClient().post(
+            WEBHOOK_URL,
+            data=payload,
+            content_type='application/json',
+            HTTP_STRIPE_SIGNATURE=f't={timestamp},v1={signature}',
+        )
+
+    def test_webhook_rejects_invalid_signature(self):
+        # Act
+        response = self._send_webhook({'id': 'evt_1', 'type': 'payment_intent.succeeded'}, secret='wrong')
+
+        # Assert
+        self.assertEqual(response.data['status_code'], status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(StripeEvent.objects.exists())
+
+    def test_webhook_is_rejected_when_secret_is_not_configured(self):
+        # Act
+        with self.settings(STRIPE_WEBHOOK_SECRET=''):
+            response = self._send_webhook({'id': 'evt_1', 'type': 'payment_intent.succeeded'}, secret='')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertFalse(StripeEvent.objects.exists())
+
+    def test_empty_secret_never_verifies_a_signature(self):
+        # Arrange
+        payload = b'{"id": "evt_1", "type": "payment_intent.succeeded"}'
+        timestamp = int(time.time())
+        header = f't={timestamp},v1={compute_stripe_signature(payload, "", timestamp)}'
+
+        # Act / Assert
+        with self.assertRaises(ImproperlyConfigured):
+            parse_stripe_event(payload, header, '')
+
+    def test_webhook_ignores_duplicate_deliveries(self):
+        # Arrange
+        event = {'id': 'evt_dup', 'type': 'customer.created', 'data': {'object': {}}}
+
+        # Act
+        first = self._send_webhook(event)
+        second = self._send_webhook(event)
+
+        # Assert
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertTrue(second.data['data']['duplicate'])
+        self.assertEqual(StripeEvent.objects.count(), 1)
+
+    def test_queued_intent_becomes_payment_after_webhook(self):
+        # Arrange
+        response = self.api_client.post(PAYMENT_INTENTS_URL, data={'amount': '150.00'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['data']['status'], 'QUEUED')
+        intent_id = response.data['data']['id']
+
+        # Act
+        call_command('process_stripe_queue')
+        polled = self.api_client.get(PAYMENT_INTENTS_URL, {'id': intent_id})
+
+        stripe_id = polled.data['data']['stripe_payment_intent_id']
+        self._send_webhook({
+            'id': 'evt_success',
+            'type': 'payment_intent.succeeded',
+            'data': {'object': {'id': stripe_id, 'object': 'payment_intent'}},
+        })
+        call_command('process_stripe_queue')
+
+        # Assert
+        self.assertEqual(polled.data['data']['status'], 'CREATED')
+        self.assertTrue(polled.data['data']['client_secret'])
+
+        intent = StripePaymentIntent.objects.get(id=intent_id)
+        self.assertEqual(intent.status, 'SUCCEEDED')
+        self.assertEqual(Payment.objects.get(id=intent.payment_id).payment_type, 'CARD')
+        self.assertEqual(StripeEvent.objects.get(stripe_event_id='evt_success').status, 'PROCESSED')
+
+    def test_event_received_long_ago_is_not_reclaimed_while_its_claim_is_fresh(self):
+        # Arrange
+        self._send_webhook({'id': 'evt_old', 'type': 'customer.created', 'data': {'object': {}}})
+        StripeEvent.objects.update(received_at=timezone.now() - timedelta(hours=1))
+        repository = DjangoStripeQueueRepository()
+        first_claim = repository.claim_events(10)
+
+        # Act
+        second_claim = repository.claim_events(10)
+
+        # Assert
+        self.assertEqual(len(first_claim), 1)
+        self.assertEqual(second_claim, [])
+
+    def test_second_success_event_for_same_intent_does_not_pay_twice(self):
+        # Arrange
+        response = self.api_client.post(PAYMENT_INTENTS_URL, data={'amount': '80.00'}, format='json')
+        call_command('process_stripe_queue')
+        stripe_id = StripePaymentIntent.objects.get(id=response.data['data']['id']).stripe_payment_intent_id
+
+        # Act
+        for event_id in ('evt_first', 'evt_second'):
+            self._send_webhook({
+                'id': event_id,
+                'type': 'payment_intent.succeeded',
+                'data': {'object': {'id': stripe_id, 'object': 'payment_intent'}},
+            })
+        call_command('process_stripe_queue')
+
+        # Assert
+        self.assertEqual(Payment.objects.filter(payment_type='CARD').count(), 1)
+        self.assertEqual(StripeEvent.objects.filter(status='PROCESSED').count(), 2)
+
+    def test_failed_charge_can_still_succeed_on_retry(self):
+        # Arrange
+        response = self.api_client.post(PAYMENT_INTENTS_URL, data={'amount': '60.00'}, format='json')
+        call_command('process_stripe_queue')
+        intent = StripePaymentIntent.objects.get(id=response.data['data']['id'])
+        payment_object = {'id': intent.stripe_payment_intent_id, 'object': 'payment_intent'}
+
+        # Act
+        self._send_webhook({
+            'id': 'evt_declined',
+            'type': 'payment_intent.payment_failed',
+            'data': {'object': {**payment_object, 'last_payment_error': {'message': 'Your card was declined.'}}},
+        })
+        call_command('process_stripe_queue')
+        intent.refresh_from_db()
+        after_failure = (intent.status, intent.last_error)
+        self._send_webhook({'id': 'evt_retried', 'type': 'payment_intent.succeeded', 'data': {'object': payment_object}})
+        call_command('process_stripe_queue')
+
+        # Assert
+        intent.refresh_from_db()
+        self.assertEqual(after_failure, ('CREATED', 'Your card was declined.'))
+        self.assertEqual(intent.status, 'SUCCEEDED')
+        self.assertEqual(Payment.objects.get(id=intent.payment_id).amount, 60)
+
+    def test_payment_intent_is_only_visible_to_its_creator_and_admins(self):
+        # Arrange
+        User = get_user_model()
+        owner = User.objects.create_user(email='owner@example.com', password='secret123', role='PATIENT')
+        other = User.objects.create_user(email='other@example.com', password='secret123', role='PATIENT')
+        owner_client = APIClient()
+        owner_client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(owner)}')
+        other_client = APIClient()
+        other_client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(other)}')
+        intent_id = owner_client.post(PAYMENT_INTENTS_URL, data={'amount': '40.00'}, format='json').data['data']['id']
+
+        # Act
+        owner_response = owner_client.get(PAYMENT_INTENTS_URL, {'id': intent_id})
+        other_response = other_client.get(PAYMENT_INTENTS_URL, {'id': intent_id})
+        admin_response = self.api_client.get(PAYMENT_INTENTS_URL, {'id': intent_id})
+
+        # Assert
+        self.assertEqual(owner_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(other_response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn('client_secret', str(other_response.data))
+        self.assertEqual(admin_response.status_code, status.HTTP_200_OK)
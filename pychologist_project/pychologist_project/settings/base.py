@@ -75,6 +75,14 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'pychologist_project.wsgi.application'
 
+# Cache. Version counters, the cached principal, the token blacklist cache and the
+# user listing are invalidated by writing to this cache, so every worker must see
+# the same one: production must set CACHE_URL to a shared backend (e.g. redis://).
+# The local-memory default is per process and only fit for development and tests.
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -96,7 +104,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.core.presentation.api.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_THROTTLE_CLASSES': [
@@ -119,6 +127,17 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
 }
 
+# Password hashing: at most this many hashes run at once on the host, across all worker processes.
+# A login or signup waits up to the queue timeout (seconds) for a slot and then gets a 503.
+# The wait blocks a sync worker, so keep the timeout close to one hash (~0.1s) and well below the
+# per-request worker budget (e.g. gunicorn --timeout); benchmark_login_storm prints both latencies.
+PASSWORD_HASHING_CONCURRENCY = env.int('PASSWORD_HASHING_CONCURRENCY', default=max(1, (os.cpu_count() or 2) // 2))
+PASSWORD_HASHING_QUEUE_TIMEOUT = env.float('PASSWORD_HASHING_QUEUE_TIMEOUT', default=0.1)
+PASSWORD_HASHING_LOCK_DIR = env('PASSWORD_HASHING_LOCK_DIR', default=None)
+
+# In-memory filter of registered emails that answers most signup "email taken?" checks without a query
+USER_EMAIL_FILTER_ENABLED = env.bool('USER_EMAIL_FILTER_ENABLED', default=True)
+
 # Logging
 LOGGING = {
     'version': 1,
@@ -145,9 +164,32 @@ TWILIO_ACCOUNT_SID = env('TWILIO_ACCOUNT_SID')
 TWILIO_AUTH_TOKEN = env('TWILIO_AUTH_TOKEN')
 TWILIO_PHONE_NUMBER = env('TWILIO_PHONE_NUMBER')
 
+# Idempotency-Key handling for payment creation. Records and locks live in the
+# core IdempotencyRecord table, so retries are deduplicated across workers and hosts.
+IDEMPOTENCY_TTL = 60 * 60 * 24
+IDEMPOTENCY_LOCK_TIMEOUT = 30
+IDEMPOTENCY_LOCK_WAIT = 5
+
+# Stripe
+STRIPE_SECRET_KEY = env('STRIPE_SECRET_KEY', default='')
+# Webhooks are answered with 503 until a signing secret is configured
+STRIPE_WEBHOOK_SECRET = env('STRIPE_WEBHOOK_SECRET', default='')
+STRIPE_API_BASE = env('STRIPE_API_BASE', default='https://api.stripe.com')
+STRIPE_CONNECT_TIMEOUT = env.float('STRIPE_CONNECT_TIMEOUT', default=3.05)
+STRIPE_READ_TIMEOUT = env.float('STRIPE_READ_TIMEOUT', default=20)
+STRIPE_MAX_RETRIES = env.int('STRIPE_MAX_RETRIES', default=2)
+STRIPE_RETRY_BACKOFF = env.float('STRIPE_RETRY_BACKOFF', default=0.5)
+STRIPE_POOL_CONNECTIONS = env.int('STRIPE_POOL_CONNECTIONS', default=10)
+STRIPE_POOL_MAXSIZE = env.int('STRIPE_POOL_MAXSIZE', default=20)
+STRIPE_USE_FAKE = env.bool('STRIPE_USE_FAKE', default=False)
+
 # Cronjobs
 CRONJOBS = [
     ('*/15 * * * *', 'your_app.management.commands.send_reminders.Command'),
+    ('* * * * *', 'django.core.management.call_command', ['process_stripe_queue']),
+    ('*/10 * * * *', 'django.core.management.call_command', ['detect_duplicate_patients']),
+    ('30 * * * *', 'django.core.management.call_command', ['prune_expired_tokens']),
+    ('45 * * * *', 'django.core.management.call_command', ['purge_idempotency_records']),
 ]
 
 # CORS
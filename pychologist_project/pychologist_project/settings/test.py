@@ -16,4 +16,7 @@ DEBUG = False
 SECRET_KEY = 'test-secret-key'
 PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.MD5PasswordHasher',
-]
\ No newline at end of file
+]
+STRIPE_USE_FAKE = True
+STRIPE_WEBHOOK_SECRET = 'whsec_test'
+STRIPE_RETRY_BACKOFF = 0
@@ -10,8 +10,9 @@ from core.log.views import AuditLogListView
 from therapists.core.infrastructure.adapters.views.therapist_manager_views import TherapistViewSet
 
 from payments.core.infrastructure.api.views.payment_manager_view import PaymentViewSet
+from payments.core.infrastructure.api.views.stripe_views import StripePaymentIntentView, StripeWebhookView
 
-from therapy.views import TherapySessionViewSet
+from therapy.views import TherapySessionViewSet, SessionCalendarFeedLinkView, SessionCalendarFeedView
 
 from users.core.presentation.api.controllers.user_manager_views import UserViewSet
 from users.core.presentation.api.controllers.auth_views import SignupView, LoginView, LogoutView, RefreshSessionView
@@ -43,6 +44,14 @@ urlpatterns = [
     path('home/', HomeView.as_view(), name='home'),
     path('profiles/', ProfileView.as_view(), name='profile'),
 
+    # Calendar feeds
+    path('calendar/feed/', SessionCalendarFeedLinkView.as_view(), name='session_calendar_feed_link'),
+    path('calendar/feed/<str:token>.ics', SessionCalendarFeedView.as_view(), name='session_calendar_feed'),
+
+    # Stripe
+    path('payments/stripe/payment-intents/', StripePaymentIntentView.as_view(), name='stripe_payment_intents'),
+    path('payments/stripe/webhook/', StripeWebhookView.as_view(), name='stripe_webhook'),
+
     # General APIs
     path('', include(router.urls)),
 
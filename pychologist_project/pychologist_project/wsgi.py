@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pychologist_project.settings')
 
 application = get_wsgi_application()
+
+# Build the in-memory email filter before the worker takes requests, so no signup pays for it
+from users.core.data.service.registered_email_filter import RegisteredEmailFilter  # noqa: E402
+
+RegisteredEmailFilter.warm_up()
@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import List, Tuple
+
+# (start, end, status, patient ids): everything the calendar draws, without notes or payment data
+CalendarSlot = Tuple[datetime, datetime, str, Tuple[int, ...]]
+
+
+@dataclass
+class CalendarDay:
+    """Sesiones de un terapeuta en un día, ordenadas por hora de inicio."""
+    day: date
+    slots: List[CalendarSlot] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            'date': self.day.isoformat(),
+            'sessions': [
+                [start.isoformat(), end.isoformat(), status, list(patient_ids)]
+                for start, end, status, patient_ids in self.slots
+            ],
+        }
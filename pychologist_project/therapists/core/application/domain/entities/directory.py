@@ -0,0 +1,32 @@
+from dataclasses import asdict, dataclass, field
+from typing import List
+from core.pagination.page_helper import PaginatedResponse
+
+
+@dataclass
+class TherapistDirectoryEntry:
+    """Ficha pública de un terapeuta en el directorio."""
+    id: int
+    name: str
+    specialization: str
+
+
+@dataclass
+class SpecializationFacet:
+    """Número de terapeutas de una especialidad que coinciden con la búsqueda."""
+    specialization: str
+    count: int
+
+
+@dataclass
+class TherapistDirectoryPage:
+    """Página del directorio junto con los conteos por especialidad de toda la búsqueda."""
+    page: PaginatedResponse[TherapistDirectoryEntry]
+    facets: List[SpecializationFacet] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            'items': [asdict(entry) for entry in self.page.items],
+            'facets': [asdict(facet) for facet in self.facets],
+            'pagination': asdict(self.page.metadata),
+        }
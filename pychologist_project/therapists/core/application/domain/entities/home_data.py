@@ -1,6 +1,13 @@
 class HomeDataEntity:
-    def __init__(self, patient_count=0, incoming_session_count=0, therapist_name="", profile_picture=None):
+    def __init__(self, patient_count=0, incoming_session_count=0, therapist_name="", profile_picture=None,
+                 therapist_id=None, next_incoming_start=None):
         self.patient_count = patient_count
         self.incoming_session_count = incoming_session_count
         self.therapist_name = therapist_name
         self.profile_picture = profile_picture
+        self.therapist_id = therapist_id
+        self.next_incoming_start = next_incoming_start
+
+    def incoming_expired(self, now) -> bool:
+        """True cuando alguna sesión contada como próxima ya ha empezado y el contador debe recalcularse."""
+        return self.next_incoming_start is not None and self.next_incoming_start <= now
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+
+def week_start(day: date) -> date:
+    """Lunes de la semana del día dado, igual que TruncWeek."""
+    return day - timedelta(days=day.weekday())
+
+
+@dataclass
+class TherapistWeeklyUtilization:
+    """Carga de trabajo de un terapeuta en una semana (de lunes a domingo)."""
+    therapist_id: int
+    week_start: date
+    session_count: int = 0
+    booked_hours: float = 0.0
+    completed_count: int = 0
+    cancelled_count: int = 0
+    participant_count: int = 0
+    no_show_count: int = 0
+
+    @property
+    def completion_rate(self) -> float:
+        return self._ratio(self.completed_count, self.session_count)
+
+    @property
+    def cancellation_rate(self) -> float:
+        return self._ratio(self.cancelled_count, self.session_count)
+
+    @property
+    def no_show_rate(self) -> float:
+        return self._ratio(self.no_show_count, self.participant_count)
+
+    def to_dict(self) -> dict:
+        return {
+            'therapist_id': self.therapist_id,
+            'week_start': self.week_start,
+            'session_count': self.session_count,
+            'booked_hours': self.booked_hours,
+            'completed_count': self.completed_count,
+            'cancelled_count': self.cancelled_count,
+            'completion_rate': self.completion_rate,
+            'cancellation_rate': self.cancellation_rate,
+            'participant_count': self.participant_count,
+            'no_show_count': self.no_show_count,
+            'no_show_rate': self.no_show_rate,
+        }
+
+    @staticmethod
+    def _ratio(part: int, total: int) -> float:
+        return round(part / total, 4) if total else 0.0
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Dict, Iterable, List
+from ....application.domain.entities.calendar import CalendarDay
+
+
+class TherapistCalendarRepository(ABC):
+    @abstractmethod
+    def get_days(self, therapist_id: int, first_day: date, last_day: date) -> List[CalendarDay]:
+        pass
+
+    @abstractmethod
+    def invalidate(self, therapist_id: int, start_time: datetime) -> None:
+        pass
+
+    @abstractmethod
+    def get_change_versions(self, therapist_ids: Iterable[int]) -> Dict[int, float]:
+        """Time of the last session write of each therapist, for conditional requests."""
+        pass
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+from ....application.domain.entities.home_data import HomeDataEntity
+
+
+class TherapistDashboardRepository(ABC):
+    @abstractmethod
+    def get_by_user_id(self, user_id: int) -> Optional[HomeDataEntity]:
+        pass
+
+    @abstractmethod
+    def add_patients(self, therapist_id: int, session_id: int, patient_ids: Iterable[int]) -> None:
+        pass
+
+    @abstractmethod
+    def remove_patients(self, therapist_id: int, session_id: int, patient_ids: Iterable[int]) -> None:
+        pass
+
+    @abstractmethod
+    def change_incoming(self, therapist_id: int, delta: int, start_time: Optional[datetime] = None) -> None:
+        pass
+
+    @abstractmethod
+    def count(self, therapist_id: int) -> Tuple[int, int, Optional[datetime]]:
+        pass
+
+    @abstractmethod
+    def rebuild(self, therapist_id: int) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate_user(self, user_id: int) -> None:
+        pass
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Optional
 from ....application.domain.entities.therapist import TherapistEntity
+from ....application.domain.entities.directory import TherapistDirectoryPage
+from core.pagination.page_helper import PaginationInput
 
 class TherapistRepository(ABC):
     @abstractmethod
@@ -10,6 +13,18 @@ class TherapistRepository(ABC):
     def get_by_user_id(self, user_id : int) -> TherapistEntity:
         pass
     
+    @abstractmethod
+    def get_many_by_ids(self, therapist_ids : Iterable[int]) -> Dict[int, TherapistEntity]:
+        pass
+
+    @abstractmethod
+    def get_many_by_user_ids(self, user_ids : Iterable[int]) -> Dict[int, TherapistEntity]:
+        pass
+    
+    @abstractmethod
+    def search_directory(self, filters : Optional[Dict[str, Any]], pagination_input : PaginationInput) -> TherapistDirectoryPage:
+        pass
+
     @abstractmethod
     def save(self, therapist : TherapistEntity) -> TherapistEntity:
         pass
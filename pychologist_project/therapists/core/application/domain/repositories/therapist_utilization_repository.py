@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import List, Optional
+from ....application.domain.entities.utilization import TherapistWeeklyUtilization
+
+
+class TherapistUtilizationRepository(ABC):
+    @abstractmethod
+    def get_weekly(self, therapist_ids: Optional[List[int]], first_week: date, last_week: date) -> List[TherapistWeeklyUtilization]:
+        pass
+
+    @abstractmethod
+    def invalidate(self, therapist_id: int, start_time: datetime) -> None:
+        pass
@@ -1,29 +1,86 @@
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+from django.utils import timezone
 from core.exceptions.custom_exceptions import EntityNotFoundError
 from ...core.application.domain.entities.home_data import HomeDataEntity
 from ...core.application.domain.entities.therapist import TherapistEntity
 from ..application.domain.repositories.therapist_repository import TherapistRepository
+from ..application.domain.repositories.therapist_dashboard_repository import TherapistDashboardRepository
+from ..application.domain.repositories.therapist_utilization_repository import TherapistUtilizationRepository
+from ..application.domain.repositories.therapist_calendar_repository import TherapistCalendarRepository
+from ..application.domain.entities.calendar import CalendarDay
+from ..application.domain.entities.utilization import TherapistWeeklyUtilization, week_start
+from ..application.domain.entities.directory import TherapistDirectoryPage
+from core.pagination.page_helper import PaginationInput
 from ...models import Therapist
 from core.mappers.therapist.therapist_mappers import TherapistMapper
 
+MAX_BATCH_SIZE = 100
+MAX_DIRECTORY_PAGE_SIZE = 100
+DEFAULT_UTILIZATION_WEEKS = 4
+MAX_UTILIZATION_WEEKS = 26
+# A month view with the surrounding weeks
+MAX_CALENDAR_DAYS = 62
+
 class GetTherapistHomeDataUseCase:
-    def __init__(self, therapist_repository : TherapistRepository):
-        self.therapist_repository = therapist_repository
+    def __init__(self, dashboard_repository : TherapistDashboardRepository):
+        self.dashboard_repository = dashboard_repository
     
-    def execute(self, user_id):
-        therapist = self.therapist_repository.get_by_user_id(user_id)
-        if not therapist:
+    def execute(self, user_id) -> HomeDataEntity:
+        home_data = self.dashboard_repository.get_by_user_id(user_id)
+        if not home_data:
             raise EntityNotFoundError("Therapist", user_id)
-        
-        patient_count = self.therapist_repository.get_unique_patient_count(therapist.id)
-        incoming_session_count = self.therapist_repository.get_incoming_session_count(therapist.id)
-        
-        return HomeDataEntity(
-            patient_count=patient_count,
-            incoming_session_count=incoming_session_count,
-            therapist_name=therapist.name,
-            profile_picture=None  #ADAPTER
-        )
+
+        return home_data
     
+class GetTherapistUtilizationUseCase:
+    def __init__(self, utilization_repository : TherapistUtilizationRepository):
+        self.utilization_repository = utilization_repository
+
+    def execute(self, start: Optional[str] = None, end: Optional[str] = None, therapist_ids: Optional[List[int]] = None) -> List[TherapistWeeklyUtilization]:
+        last_week = week_start(self._parse_date(end, 'end') if end else timezone.localdate())
+        if start:
+            first_week = week_start(self._parse_date(start, 'start'))
+        else:
+            first_week = last_week - timedelta(weeks=DEFAULT_UTILIZATION_WEEKS - 1)
+
+        if first_week > last_week:
+            raise ValueError("'start' debe ser anterior a 'end'")
+        if (last_week - first_week).days // 7 + 1 > MAX_UTILIZATION_WEEKS:
+            raise ValueError(f"El periodo no puede superar las {MAX_UTILIZATION_WEEKS} semanas")
+
+        return self.utilization_repository.get_weekly(therapist_ids or None, first_week, last_week)
+
+    def _parse_date(self, value: str, field: str) -> date:
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise ValueError(f"El formato de '{field}' debe ser 'YYYY-MM-DD'.")
+
+
+class GetTherapistCalendarUseCase:
+    def __init__(self, calendar_repository : TherapistCalendarRepository):
+        self.calendar_repository = calendar_repository
+
+    def execute(self, therapist_id: int, start: Optional[str] = None, end: Optional[str] = None) -> List[CalendarDay]:
+        """Días con sesiones del terapeuta entre start y end (ambos incluidos); por defecto, la semana actual."""
+        first_day = self._parse_date(start, 'start') if start else week_start(timezone.localdate())
+        last_day = self._parse_date(end, 'end') if end else first_day + timedelta(days=6)
+
+        if first_day > last_day:
+            raise ValueError("'start' debe ser anterior a 'end'")
+        if (last_day - first_day).days + 1 > MAX_CALENDAR_DAYS:
+            raise ValueError(f"El periodo no puede superar los {MAX_CALENDAR_DAYS} días")
+
+        return self.calendar_repository.get_days(therapist_id, first_day, last_day)
+
+    def _parse_date(self, value: str, field: str) -> date:
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise ValueError(f"El formato de '{field}' debe ser 'YYYY-MM-DD'.")
+
+
 class CreateTherapistUseCase:
     def __init__(self, therapist_repository : TherapistRepository):
         self.therapist_repository = therapist_repository
@@ -44,6 +101,36 @@ class CreateTherapistUseCase:
         return TherapistMapper.to_model(created_entity)
 
 
+class GetTherapistsBatchUseCase:
+    def __init__(self, therapist_repository : TherapistRepository):
+        self.therapist_repository = therapist_repository
+
+    def execute(self, therapist_ids : List[int]) -> List[TherapistEntity]:
+        """Devuelve los terapeutas encontrados en el orden pedido; los IDs inexistentes se omiten."""
+        therapist_ids = list(dict.fromkeys(therapist_ids))
+        if not therapist_ids:
+            raise ValueError("Debe indicar al menos un ID")
+        if len(therapist_ids) > MAX_BATCH_SIZE:
+            raise ValueError(f"No se pueden pedir más de {MAX_BATCH_SIZE} terapeutas a la vez")
+
+        therapists = self.therapist_repository.get_many_by_ids(therapist_ids)
+        return [therapists[therapist_id] for therapist_id in therapist_ids if therapist_id in therapists]
+
+
+class SearchTherapistDirectoryUseCase:
+    def __init__(self, therapist_repository : TherapistRepository):
+        self.therapist_repository = therapist_repository
+
+    def execute(self, filters : dict, pagination_input : PaginationInput) -> TherapistDirectoryPage:
+        """Busca terapeutas por prefijo del nombre y especialidad, con los conteos por especialidad."""
+        if pagination_input.page_number < 1 or pagination_input.page_size < 1:
+            raise ValueError("La página y su tamaño deben ser mayores que cero")
+        if pagination_input.page_size > MAX_DIRECTORY_PAGE_SIZE:
+            raise ValueError(f"El tamaño de página no puede superar {MAX_DIRECTORY_PAGE_SIZE}")
+
+        return self.therapist_repository.search_directory(filters, pagination_input)
+
+
 class GetTherapistByUserUseCase:
     def __init__(self, therapist_repository : TherapistRepository):
         self.therapist_repository = therapist_repository
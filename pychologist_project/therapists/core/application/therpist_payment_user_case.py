@@ -3,14 +3,13 @@ from payments.models import Payment
 from core.exceptions.custom_exceptions import EntityNotFoundError
 from core.mappers.payment.payment_mappers import PaymentMapper
 from core.pagination.page_helper import PaginatedResponse, PaginationInput
-from ...models import Therapist
 
 class GetTherapistPaymentsListUseCase:
     def __init__(self, payment_repository : PaymentRepository):
         self.payment_repository = payment_repository
     
-    def execute(self, therapist : Therapist, page_input : PaginationInput) -> PaginatedResponse[Payment]:
-        pageable_payments = self.payment_repository.get_pageable_by_therapist_id(therapist.id, page_input)
+    def execute(self, therapist_id : int, page_input : PaginationInput) -> PaginatedResponse[Payment]:
+        pageable_payments = self.payment_repository.get_pageable_by_therapist_id(therapist_id, page_input)
         if len(pageable_payments.items) > 0:
             return pageable_payments
 
@@ -24,8 +23,8 @@ class GetTherapistPaymentUseCase:
     def __init__(self, payment_repository : PaymentRepository):
         self.payment_repository = payment_repository
     
-    def execute(self, therapist, payment_id) -> Payment:
-        payment = self.payment_repository.get_pageable_by_therapist_id(therapist.id, payment_id)
+    def execute(self, therapist_id : int, payment_id) -> Payment:
+        payment = self.payment_repository.get_pageable_by_therapist_id(therapist_id, payment_id)
         if not payment:
             raise EntityNotFoundError('payment')
 
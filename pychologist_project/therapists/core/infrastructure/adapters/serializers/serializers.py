@@ -24,7 +24,7 @@ class TherapistSerializer(serializers.ModelSerializer):
     
 
 class HomeDataSerializer(serializers.Serializer):
-    therapist_patient_count = serializers.IntegerField()
+    therapist_patient_count = serializers.IntegerField(source='patient_count')
     incoming_session_count = serializers.IntegerField()
-    name = serializers.CharField()
-    profile_picture = serializers.CharField()
+    name = serializers.CharField(source='therapist_name')
+    profile_picture = serializers.CharField(allow_null=True)
@@ -1,11 +1,24 @@
 from rest_framework.viewsets import ModelViewSet
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 from core.api_response.response import DjangoResponseWrapper as ResponseWrapper
+from core.pagination.page_helper import get_pagination_data
+from core.permissions import IsOwnTherapistOrAdmin
 from .....models import Therapist
 from ..serializers.serializers import TherapistSerializer
-from ....application.therapist_use_case import CreateTherapistUseCase, UpdateTherapistUseCase, DeleteTherapistUseCase
+from ....application.therapist_use_case import (
+    CreateTherapistUseCase,
+    UpdateTherapistUseCase,
+    DeleteTherapistUseCase,
+    GetTherapistUtilizationUseCase,
+    GetTherapistCalendarUseCase,
+    GetTherapistsBatchUseCase,
+    SearchTherapistDirectoryUseCase
+)
 from ...repositories.django_therapist_repository import DjangoTherapistRepository
+from ...repositories.django_therapist_utilization_repository import DjangoTherapistUtilizationRepository
+from ...repositories.django_therapist_calendar_repository import DjangoTherapistCalendarRepository
 import logging
 
 audit_logger = logging.getLogger('audit_logger')
@@ -17,6 +30,10 @@ class TherapistViewSet(ModelViewSet):
         self.create_therapist_use_case = CreateTherapistUseCase(repository)
         self.update_therapist_use_case = UpdateTherapistUseCase(repository)
         self.delete_therapist_use_case = DeleteTherapistUseCase(repository)
+        self.get_therapists_batch_use_case = GetTherapistsBatchUseCase(repository)
+        self.search_directory_use_case = SearchTherapistDirectoryUseCase(repository)
+        self.get_utilization_use_case = GetTherapistUtilizationUseCase(DjangoTherapistUtilizationRepository())
+        self.get_calendar_use_case = GetTherapistCalendarUseCase(DjangoTherapistCalendarRepository())
 
     """
     ViewSet to manage therapist data. Only administrators can access these endpoints.
@@ -80,6 +97,177 @@ class TherapistViewSet(ModelViewSet):
             entity='therapists'
         )
 
+    @extend_schema(
+        summary="Batch therapist lookup",
+        description="Returns several therapists in one request, in the order of `ids`. "
+                    "Unknown IDs are skipped. At most 100 IDs. Requires authentication.",
+        responses={
+            200: OpenApiTypes.OBJECT,
+            400: OpenApiTypes.OBJECT,
+            401: OpenApiTypes.OBJECT,
+        },
+        parameters=[
+            OpenApiParameter(
+                name='ids',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Comma separated therapist IDs, e.g. 1,2,3',
+                required=True,
+            ),
+        ],
+    )
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def batch(self, request):
+        try:
+            therapist_ids = [int(therapist_id) for therapist_id in request.query_params.get('ids', '').split(',') if therapist_id.strip()]
+        except ValueError:
+            return ResponseWrapper.bad_request(message="ids must be a comma separated list of integers")
+
+        therapists = self.get_therapists_batch_use_case.execute(therapist_ids)
+
+        return ResponseWrapper.found([
+            {
+                'id': therapist.id,
+                'user_id': therapist.user_id,
+                'name': therapist.name,
+                'license_number': therapist.license_number,
+                'specialization': therapist.specialization,
+            }
+            for therapist in therapists
+        ], 'Therapists')
+
+    @extend_schema(
+        summary="Therapist directory",
+        description="Searches therapists by name prefix (case and accent insensitive) and specialization. "
+                    "Along with the page it returns how many matching therapists each specialization has; "
+                    "those counts ignore the `specialization` filter. At most 100 results per page.",
+        responses={
+            200: OpenApiTypes.OBJECT,
+            400: OpenApiTypes.OBJECT,
+        },
+        parameters=[
+            OpenApiParameter(name='q', type=OpenApiTypes.STR, location=OpenApiParameter.QUERY,
+                             description='Beginning of the therapist name', required=False),
+            OpenApiParameter(name='specialization', type=OpenApiTypes.STR, location=OpenApiParameter.QUERY,
+                             description='Exact specialization to filter by', required=False),
+            OpenApiParameter(name='page', type=OpenApiTypes.INT, location=OpenApiParameter.QUERY,
+                             description='Page number', required=False),
+            OpenApiParameter(name='page_size', type=OpenApiTypes.INT, location=OpenApiParameter.QUERY,
+                             description='Number of items per page', required=False),
+        ],
+    )
+    @action(detail=False, methods=['get'])
+    def directory(self, request):
+        filters = {
+            'name': request.query_params.get('q', ''),
+            'specialization': request.query_params.get('specialization', ''),
+        }
+
+        directory_page = self.search_directory_use_case.execute(filters, get_pagination_data(request))
+
+        return ResponseWrapper.found(directory_page.to_dict(), 'Therapist Directory')
+
+    @extend_schema(
+        summary="Therapist weekly utilization",
+        description="Booked hours, completed and cancelled ratios and no-show rate per therapist and week "
+                    "(Monday to Sunday). Defaults to the last 4 weeks; at most 26 weeks per request. Admin only.",
+        responses={
+            200: OpenApiTypes.OBJECT,
+            400: OpenApiTypes.OBJECT,
+            401: OpenApiTypes.OBJECT,
+            403: OpenApiTypes.OBJECT,
+        },
+        parameters=[
+            OpenApiParameter(
+                name='start',
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+                description='First day of the period (YYYY-MM-DD)',
+                required=False,
+            ),
+            OpenApiParameter(
+                name='end',
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+                description='Last day of the period (YYYY-MM-DD), defaults to today',
+                required=False,
+            ),
+            OpenApiParameter(
+                name='therapist_id',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Limit to these therapists; repeat the parameter for several',
+                required=False,
+                many=True,
+            ),
+        ],
+    )
+    @action(detail=False, methods=['get'], permission_classes=[IsAdminUser])
+    def utilization(self, request):
+        try:
+            therapist_ids = [int(therapist_id) for therapist_id in request.query_params.getlist('therapist_id')]
+        except ValueError:
+            return ResponseWrapper.bad_request(message="therapist_id must be an integer")
+
+        weeks = self.get_utilization_use_case.execute(
+            request.query_params.get('start'),
+            request.query_params.get('end'),
+            therapist_ids
+        )
+
+        return ResponseWrapper.found([week.to_dict() for week in weeks], 'Therapist Utilization')
+
+    @extend_schema(
+        summary="Therapist calendar",
+        description="Sessions of a therapist between two dates, grouped by day. Each session is a compact "
+                    "`[start, end, status, patient_ids]` array; days without sessions are left out. "
+                    "Defaults to the current week; at most 62 days per request. Only the therapist "
+                    "themselves and admins can read it.",
+        responses={
+            200: OpenApiTypes.OBJECT,
+            400: OpenApiTypes.OBJECT,
+            401: OpenApiTypes.OBJECT,
+            403: OpenApiTypes.OBJECT,
+        },
+        parameters=[
+            OpenApiParameter(
+                name='pk',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.PATH,
+                description='ID of the therapist',
+                required=True,
+            ),
+            OpenApiParameter(
+                name='start',
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+                description='First day (YYYY-MM-DD), defaults to this Monday',
+                required=False,
+            ),
+            OpenApiParameter(
+                name='end',
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+                description='Last day (YYYY-MM-DD), defaults to six days after start',
+                required=False,
+            ),
+        ],
+    )
+    @action(detail=True, methods=['get'], permission_classes=[IsOwnTherapistOrAdmin])
+    def calendar(self, request, pk=None):
+        try:
+            therapist_id = int(pk)
+        except ValueError:
+            return ResponseWrapper.bad_request(message="The therapist ID must be an integer")
+
+        days = self.get_calendar_use_case.execute(
+            therapist_id,
+            request.query_params.get('start'),
+            request.query_params.get('end')
+        )
+
+        return ResponseWrapper.found([day.to_dict() for day in days], 'Therapist Calendar')
+
     @extend_schema(
         summary="Create a new therapist",
         description="Creates a new therapist record.",
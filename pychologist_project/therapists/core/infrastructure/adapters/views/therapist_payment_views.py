@@ -4,12 +4,13 @@ from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 from core.api_response.response import DjangoResponseWrapper as ResponseWrapper
 from core.pagination import page_helper
+from core.idempotency.idempotency import idempotent
 from payments.core.infrastructure.api.serializers.serializers import PaymentSerializer
 from payments.core.infrastructure.repository.django_payment_repository import DjangoPaymentRepository
 from payments.core.app.use_cases.payment_use_cases import CreatePaymentUseCase, UpdatePaymentUseCase, SoftDeletePaymentUseCase
-from therapists.core.application.therapist_use_case import GetTherapistByUserUseCase
+from core.exceptions.custom_exceptions import EntityNotFoundError
+from users.core.presentation.api.authentication import get_user_principal
 from ....application.therpist_payment_user_case import (GetTherapistPaymentsListUseCase,GetTherapistPaymentUseCase,)
-from ....infrastructure.repositories.django_therapist_repository import DjangoTherapistRepository
 from payments.core.infrastructure.api.serializers.serializers import PaymentSerializer, PaymentOutputSerializer
 from core.pagination.serializers.paginations_serializers import PaginatedResponseSerializer
 from dataclasses import asdict
@@ -18,8 +19,6 @@ from dataclasses import asdict
 class TherapistPaymentView(APIView):
     def __init__(self, **kwargs):
         payment_repository = DjangoPaymentRepository()
-        therapist_repository = DjangoTherapistRepository()
-        self.get_therapist_by_user_use_case = GetTherapistByUserUseCase(therapist_repository)
         self.get_therapist_payment_use_case = GetTherapistPaymentUseCase(payment_repository)
         self.get_therapist_payment_list_use_case = GetTherapistPaymentsListUseCase(payment_repository)
         self.create_payment_use_case = CreatePaymentUseCase(payment_repository)
@@ -45,12 +44,9 @@ class TherapistPaymentView(APIView):
         """
         Retrieve a list of all payments for the authenticated therapist.
         """
-        user = request.user
         pagination_input = page_helper.get_pagination_data(request)
 
-        therapist = self.get_therapist_by_user_use_case.execute(user)
-
-        paginated_payments = self.get_therapist_payment_list_use_case.execute(therapist, pagination_input)
+        paginated_payments = self.get_therapist_payment_list_use_case.execute(_therapist_id(request), pagination_input)
 
         paginated_payments.items =[PaymentOutputSerializer(payment).data for payment in paginated_payments.items]
         paginated_response_data = serialize_pagination_response(paginated_payments, PaymentOutputSerializer)
@@ -59,15 +55,25 @@ class TherapistPaymentView(APIView):
 
     @extend_schema(
         summary="Create a New Payment",
-        description="Creates a new payment for the authenticated therapist.",
+        description="Creates a new payment for the authenticated therapist. Send an `Idempotency-Key` header to make retries safe.",
         request=PaymentSerializer,
         responses={
             201: PaymentSerializer,
             400: OpenApiTypes.OBJECT,
             401: OpenApiTypes.OBJECT,
+            409: OpenApiTypes.OBJECT,
             500: OpenApiTypes.OBJECT,
         },
+        parameters=[
+            OpenApiParameter(
+                name='Idempotency-Key',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.HEADER,
+                description='Unique key for this payment request. Retries with the same key are replayed.',
+            ),
+        ],
     )
+    @idempotent('therapist_payment_create')
     def post(self, request):
         """
         Create a new payment for the authenticated therapist.
@@ -75,7 +81,7 @@ class TherapistPaymentView(APIView):
         serializer = PaymentSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        payment = self.create_payment_use_case.execute(**serializer.validated_data)
+        payment = self.create_payment_use_case.execute(serializer.validated_data)
 
         return ResponseWrapper.created(PaymentOutputSerializer(payment).data, 'Payment')
 
@@ -103,10 +109,7 @@ class TherapistPaymentView(APIView):
         """
         Retrieve a specific payment for the authenticated therapist.
         """
-        user = request.user
-        therapist = self.get_therapist_by_user_use_case.execute(user)
-
-        payment = self.get_therapist_payment_use_case.execute(therapist, payment_id)
+        payment = self.get_therapist_payment_use_case.execute(_therapist_id(request), payment_id)
 
         return ResponseWrapper.found(
             data=PaymentOutputSerializer(payment).data, 
@@ -179,6 +182,13 @@ class TherapistPaymentView(APIView):
         return ResponseWrapper.no_content("Payment deleted successfully.")
     
 
+def _therapist_id(request) -> int:
+    therapist_id = get_user_principal(request.user).therapist_id
+    if therapist_id is None:
+        raise EntityNotFoundError("therapist", request.user.id)
+    return therapist_id
+
+
 def serialize_pagination_response(self, paginated_payments, serializer):
     paginated_response_serializer = PaginatedResponseSerializer(
             data={
@@ -0,0 +1,102 @@
+import time as clock
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List
+from django.utils import timezone
+from ...application.domain.entities.calendar import CalendarDay
+from ...application.domain.entities.utilization import week_start
+from ...application.domain.repositories.therapist_calendar_repository import TherapistCalendarRepository
+from therapy.models import TherapySession, TherapyParticipant
+from core.cache.cache_manager import CacheManager
+
+CACHE_PREFIX = "therapist_calendar_"
+# Entries are dropped on every session write, so they can live much longer than the default
+CACHE_TTL = 60 * 60 * 24
+# Change versions only have to outlive the polling interval of calendar clients
+VERSION_TTL = 60 * 60 * 24 * 7
+
+
+class DjangoTherapistCalendarRepository(TherapistCalendarRepository):
+    """
+    Therapist calendar as day buckets, cached per (therapist, week).
+
+    The requested weeks are read with one get_many; the missing ones are loaded with one range query on
+    the (therapist, start_time) index plus one query for their participants, and written back with one set_many.
+    """
+    def __init__(self, cache_manager: CacheManager = None):
+        self.cache_manager = cache_manager or CacheManager(CACHE_PREFIX)
+
+    def get_days(self, therapist_id: int, first_day: date, last_day: date) -> List[CalendarDay]:
+        first_week, last_week = week_start(first_day), week_start(last_day)
+        weeks = [first_week + timedelta(weeks=offset) for offset in range((last_week - first_week).days // 7 + 1)]
+        keys = {week: self._cache_key(therapist_id, week) for week in weeks}
+
+        cached = self.cache_manager.get_multi(list(keys.values()))
+        missing = [week for week, key in keys.items() if key not in cached]
+
+        if missing:
+            loaded = self._load_weeks(therapist_id, min(missing), max(missing))
+            fresh = {keys[week]: loaded.get(week, []) for week in missing}
+            self.cache_manager.set_multi(fresh, CACHE_TTL)
+            cached.update(fresh)
+
+        return [
+            day
+            for week in weeks
+            for day in cached[keys[week]]
+            if first_day <= day.day <= last_day
+        ]
+
+    def invalidate(self, therapist_id: int, start_time: datetime) -> None:
+        self.cache_manager.delete(self._cache_key(therapist_id, week_start(timezone.localtime(start_time).date())))
+        self.cache_manager.set(self._version_key(therapist_id), clock.time(), VERSION_TTL)
+
+    def get_change_versions(self, therapist_ids: Iterable[int]) -> Dict[int, float]:
+        keys = {therapist_id: self._version_key(therapist_id) for therapist_id in therapist_ids}
+        cached = self.cache_manager.get_multi(list(keys.values()))
+
+        # A version that expired or was evicted restarts at "now": clients download once more, never miss a change
+        now = clock.time()
+        missing = {keys[therapist_id]: now for therapist_id in keys if keys[therapist_id] not in cached}
+        if missing:
+            self.cache_manager.set_multi(missing, VERSION_TTL)
+            cached.update(missing)
+
+        return {therapist_id: cached[key] for therapist_id, key in keys.items()}
+
+    def _load_weeks(self, therapist_id: int, first_week: date, last_week: date) -> Dict[date, List[CalendarDay]]:
+        start = timezone.make_aware(datetime.combine(first_week, time.min))
+        end = timezone.make_aware(datetime.combine(last_week + timedelta(weeks=1), time.min))
+
+        sessions = list(
+            TherapySession.live
+            .filter(therapist_id=therapist_id, start_time__gte=start, start_time__lt=end)
+            .order_by('start_time', 'id')
+            .values_list('id', 'start_time', 'end_time', 'status')
+        )
+
+        patient_ids = defaultdict(list)
+        for session_id, patient_id in (
+            TherapyParticipant.objects
+            .filter(therapy_session_id__in=[session[0] for session in sessions])
+            .order_by('patient_id')
+            .values_list('therapy_session_id', 'patient_id')
+        ):
+            patient_ids[session_id].append(patient_id)
+
+        # Weeks and days with no sessions stay out of the buckets; empty weeks are still cached as []
+        weeks = defaultdict(list)
+        for session_id, start_time, end_time, status in sessions:
+            day = timezone.localtime(start_time).date()
+            days = weeks[week_start(day)]
+            if not days or days[-1].day != day:
+                days.append(CalendarDay(day))
+            days[-1].slots.append((start_time, end_time, status, tuple(patient_ids[session_id])))
+
+        return weeks
+
+    def _version_key(self, therapist_id: int) -> str:
+        return self.cache_manager.get_cache_key(f"{therapist_id}_version")
+
+    def _cache_key(self, therapist_id: int, week: date) -> str:
+        return self.cache_manager.get_cache_key(f"{therapist_id}_{week.isoformat()}")
@@ -0,0 +1,149 @@
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+from django.db.models import Count, F, Min, Value
+from django.db.models.functions import Coalesce, Least
+from django.utils import timezone
+from ...application.domain.entities.home_data import HomeDataEntity
+from ...application.domain.repositories.therapist_dashboard_repository import TherapistDashboardRepository
+from therapists.models import Therapist, TherapistDashboard
+from therapy.models import TherapySession, TherapyParticipant
+from core.cache.cache_manager import CacheManager
+
+CACHE_PREFIX = "therapist_dashboard_"
+
+
+class DjangoTherapistDashboardRepository(TherapistDashboardRepository):
+    """
+    Keeps TherapistDashboard rows in step with the sessions and serves them from the cache, keyed by
+    user id so the /home/ request needs a single cache read.
+
+    Writes adjust the counters with relative UPDATEs and drop the cached entry; a missing row is
+    built from scratch the first time it is read.
+    """
+    def __init__(self, cache_manager: CacheManager = None):
+        self.cache_manager = cache_manager or CacheManager(CACHE_PREFIX)
+
+    def get_by_user_id(self, user_id: int) -> Optional[HomeDataEntity]:
+        cache_key = self._user_cache_key(user_id)
+        now = timezone.now()
+
+        home_data = self.cache_manager.get(cache_key)
+        if home_data is not None and not home_data.incoming_expired(now):
+            return home_data
+
+        if home_data is None:
+            dashboard = TherapistDashboard.objects.select_related('therapist__user').filter(therapist__user_id=user_id).first()
+            if dashboard is None:
+                therapist_id = Therapist.objects.filter(user_id=user_id).values_list('id', flat=True).first()
+                if therapist_id is None:
+                    return None
+                dashboard = self._build(therapist_id)
+            home_data = self._to_entity(dashboard)
+
+        if home_data.incoming_expired(now):
+            # A counted session has started since the last write; only the incoming count is recomputed
+            home_data.incoming_session_count, home_data.next_incoming_start = self._count_incoming(home_data.therapist_id)
+            TherapistDashboard.objects.filter(therapist_id=home_data.therapist_id).update(
+                incoming_session_count=home_data.incoming_session_count,
+                next_incoming_start=home_data.next_incoming_start,
+            )
+
+        self.cache_manager.set(cache_key, home_data)
+        return home_data
+
+    def add_patients(self, therapist_id: int, session_id: int, patient_ids: Iterable[int]) -> None:
+        new_patients = self._patients_without_other_sessions(therapist_id, session_id, patient_ids)
+        if new_patients:
+            self._apply(therapist_id, patient_count=F('patient_count') + len(new_patients))
+
+    def remove_patients(self, therapist_id: int, session_id: int, patient_ids: Iterable[int]) -> None:
+        lost_patients = self._patients_without_other_sessions(therapist_id, session_id, patient_ids)
+        if lost_patients:
+            self._apply(therapist_id, patient_count=F('patient_count') - len(lost_patients))
+
+    def change_incoming(self, therapist_id: int, delta: int, start_time: Optional[datetime] = None) -> None:
+        updates = {'incoming_session_count': F('incoming_session_count') + delta}
+        if delta > 0 and start_time is not None:
+            # Removals leave next_incoming_start as is: an early value only triggers an early refresh
+            updates['next_incoming_start'] = Least(Coalesce('next_incoming_start', Value(start_time)), Value(start_time))
+        self._apply(therapist_id, **updates)
+
+    def count(self, therapist_id: int) -> Tuple[int, int, Optional[datetime]]:
+        patient_count = (
+            TherapyParticipant.objects
+            .filter(therapy_session__therapist_id=therapist_id, therapy_session__deleted_at__isnull=True)
+            .values('patient_id')
+            .distinct()
+            .count()
+        )
+        incoming_session_count, next_incoming_start = self._count_incoming(therapist_id)
+        return patient_count, incoming_session_count, next_incoming_start
+
+    def rebuild(self, therapist_id: int) -> None:
+        self._build(therapist_id)
+        self._invalidate(therapist_id)
+
+    def invalidate_user(self, user_id: int) -> None:
+        self.cache_manager.delete(self._user_cache_key(user_id))
+
+    def _build(self, therapist_id: int) -> TherapistDashboard:
+        patient_count, incoming_session_count, next_incoming_start = self.count(therapist_id)
+        dashboard, _ = TherapistDashboard.objects.update_or_create(
+            therapist_id=therapist_id,
+            defaults={
+                'patient_count': patient_count,
+                'incoming_session_count': incoming_session_count,
+                'next_incoming_start': next_incoming_start,
+            },
+        )
+        return TherapistDashboard.objects.select_related('therapist__user').get(pk=dashboard.pk)
+
+    def _count_incoming(self, therapist_id: int) -> Tuple[int, Optional[datetime]]:
+        incoming = TherapySession.live.filter(
+            therapist_id=therapist_id,
+            status='SCHEDULED',
+            start_time__gte=timezone.now(),
+        ).aggregate(count=Count('id'), next_start=Min('start_time'))
+        return incoming['count'], incoming['next_start']
+
+    def _patients_without_other_sessions(self, therapist_id: int, session_id: int, patient_ids: Iterable[int]) -> set:
+        """Patients of the session that do not appear in any other live session of the therapist."""
+        patient_ids = set(patient_ids)
+        if not patient_ids:
+            return set()
+
+        elsewhere = (
+            TherapyParticipant.objects
+            .filter(
+                patient_id__in=patient_ids,
+                therapy_session__therapist_id=therapist_id,
+                therapy_session__deleted_at__isnull=True,
+            )
+            .exclude(therapy_session_id=session_id)
+            .values_list('patient_id', flat=True)
+        )
+        return patient_ids - set(elsewhere)
+
+    def _apply(self, therapist_id: int, **updates) -> None:
+        # No row yet: nothing to adjust, it is built with the current state on the first read
+        TherapistDashboard.objects.filter(therapist_id=therapist_id).update(**updates)
+        self._invalidate(therapist_id)
+
+    def _invalidate(self, therapist_id: int) -> None:
+        user_id = Therapist.objects.filter(id=therapist_id).values_list('user_id', flat=True).first()
+        if user_id is not None:
+            self.cache_manager.delete(self._user_cache_key(user_id))
+
+    def _user_cache_key(self, user_id: int) -> str:
+        return self.cache_manager.get_cache_key(f"user_{user_id}")
+
+    def _to_entity(self, dashboard: TherapistDashboard) -> HomeDataEntity:
+        therapist = dashboard.therapist
+        return HomeDataEntity(
+            patient_count=dashboard.patient_count,
+            incoming_session_count=dashboard.incoming_session_count,
+            therapist_name=therapist.name,
+            profile_picture=therapist.user.profile_picture if therapist.user else None,
+            therapist_id=therapist.id,
+            next_incoming_start=dashboard.next_incoming_start,
+        )
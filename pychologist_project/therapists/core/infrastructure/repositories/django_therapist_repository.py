@@ -1,11 +1,16 @@
+from typing import Any, Dict, Iterable, List, Optional
+from django.db.models import Count
 from django.utils import timezone
 from django.core.exceptions import ObjectDoesNotExist
 from ...application.domain.entities.therapist import TherapistEntity
+from ...application.domain.entities.directory import TherapistDirectoryEntry, TherapistDirectoryPage, SpecializationFacet
 from therapists.models import Therapist
-from therapy.models import TherapySession
+from patients.models import normalize_search_text
+from therapy.models import TherapySession, TherapyParticipant
 from ...application.domain.repositories.therapist_repository import TherapistRepository
 from core.exceptions.custom_exceptions import EntityNotFoundError
 from core.cache.cache_manager import CacheManager
+from core.pagination.page_helper import PaginationHelper, PaginationInput
 
 CACHE_PREFIX = "therapist_"
 CACHE_TTL = 3600
@@ -38,6 +43,77 @@ class DjangoTherapistRepository(TherapistRepository):
         }, self.cache_ttl)
         return entity
 
+    def get_many_by_ids(self, therapist_ids: Iterable[int]) -> Dict[int, TherapistEntity]:
+        return self.cache_manager.get_or_load_many(
+            therapist_ids,
+            self._load_many_by_ids,
+            key_fn=lambda therapist_id: f"{CACHE_PREFIX}id_{therapist_id}",
+            timeout=self.cache_ttl
+        )
+
+    def get_many_by_user_ids(self, user_ids: Iterable[int]) -> Dict[int, TherapistEntity]:
+        return self.cache_manager.get_or_load_many(
+            user_ids,
+            self._load_many_by_user_ids,
+            key_fn=lambda user_id: f"{CACHE_PREFIX}user_{user_id}",
+            timeout=self.cache_ttl
+        )
+
+    def _load_many_by_ids(self, therapist_ids: List[int]) -> Dict[int, TherapistEntity]:
+        therapists = Therapist.objects.in_bulk(therapist_ids)
+        entities = {therapist_id: self._map_to_entity(therapist) for therapist_id, therapist in therapists.items()}
+        # Also warm the user keys, as get_by_user_id does for the id key
+        self.cache_manager.set_multi({
+            f"{CACHE_PREFIX}user_{entity.user_id}": entity for entity in entities.values() if entity.user_id
+        }, self.cache_ttl)
+        return entities
+
+    def _load_many_by_user_ids(self, user_ids: List[int]) -> Dict[int, TherapistEntity]:
+        therapists = Therapist.objects.in_bulk(user_ids, field_name='user_id')
+        entities = {user_id: self._map_to_entity(therapist) for user_id, therapist in therapists.items()}
+        self.cache_manager.set_multi({
+            f"{CACHE_PREFIX}id_{entity.id}": entity for entity in entities.values()
+        }, self.cache_ttl)
+        return entities
+
+    def search_directory(self, filters: Optional[Dict[str, Any]], pagination_input: PaginationInput) -> TherapistDirectoryPage:
+        filters = filters or {}
+        name_prefix = normalize_search_text(filters.get('name', ''))
+        specialization = filters.get('specialization') or None
+
+        # Any save or delete bumps the version, which retires every cached directory page at once
+        cache_key = self.cache_manager.generate_versioned_search_key({
+            "directory_name": name_prefix,
+            "specialization": specialization,
+            "page_number": pagination_input.page_number,
+            "page_size": pagination_input.page_size,
+        })
+        if (cached_page := self.cache_manager.get(cache_key)) is not None:
+            return cached_page
+
+        queryset = Therapist.objects.all()
+        if name_prefix:
+            queryset = queryset.filter(name_key__startswith=name_prefix)
+
+        # Facets ignore the specialization filter so clients can show the other options; one GROUP BY for all
+        facets = [
+            SpecializationFacet(specialization=row['specialization'], count=row['count'])
+            for row in queryset.values('specialization').annotate(count=Count('id')).order_by('-count', 'specialization')
+        ]
+
+        if specialization:
+            queryset = queryset.filter(specialization=specialization)
+
+        page = PaginationHelper.get_paginated_response(
+            pagination_input,
+            queryset.order_by('name_key', 'id').values('id', 'name', 'specialization'),
+            lambda row: TherapistDirectoryEntry(**row)
+        )
+
+        directory_page = TherapistDirectoryPage(page=page, facets=facets)
+        self.cache_manager.set(cache_key, directory_page, self.cache_ttl)
+        return directory_page
+
     def save(self, therapist: TherapistEntity) -> TherapistEntity:
         if therapist.id:
             return self._update(therapist)
@@ -66,24 +142,25 @@ class DjangoTherapistRepository(TherapistRepository):
 
     def get_unique_patient_count(self, therapist_id: int) -> int:
         cache_key = f"unique_patients_{therapist_id}"
-        if count := self.cache_manager.get(cache_key):
+        if (count := self.cache_manager.get(cache_key)) is not None:
             return count
             
-        count = TherapySession.objects.filter(
-            therapist_id=therapist_id
+        count = TherapyParticipant.objects.filter(
+            therapy_session__therapist_id=therapist_id,
+            therapy_session__deleted_at__isnull=True
         ).values('patient_id').distinct().count()
         self.cache_manager.set(cache_key, count, self.cache_ttl)
         return count
 
     def get_incoming_session_count(self, therapist_id: int) -> int:
         cache_key = f"incoming_sessions_{therapist_id}"
-        if count := self.cache_manager.get(cache_key):
+        if (count := self.cache_manager.get(cache_key)) is not None:
             return count
             
-        count = TherapySession.objects.filter(
+        count = TherapySession.live.filter(
             therapist_id=therapist_id,
             status='SCHEDULED',
-            start_date__gte=timezone.now()
+            start_time__gte=timezone.now()
         ).count()
         self.cache_manager.set(cache_key, count, self.cache_ttl)
         return count
@@ -96,6 +173,7 @@ class DjangoTherapistRepository(TherapistRepository):
             f"{CACHE_PREFIX}id_{therapist_id}",
             f"{CACHE_PREFIX}user_{user_id}"
         ])
+        self.cache_manager.bump_version()
 
     def _map_to_entity(self, model: Therapist) -> TherapistEntity:
         return TherapistEntity(
@@ -112,4 +190,5 @@ class DjangoTherapistRepository(TherapistRepository):
         self.cache_manager.set_multi({
             f"{CACHE_PREFIX}id_{entity.id}": entity,
             f"{CACHE_PREFIX}user_{entity.user_id}": entity
-        }, self.cache_ttl)
\ No newline at end of file
+        }, self.cache_ttl)
+        self.cache_manager.bump_version()
@@ -0,0 +1,109 @@
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.db.models import Count, DateField, DurationField, ExpressionWrapper, F, Q, Sum
+from django.db.models.functions import TruncWeek
+from django.utils import timezone
+from ...application.domain.entities.utilization import TherapistWeeklyUtilization, week_start
+from ...application.domain.repositories.therapist_utilization_repository import TherapistUtilizationRepository
+from therapists.models import Therapist
+from therapy.models import TherapySession, TherapyParticipant
+from core.cache.cache_manager import CacheManager
+
+CACHE_PREFIX = "therapist_utilization_"
+# Entries are dropped on every session write, so they can live much longer than the default
+CACHE_TTL = 60 * 60 * 24
+
+Week = Tuple[int, date]
+
+
+class DjangoTherapistUtilizationRepository(TherapistUtilizationRepository):
+    """
+    Weekly utilization per therapist, cached per (therapist, week).
+
+    All requested weeks are read with one get_many; the missing ones are computed with two grouped
+    queries (sessions and participants, each truncated to the week) and written back with one set_many.
+    """
+    def __init__(self, cache_manager: CacheManager = None):
+        self.cache_manager = cache_manager or CacheManager(CACHE_PREFIX)
+
+    def get_weekly(self, therapist_ids: Optional[List[int]], first_week: date, last_week: date) -> List[TherapistWeeklyUtilization]:
+        if therapist_ids is None:
+            therapist_ids = list(Therapist.objects.order_by('id').values_list('id', flat=True))
+
+        weeks = [first_week + timedelta(weeks=offset) for offset in range((last_week - first_week).days // 7 + 1)]
+        keys = {(therapist_id, week): self._cache_key(therapist_id, week) for therapist_id in therapist_ids for week in weeks}
+
+        cached = self.cache_manager.get_multi(list(keys.values()))
+        missing = [pair for pair, key in keys.items() if key not in cached]
+
+        if missing:
+            computed = self._compute({therapist_id for therapist_id, _ in missing}, min(week for _, week in missing), max(week for _, week in missing))
+            fresh = {keys[pair]: computed.get(pair) or TherapistWeeklyUtilization(*pair) for pair in missing}
+            self.cache_manager.set_multi(fresh, CACHE_TTL)
+            cached.update(fresh)
+
+        return [cached[keys[pair]] for pair in keys]
+
+    def invalidate(self, therapist_id: int, start_time: datetime) -> None:
+        self.cache_manager.delete(self._cache_key(therapist_id, week_start(timezone.localtime(start_time).date())))
+
+    def _compute(self, therapist_ids: Iterable[int], first_week: date, last_week: date) -> Dict[Week, TherapistWeeklyUtilization]:
+        start = timezone.make_aware(datetime.combine(first_week, time.min))
+        end = timezone.make_aware(datetime.combine(last_week + timedelta(weeks=1), time.min))
+        therapist_ids = list(therapist_ids)
+
+        sessions = (
+            TherapySession.live
+            .filter(therapist_id__in=therapist_ids, start_time__gte=start, start_time__lt=end)
+            .annotate(week=TruncWeek('start_time', output_field=DateField()))
+            .values('therapist_id', 'week')
+            .annotate(
+                session_count=Count('id'),
+                booked=Sum(
+                    ExpressionWrapper(F('end_time') - F('start_time'), output_field=DurationField()),
+                    filter=~Q(status='CANCELLED'),
+                ),
+                completed_count=Count('id', filter=Q(status='COMPLETED')),
+                cancelled_count=Count('id', filter=Q(status='CANCELLED')),
+            )
+            .order_by()
+        )
+
+        utilization = {}
+        for row in sessions:
+            booked = row['booked'] or timedelta()
+            utilization[(row['therapist_id'], row['week'])] = TherapistWeeklyUtilization(
+                therapist_id=row['therapist_id'],
+                week_start=row['week'],
+                session_count=row['session_count'],
+                booked_hours=round(booked.total_seconds() / 3600, 2),
+                completed_count=row['completed_count'],
+                cancelled_count=row['cancelled_count'],
+            )
+
+        # Attendance only means something once the session took place
+        participants = (
+            TherapyParticipant.objects
+            .filter(
+                therapy_session__therapist_id__in=therapist_ids,
+                therapy_session__deleted_at__isnull=True,
+                therapy_session__status='COMPLETED',
+                session_start_time__gte=start,
+                session_start_time__lt=end,
+            )
+            .annotate(week=TruncWeek('session_start_time', output_field=DateField()))
+            .values('therapy_session__therapist_id', 'week')
+            .annotate(participant_count=Count('id'), no_show_count=Count('id', filter=Q(attended=False)))
+            .order_by()
+        )
+
+        for row in participants:
+            pair = (row['therapy_session__therapist_id'], row['week'])
+            week = utilization.setdefault(pair, TherapistWeeklyUtilization(*pair))
+            week.participant_count = row['participant_count']
+            week.no_show_count = row['no_show_count']
+
+        return utilization
+
+    def _cache_key(self, therapist_id: int, week: date) -> str:
+        return self.cache_manager.get_cache_key(f"{therapist_id}_{week.isoformat()}")
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+from therapists.models import Therapist, TherapistDashboard
+from therapists.core.infrastructure.repositories.django_therapist_dashboard_repository import DjangoTherapistDashboardRepository
+
+
+class Command(BaseCommand):
+    help = 'Recalcula los paneles de inicio de los terapeutas, o con --verify solo informa de los que no cuadran'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verify', action='store_true', help='Compara los contadores sin modificarlos')
+        parser.add_argument('--therapist-id', type=int, action='append', dest='therapist_ids')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        repository = DjangoTherapistDashboardRepository()
+        therapists = Therapist.objects.order_by('id').values_list('id', flat=True)
+        if options['therapist_ids']:
+            therapists = therapists.filter(id__in=options['therapist_ids'])
+
+        checked = mismatched = created = 0
+        last_id = 0
+        while True:
+            therapist_ids = list(therapists.filter(id__gt=last_id)[:options['batch_size']])
+            if not therapist_ids:
+                break
+
+            stored = {
+                dashboard['therapist_id']: dashboard
+                for dashboard in TherapistDashboard.objects
+                .filter(therapist_id__in=therapist_ids)
+                .values('therapist_id', 'patient_count', 'incoming_session_count')
+            }
+
+            for therapist_id in therapist_ids:
+                patient_count, incoming_session_count, _ = repository.count(therapist_id)
+                current = stored.get(therapist_id)
+                expected = {'patient_count': patient_count, 'incoming_session_count': incoming_session_count}
+
+                if current is None:
+                    # Not read yet; the first /home/ request would build it anyway
+                    if not options['verify']:
+                        repository.rebuild(therapist_id)
+                        created += 1
+                elif any(current[field] != value for field, value in expected.items()):
+                    mismatched += 1
+                    found = {field: current[field] for field in expected}
+                    self.stdout.write(f"Terapeuta {therapist_id}: guardado {found}, esperado {expected}")
+                    if not options['verify']:
+                        repository.rebuild(therapist_id)
+
+            checked += len(therapist_ids)
+            last_id = therapist_ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Terapeutas revisados: {checked}, con diferencias: {mismatched}, paneles creados: {created}"
+        ))
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.2 on 2026-10-19 11:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('therapists', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TherapistDashboard',
+            fields=[
+                ('therapist', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='dashboard', serialize=False, to='therapists.therapist')),
+                ('patient_count', models.IntegerField(default=0)),
+                ('incoming_session_count', models.IntegerField(default=0)),
+                ('next_incoming_start', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.1.2 on 2026-10-19 11:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+BACKFILL_BATCH_SIZE = 2000
+
+
+def backfill_name_key(apps, schema_editor):
+    from patients.models import normalize_search_text
+
+    Therapist = apps.get_model('therapists', 'Therapist')
+    queryset = Therapist.objects.only('id', 'name').order_by('id')
+
+    last_id = 0
+    while True:
+        batch = list(queryset.filter(id__gt=last_id)[:BACKFILL_BATCH_SIZE])
+        if not batch:
+            break
+
+        for therapist in batch:
+            therapist.name_key = normalize_search_text(therapist.name)[:100]
+        Therapist.objects.bulk_update(batch, ['name_key'])
+        last_id = batch[-1].id
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('therapists', '0002_therapist_dashboard'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='therapist',
+            name='name_key',
+            field=models.CharField(blank=True, default='', editable=False, max_length=100),
+        ),
+        migrations.RunPython(backfill_name_key, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='therapist',
+            index=models.Index(fields=['specialization', 'name_key'], name='therapist_specialization_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='therapist',
+            index=models.Index(fields=['name_key'], name='therapist_name_key_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from patients.models import normalize_search_text
 
 class Therapist(models.Model):
     user = models.OneToOneField('users.User', on_delete=models.CASCADE, related_name='therapist_profile', null=True)
@@ -9,5 +10,41 @@ class Therapist(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Normalized name (lowercase, no accents) for the directory's prefix search and ordering
+    name_key = models.CharField(max_length=100, blank=True, default='', editable=False)
+
+    class Meta:
+        indexes = [
+            # Specialization facet filter, already in directory order
+            models.Index(fields=['specialization', 'name_key'], name='therapist_specialization_idx'),
+            # pattern_ops lets PostgreSQL serve LIKE 'prefix%' from the index whatever the collation
+            models.Index(fields=['name_key'], name='therapist_name_key_idx', opclasses=['varchar_pattern_ops']),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.refresh_search_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'name' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'name_key'}
+        super().save(*args, **kwargs)
+
+    def refresh_search_fields(self):
+        """Recomputes name_key; call it before bulk_create, which skips save()."""
+        self.name_key = normalize_search_text(self.name)[:100]
+
     def __str__(self):
         return f"Dr(a). {self.name}"
+
+
+class TherapistDashboard(models.Model):
+    """
+    Read model behind the therapist home screen. The counters are adjusted as sessions and their
+    participants change (see therapists/signals.py) instead of being counted on every request.
+    """
+    therapist = models.OneToOneField(Therapist, on_delete=models.CASCADE, primary_key=True, related_name='dashboard')
+    patient_count = models.IntegerField(default=0)
+    incoming_session_count = models.IntegerField(default=0)
+    # Earliest start among the counted incoming sessions; once it is in the past the count is refreshed on read
+    next_incoming_start = models.DateTimeField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
@@ -1,40 +1,37 @@
 from users.models import User
 from .models import Therapist
-from therapy.models import TherapySession
+from therapy.models import TherapySession, TherapyParticipant
 from core.exceptions.custom_exceptions import EntityNotFoundError
 from django.utils import timezone
 from users.core.presentation.api.serializers.serializers import HomeData
+from .core.infrastructure.repositories.django_therapist_dashboard_repository import DjangoTherapistDashboardRepository
 
 class TherapistService:
     @staticmethod
     def get_unique_patient_count(therapist):
         """Obtiene el conteo de pacientes únicos para un terapeuta."""
-        return TherapySession.objects.filter(
-            therapist=therapist
-        ).values('patients__id').distinct().count()
+        return TherapyParticipant.objects.filter(
+            therapy_session__therapist=therapist,
+            therapy_session__deleted_at__isnull=True
+        ).values('patient_id').distinct().count()
 
     @staticmethod
     def get_incoming_session_count(therapist):
         """Obtiene el conteo de sesiones entrantes para un terapeuta."""
-        return TherapySession.objects.filter(
+        return TherapySession.live.filter(
             therapist=therapist,
             status='SCHEDULED',
-            start_date__lte=timezone.now()
+            start_time__gte=timezone.now()
         ).count()
 
     @staticmethod
     def get_therapist_home_data(user : User):
-        therapist = TherapistService.get_therapist_by_user(user)
+        """Obtiene los datos de inicio desde el panel precalculado del terapeuta."""
+        home_data = DjangoTherapistDashboardRepository().get_by_user_id(user.id)
+        if home_data is None:
+            raise EntityNotFoundError("User", user)
 
-        try:
-            therapist_patient_count = TherapistService.get_unique_patient_count(therapist)
-            incoming_session_count = TherapistService.get_incoming_session_count(therapist)
-        except Exception as e:
-            raise RuntimeError(f"Error al obtener datos del terapeuta: {str(e)}")
-
-        return {
-            HomeData(therapist_patient_count, incoming_session_count, therapist.name, therapist.user.profile_picture)
-        }
+        return HomeData(home_data.patient_count, home_data.incoming_session_count, home_data.therapist_name, home_data.profile_picture)
 
 
     @staticmethod
@@ -0,0 +1,122 @@
+from django.db.models.signals import m2m_changed, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+from therapy.models import TherapySession, TherapyParticipant
+from users.models import User
+from .models import Therapist
+from .core.infrastructure.repositories.django_therapist_dashboard_repository import DjangoTherapistDashboardRepository
+from .core.infrastructure.repositories.django_therapist_utilization_repository import DjangoTherapistUtilizationRepository
+from .core.infrastructure.repositories.django_therapist_calendar_repository import DjangoTherapistCalendarRepository
+
+# Sessions and their participants are written from several places (service, repository, serializers);
+# hooking the model signals keeps the dashboard counters and the cached utilization and calendar
+# weeks right whichever path changed them.
+
+
+def _is_incoming(status, start_time, deleted_at) -> bool:
+    return deleted_at is None and status == 'SCHEDULED' and start_time >= timezone.now()
+
+
+def _invalidate_week(therapist_id, start_time):
+    DjangoTherapistUtilizationRepository().invalidate(therapist_id, start_time)
+    DjangoTherapistCalendarRepository().invalidate(therapist_id, start_time)
+
+
+def _participant_ids(session):
+    return list(session.therapyparticipant_set.values_list('patient_id', flat=True))
+
+
+@receiver(pre_save, sender=TherapySession)
+def remember_session_state(sender, instance, **kwargs):
+    instance._dashboard_previous = None
+    if instance.pk:
+        instance._dashboard_previous = (
+            sender.objects
+            .filter(pk=instance.pk)
+            .values('therapist_id', 'status', 'start_time', 'deleted_at')
+            .first()
+        )
+
+
+@receiver(post_save, sender=TherapySession)
+def update_dashboard_on_session_save(sender, instance, created, **kwargs):
+    previous = instance.__dict__.pop('_dashboard_previous', None)
+    dashboards = DjangoTherapistDashboardRepository()
+
+    _invalidate_week(instance.therapist_id, instance.start_time)
+    if previous is not None:
+        _invalidate_week(previous['therapist_id'], previous['start_time'])
+
+    is_incoming = _is_incoming(instance.status, instance.start_time, instance.deleted_at)
+    if previous is None:
+        if is_incoming:
+            dashboards.change_incoming(instance.therapist_id, 1, instance.start_time)
+        return
+
+    was_incoming = _is_incoming(previous['status'], previous['start_time'], previous['deleted_at'])
+    moved = previous['therapist_id'] != instance.therapist_id
+
+    if was_incoming and (moved or not is_incoming):
+        dashboards.change_incoming(previous['therapist_id'], -1)
+    if is_incoming and (moved or not was_incoming):
+        dashboards.change_incoming(instance.therapist_id, 1, instance.start_time)
+
+    was_live = previous['deleted_at'] is None
+    is_live = instance.deleted_at is None
+    if was_live and (moved or not is_live):
+        dashboards.remove_patients(previous['therapist_id'], instance.pk, _participant_ids(instance))
+    if is_live and (moved or not was_live):
+        dashboards.add_patients(instance.therapist_id, instance.pk, _participant_ids(instance))
+
+
+@receiver(pre_delete, sender=TherapySession)
+def update_dashboard_on_session_delete(sender, instance, **kwargs):
+    if instance.deleted_at is not None:
+        return
+
+    _invalidate_week(instance.therapist_id, instance.start_time)
+
+    dashboards = DjangoTherapistDashboardRepository()
+    if _is_incoming(instance.status, instance.start_time, instance.deleted_at):
+        dashboards.change_incoming(instance.therapist_id, -1)
+    dashboards.remove_patients(instance.therapist_id, instance.pk, _participant_ids(instance))
+
+
+@receiver(m2m_changed, sender=TherapySession.patients.through)
+def update_dashboard_on_participants_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse or instance.deleted_at is not None:
+        return
+
+    if action == 'pre_clear':
+        instance._dashboard_cleared = _participant_ids(instance)
+        return
+
+    if action.startswith('post_'):
+        _invalidate_week(instance.therapist_id, instance.start_time)
+
+    dashboards = DjangoTherapistDashboardRepository()
+    if action == 'post_add':
+        dashboards.add_patients(instance.therapist_id, instance.pk, pk_set)
+    elif action == 'post_remove':
+        dashboards.remove_patients(instance.therapist_id, instance.pk, pk_set)
+    elif action == 'post_clear':
+        dashboards.remove_patients(instance.therapist_id, instance.pk, instance.__dict__.pop('_dashboard_cleared', []))
+
+
+@receiver(post_save, sender=TherapyParticipant)
+def refresh_weeks_on_participant_save(sender, instance, **kwargs):
+    session = instance.therapy_session
+    _invalidate_week(session.therapist_id, session.start_time)
+
+
+@receiver(post_save, sender=Therapist)
+def refresh_dashboard_profile_on_therapist_save(sender, instance, **kwargs):
+    if instance.user_id:
+        DjangoTherapistDashboardRepository().invalidate_user(instance.user_id)
+
+
+@receiver(post_save, sender=User)
+def refresh_dashboard_profile_on_user_save(sender, instance, **kwargs):
+    # The cached home data carries the profile picture
+    if instance.role == 'THERAPIST':
+        DjangoTherapistDashboardRepository().invalidate_user(instance.pk)
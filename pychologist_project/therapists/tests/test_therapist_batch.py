@@ -0,0 +1,86 @@
+from django.test import TestCase
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from patients.infrastructure.repositories.django_patient_repository import DjangoPatientRepository
+from patients.models import Patient
+from users.core.data.repositories.django_user_repository import DjangoUserRepository
+from users.models import User
+from ..core.infrastructure.repositories.django_therapist_repository import DjangoTherapistRepository
+from ..models import Therapist
+
+
+class BatchLookupTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [User.objects.create_user(email=f"t{index}@example.com", password="secret123", role='THERAPIST') for index in range(3)]
+        cls.therapists = [
+            Therapist.objects.create(user=user, name=f"Terapeuta {index}", license_number=f"LIC-B{index}", specialization="Clínica")
+            for index, user in enumerate(cls.users)
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.repository = DjangoTherapistRepository()
+
+    def test_get_many_by_ids_only_queries_cache_misses(self):
+        # Arrange
+        first, second, third = self.therapists
+        self.repository.get_by_id(first.id)
+
+        # Act
+        with self.assertNumQueries(1):
+            therapists = self.repository.get_many_by_ids([first.id, second.id, third.id, 999])
+        with self.assertNumQueries(0):
+            cached = self.repository.get_many_by_ids([first.id, second.id, third.id])
+
+        # Assert
+        self.assertEqual(set(therapists), {first.id, second.id, third.id})
+        self.assertEqual(cached[second.id].name, "Terapeuta 1")
+
+    def test_get_many_by_user_ids_warms_id_keys(self):
+        # Arrange
+        user_ids = [user.id for user in self.users]
+
+        # Act
+        by_user = self.repository.get_many_by_user_ids(user_ids)
+
+        # Assert
+        self.assertEqual(by_user[self.users[2].id].id, self.therapists[2].id)
+        with self.assertNumQueries(0):
+            self.repository.get_by_id(self.therapists[2].id)
+
+    def test_patient_and_user_repositories_batch_lookups(self):
+        # Arrange
+        patients = [Patient.objects.create(name=f"Paciente {index}") for index in range(2)]
+        Patient.objects.filter(id=patients[1].id).update(deleted_at="2024-01-01T00:00:00Z")
+
+        # Act
+        found_patients = DjangoPatientRepository().get_many_by_ids([patient.id for patient in patients])
+        with self.assertNumQueries(1):
+            found_users = DjangoUserRepository().get_many_by_ids([user.id for user in self.users])
+
+        # Assert
+        self.assertEqual(list(found_patients), [patients[0].id])
+        self.assertEqual({user.email for user in found_users.values()}, {user.email for user in self.users})
+
+    def test_batch_endpoint_keeps_requested_order(self):
+        # Act
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.users[0])}')
+        ids = f"{self.therapists[2].id},{self.therapists[0].id},999"
+        response = client.get('/therapists/batch/', {'ids': ids})
+        invalid_response = client.get('/therapists/batch/', {'ids': 'a,b'})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([therapist['id'] for therapist in response.data['data']], [self.therapists[2].id, self.therapists[0].id])
+        self.assertEqual(invalid_response.data['status_code'], status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_endpoint_requires_authentication(self):
+        # Act
+        response = APIClient().get('/therapists/batch/', {'ids': str(self.therapists[0].id)})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
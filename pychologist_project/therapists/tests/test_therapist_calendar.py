@@ -0,0 +1,108 @@
+from datetime import date, datetime, timedelta
+from django.test import TestCase
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from patients.models import Patient
+from therapy.models import TherapySession
+from users.models import User
+from ..core.infrastructure.repositories.django_therapist_calendar_repository import DjangoTherapistCalendarRepository
+from ..models import Therapist
+
+MONDAY = timezone.make_aware(datetime(2024, 3, 4, 9, 0))
+
+
+class TherapistCalendarTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.therapist_user = User.objects.create_user(email='ana@example.com', password='secret123', role='THERAPIST')
+        cls.therapist = Therapist.objects.create(user=cls.therapist_user, name="Ana", license_number="LIC-C1", specialization="Clínica")
+        cls.patient = Patient.objects.create(name="Paciente")
+
+        cls.first = cls._session(MONDAY + timedelta(hours=2), [cls.patient])
+        cls._session(MONDAY, [cls.patient])
+        cls._session(MONDAY + timedelta(days=8), [])
+        deleted = cls._session(MONDAY + timedelta(days=1), [cls.patient])
+        deleted.deleted_at = timezone.now()
+        deleted.save()
+
+    @classmethod
+    def _session(cls, start_time, patients):
+        session = TherapySession.objects.create(
+            therapist=cls.therapist,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=1),
+            status='SCHEDULED',
+            notes="Notas privadas",
+        )
+        session.patients.set(patients)
+        return session
+
+    def setUp(self):
+        cache.clear()
+        self.repository = DjangoTherapistCalendarRepository()
+
+    def test_sessions_are_grouped_by_day_without_notes(self):
+        # Act
+        days = self.repository.get_days(self.therapist.id, MONDAY.date(), MONDAY.date() + timedelta(days=13))
+
+        # Assert
+        self.assertEqual([day.day for day in days], [date(2024, 3, 4), date(2024, 3, 12)])
+        self.assertEqual(days[0].slots, [
+            (MONDAY, MONDAY + timedelta(hours=1), 'SCHEDULED', (self.patient.id,)),
+            (MONDAY + timedelta(hours=2), MONDAY + timedelta(hours=3), 'SCHEDULED', (self.patient.id,)),
+        ])
+
+    def test_weeks_are_cached_until_a_session_changes(self):
+        # Arrange
+        self.repository.get_days(self.therapist.id, MONDAY.date(), MONDAY.date() + timedelta(days=6))
+
+        # Act
+        with self.assertNumQueries(0):
+            self.repository.get_days(self.therapist.id, MONDAY.date(), MONDAY.date())
+        self.first.status = 'CANCELLED'
+        self.first.save()
+        days = self.repository.get_days(self.therapist.id, MONDAY.date(), MONDAY.date())
+
+        # Assert
+        self.assertEqual([slot[2] for slot in days[0].slots], ['SCHEDULED', 'CANCELLED'])
+
+    def _client(self, user=None):
+        client = APIClient()
+        if user:
+            client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        return client
+
+    def test_calendar_endpoint(self):
+        # Arrange
+        client = self._client(self.therapist_user)
+
+        # Act
+        response = client.get(f'/therapists/{self.therapist.id}/calendar/', {'start': '2024-03-10', 'end': '2024-03-16'})
+        too_long = client.get(f'/therapists/{self.therapist.id}/calendar/', {'start': '2024-01-01', 'end': '2024-06-01'})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data'], [
+            {'date': '2024-03-12', 'sessions': [['2024-03-12T09:00:00+00:00', '2024-03-12T10:00:00+00:00', 'SCHEDULED', []]]}
+        ])
+        self.assertEqual(too_long.data['status_code'], 400)
+
+    def test_calendar_is_limited_to_its_therapist_and_admins(self):
+        # Arrange
+        other_user = User.objects.create_user(email='luis@example.com', password='secret123', role='THERAPIST')
+        Therapist.objects.create(user=other_user, name="Luis", license_number="LIC-C2", specialization="Infantil")
+        admin_user = User.objects.create_superuser(email='admin@example.com', password='adminpass')
+        url = f'/therapists/{self.therapist.id}/calendar/'
+
+        # Act
+        anonymous_response = self._client().get(url)
+        other_response = self._client(other_user).get(url)
+        admin_response = self._client(admin_user).get(url)
+
+        # Assert
+        self.assertEqual(anonymous_response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(other_response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(admin_response.status_code, status.HTTP_200_OK)
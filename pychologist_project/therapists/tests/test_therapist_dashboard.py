@@ -0,0 +1,110 @@
+from datetime import timedelta
+from io import StringIO
+from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from patients.models import Patient
+from therapy.models import TherapySession
+from users.models import User
+from ..core.infrastructure.repositories.django_therapist_dashboard_repository import DjangoTherapistDashboardRepository
+from ..models import Therapist, TherapistDashboard
+
+
+class TherapistDashboardTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.repository = DjangoTherapistDashboardRepository()
+        self.user = User.objects.create_user(email="ana@example.com", password="secret123", role='THERAPIST')
+        self.therapist = Therapist.objects.create(user=self.user, name="Ana", license_number="LIC-D", specialization="Clínica")
+        self.patients = [Patient.objects.create(name=f"Paciente {index}") for index in range(3)]
+        self.now = timezone.now()
+
+    def _create_session(self, start_time, patients, status='SCHEDULED'):
+        session = TherapySession.objects.create(
+            therapist=self.therapist,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=1),
+            status=status,
+        )
+        session.patients.set(patients)
+        return session
+
+    def _counts(self):
+        home_data = self.repository.get_by_user_id(self.user.id)
+        return home_data.patient_count, home_data.incoming_session_count
+
+    def test_counters_follow_session_and_participant_changes(self):
+        # Arrange
+        self._create_session(self.now - timedelta(days=1), self.patients[:2], status='COMPLETED')
+        self.assertEqual(self._counts(), (2, 0))
+
+        # Act / Assert
+        upcoming = self._create_session(self.now + timedelta(days=1), self.patients[1:])
+        self.assertEqual(self._counts(), (3, 1))
+
+        upcoming.patients.remove(self.patients[1])
+        self.assertEqual(self._counts(), (3, 1))
+
+        upcoming.status = 'CANCELLED'
+        upcoming.deleted_at = self.now
+        upcoming.save()
+        self.assertEqual(self._counts(), (2, 0))
+
+        self.assertEqual(self.repository.count(self.therapist.id)[:2], (2, 0))
+
+    def test_reads_are_served_from_one_cache_entry(self):
+        # Arrange
+        self._create_session(self.now + timedelta(days=2), self.patients[:1])
+        self.repository.get_by_user_id(self.user.id)
+
+        # Act / Assert
+        with self.assertNumQueries(0):
+            self.assertEqual(self._counts(), (1, 1))
+
+    def test_started_sessions_leave_the_incoming_count(self):
+        # Arrange
+        session = self._create_session(self.now + timedelta(days=1), self.patients[:1])
+        self.assertEqual(self._counts(), (1, 1))
+
+        # Act
+        TherapySession.objects.filter(id=session.id).update(start_time=self.now - timedelta(minutes=5))
+        TherapistDashboard.objects.filter(therapist=self.therapist).update(next_incoming_start=self.now - timedelta(minutes=5))
+        cache.clear()
+
+        # Assert
+        self.assertEqual(self._counts(), (1, 0))
+
+    def test_rebuild_command_fixes_drifted_counters(self):
+        # Arrange
+        self._create_session(self.now + timedelta(days=1), self.patients)
+        self.repository.get_by_user_id(self.user.id)
+        TherapistDashboard.objects.filter(therapist=self.therapist).update(patient_count=10)
+        output = StringIO()
+
+        # Act
+        call_command('rebuild_therapist_dashboards', '--verify', stdout=output)
+        verified_count = TherapistDashboard.objects.get(therapist=self.therapist).patient_count
+        call_command('rebuild_therapist_dashboards', stdout=output)
+
+        # Assert
+        self.assertEqual(verified_count, 10)
+        self.assertIn("con diferencias: 1", output.getvalue())
+        self.assertEqual(self._counts(), (3, 1))
+
+    def test_home_endpoint_returns_dashboard(self):
+        # Arrange
+        self._create_session(self.now + timedelta(days=1), self.patients[:2])
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        # Act
+        response = client.get('/home/')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['therapist_patient_count'], 2)
+        self.assertEqual(response.data['data']['incoming_session_count'], 1)
+        self.assertEqual(response.data['data']['name'], "Ana")
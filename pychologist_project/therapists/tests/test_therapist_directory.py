@@ -0,0 +1,61 @@
+from django.test import TestCase
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from rest_framework import status
+from core.pagination.page_helper import PaginationInput
+from ..core.application.domain.entities.therapist import TherapistEntity
+from ..core.infrastructure.repositories.django_therapist_repository import DjangoTherapistRepository
+from ..models import Therapist
+
+
+class TherapistDirectoryTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for index, (name, specialization) in enumerate([
+            ("Álvaro Ruiz", "Clínica"),
+            ("Alba Núñez", "Infantil"),
+            ("alberto Gil", "Clínica"),
+            ("Marta Alonso", "Clínica"),
+        ]):
+            Therapist.objects.create(name=name, license_number=f"LIC-D{index}", specialization=specialization)
+
+    def setUp(self):
+        cache.clear()
+        self.repository = DjangoTherapistRepository()
+
+    def test_prefix_search_ignores_accents_and_counts_facets(self):
+        # Act
+        result = self.repository.search_directory({'name': 'AL', 'specialization': 'Clínica'}, PaginationInput(1, 10))
+
+        # Assert
+        self.assertEqual([entry.name for entry in result.page.items], ["alberto Gil", "Álvaro Ruiz"])
+        self.assertEqual(
+            [(facet.specialization, facet.count) for facet in result.facets],
+            [("Clínica", 2), ("Infantil", 1)]
+        )
+
+    def test_search_is_cached_until_a_therapist_is_saved(self):
+        # Arrange
+        pagination_input = PaginationInput(1, 10)
+        self.repository.search_directory({'name': 'mar'}, pagination_input)
+
+        # Act
+        with self.assertNumQueries(0):
+            cached = self.repository.search_directory({'name': 'mar'}, pagination_input)
+        self.repository.save(TherapistEntity(name="Mario Vega", license_number="LIC-D9", specialization="Pareja"))
+        refreshed = self.repository.search_directory({'name': 'mar'}, pagination_input)
+
+        # Assert
+        self.assertEqual(cached.page.metadata.total_items, 1)
+        self.assertEqual([entry.name for entry in refreshed.page.items], ["Mario Vega", "Marta Alonso"])
+
+    def test_directory_endpoint(self):
+        # Act
+        response = APIClient().get('/therapists/directory/', {'q': 'alb', 'page_size': 1})
+        too_large = APIClient().get('/therapists/directory/', {'page_size': 500})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['items'][0]['name'], "Alba Núñez")
+        self.assertEqual(response.data['data']['pagination']['total_items'], 2)
+        self.assertEqual(too_large.data['status_code'], 400)
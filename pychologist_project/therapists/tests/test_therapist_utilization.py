@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+from django.test import TestCase
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from patients.models import Patient
+from therapy.models import TherapySession, TherapyParticipant
+from users.models import User
+from ..core.infrastructure.repositories.django_therapist_utilization_repository import DjangoTherapistUtilizationRepository
+from ..models import Therapist
+
+MONDAY = timezone.make_aware(datetime(2024, 3, 4, 9, 0))
+
+
+class TherapistUtilizationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.therapist = Therapist.objects.create(name="Ana", license_number="LIC-U1", specialization="Clínica")
+        cls.other_therapist = Therapist.objects.create(name="Luis", license_number="LIC-U2", specialization="Infantil")
+        cls.patients = [Patient.objects.create(name=f"Paciente {index}") for index in range(2)]
+
+        cls.completed = cls._session(cls.therapist, MONDAY, 'COMPLETED', hours=1)
+        cls._session(cls.therapist, MONDAY + timedelta(days=2), 'COMPLETED', hours=2)
+        cls._session(cls.therapist, MONDAY + timedelta(days=4), 'CANCELLED', hours=1)
+        cls._session(cls.therapist, MONDAY + timedelta(days=7), 'SCHEDULED', hours=1)
+        cls._session(cls.other_therapist, MONDAY, 'COMPLETED', hours=1)
+
+        TherapyParticipant.objects.filter(therapy_session=cls.completed, patient=cls.patients[0]).update(attended=True)
+
+    @classmethod
+    def _session(cls, therapist, start_time, status, hours):
+        session = TherapySession.objects.create(
+            therapist=therapist,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=hours),
+            status=status,
+        )
+        session.patients.set(cls.patients)
+        return session
+
+    def setUp(self):
+        cache.clear()
+        self.repository = DjangoTherapistUtilizationRepository()
+
+    def test_weekly_aggregates(self):
+        # Act
+        first_week, second_week = self.repository.get_weekly([self.therapist.id], MONDAY.date(), MONDAY.date() + timedelta(weeks=1))
+
+        # Assert
+        self.assertEqual(first_week.week_start, MONDAY.date())
+        self.assertEqual((first_week.session_count, first_week.completed_count, first_week.cancelled_count), (3, 2, 1))
+        self.assertEqual(first_week.booked_hours, 3.0)
+        self.assertEqual((first_week.participant_count, first_week.no_show_count), (4, 3))
+        self.assertEqual(first_week.no_show_rate, 0.75)
+        self.assertEqual((second_week.session_count, second_week.booked_hours, second_week.participant_count), (1, 1.0, 0))
+
+    def test_weeks_are_cached_per_therapist_and_invalidated_on_session_writes(self):
+        # Arrange
+        weeks = (MONDAY.date(), MONDAY.date() + timedelta(weeks=1))
+        self.repository.get_weekly(None, *weeks)
+
+        # Act / Assert
+        with self.assertNumQueries(1):  # therapist ids only
+            self.repository.get_weekly(None, *weeks)
+
+        self.completed.status = 'CANCELLED'
+        self.completed.save()
+
+        with self.assertNumQueries(3):  # therapist ids plus the two grouped queries for the one invalidated week
+            first_week = self.repository.get_weekly(None, *weeks)[0]
+        self.assertEqual((first_week.completed_count, first_week.cancelled_count), (1, 2))
+
+    def _client(self, user=None):
+        client = APIClient()
+        if user:
+            client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        return client
+
+    def test_endpoint_validates_period(self):
+        # Arrange
+        client = self._client(User.objects.create_superuser(email='admin@example.com', password='adminpass'))
+
+        # Act
+        response = client.get('/therapists/utilization/', {'start': '2024-03-04', 'end': '2024-03-10', 'therapist_id': self.other_therapist.id})
+        invalid_response = client.get('/therapists/utilization/', {'start': '2023-01-01', 'end': '2024-03-10'})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']), 1)
+        self.assertEqual(response.data['data'][0]['completion_rate'], 1.0)
+        self.assertEqual(invalid_response.data['status_code'], status.HTTP_400_BAD_REQUEST)
+
+    def test_endpoint_is_admin_only(self):
+        # Arrange
+        therapist_user = User.objects.create_user(email='t@example.com', password='secret123', role='THERAPIST')
+
+        # Act
+        anonymous_response = self._client().get('/therapists/utilization/')
+        therapist_response = self._client(therapist_user).get('/therapists/utilization/')
+
+        # Assert
+        self.assertEqual(anonymous_response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(therapist_response.status_code, status.HTTP_403_FORBIDDEN)
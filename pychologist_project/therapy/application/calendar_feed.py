@@ -0,0 +1,87 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator
+from django.core import signing
+from django.utils import timezone
+from core.exceptions.custom_exceptions import BusinessLogicError, EntityNotFoundError
+from ..domain.interfaces import ISessionRepository
+from therapists.core.application.domain.repositories.therapist_calendar_repository import TherapistCalendarRepository
+
+FEED_SALT = 'therapy.calendar_feed'
+# Feeds start a few months back so clients keep recent history without the whole archive
+FEED_PAST_DAYS = 90
+
+OWNER_THERAPIST = 't'
+OWNER_PATIENT = 'p'
+
+
+@dataclass
+class FeedOwner:
+    """Terapeuta o paciente cuyas sesiones publica un feed."""
+    kind: str
+    id: int
+
+
+@dataclass
+class FeedVersion:
+    etag: str
+    last_modified: int
+
+
+class CalendarFeedService:
+    """
+    iCalendar feeds of a therapist's or a patient's sessions.
+
+    Feed URLs carry a signed token naming the owner, so polling needs neither a session nor a user lookup.
+    The version of a feed comes from the change versions of the therapists involved, which every session
+    write bumps; an unchanged feed is answered without running the session query.
+    """
+    def __init__(self, session_repository: ISessionRepository, calendar_repository: TherapistCalendarRepository):
+        self.session_repository = session_repository
+        self.calendar_repository = calendar_repository
+
+    def build_token(self, principal) -> str:
+        """Token for the feed of the given UserPrincipal; its profile IDs avoid any lookup."""
+        if principal.role == 'THERAPIST':
+            if principal.therapist_id is None:
+                raise EntityNotFoundError("therapist", principal.id)
+            owner = FeedOwner(OWNER_THERAPIST, principal.therapist_id)
+        elif principal.role == 'PATIENT':
+            if principal.patient_id is None:
+                raise EntityNotFoundError("patient", principal.id)
+            owner = FeedOwner(OWNER_PATIENT, principal.patient_id)
+        else:
+            raise BusinessLogicError("Solo terapeutas y pacientes tienen calendario de sesiones")
+
+        return signing.dumps([owner.kind, owner.id], salt=FEED_SALT, compress=True)
+
+    def read_token(self, token: str) -> FeedOwner:
+        try:
+            kind, owner_id = signing.loads(token, salt=FEED_SALT)
+        except (signing.BadSignature, ValueError, TypeError):
+            raise EntityNotFoundError("calendar feed")
+        return FeedOwner(kind, owner_id)
+
+    def get_version(self, owner: FeedOwner) -> FeedVersion:
+        if owner.kind == OWNER_THERAPIST:
+            therapist_ids = [owner.id]
+        else:
+            therapist_ids = self.session_repository.get_therapist_ids_by_patient(owner.id, self._since())
+
+        versions = self.calendar_repository.get_change_versions(therapist_ids)
+        fingerprint = ','.join(f"{therapist_id}:{versions[therapist_id]!r}" for therapist_id in sorted(versions))
+        digest = hashlib.md5(f"{owner.kind}{owner.id}|{fingerprint}".encode('utf-8')).hexdigest()
+
+        # A patient without sessions has no therapist versions; their feed is as old as the window start
+        last_modified = max(versions.values(), default=self._since().timestamp())
+        return FeedVersion(etag=f'"{digest}"', last_modified=int(last_modified))
+
+    def iter_sessions(self, owner: FeedOwner) -> Iterator[Dict[str, Any]]:
+        if owner.kind == OWNER_THERAPIST:
+            return self.session_repository.iter_feed_sessions(self._since(), therapist_id=owner.id)
+        return self.session_repository.iter_feed_sessions(self._since(), patient_id=owner.id)
+
+    def _since(self) -> datetime:
+        today = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        return today - timedelta(days=FEED_PAST_DAYS)
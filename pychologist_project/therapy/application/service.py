@@ -4,11 +4,13 @@ from ..domain.entities import TherapySession
 from ..domain.interfaces import ISessionRepository
 from ..domain.validators import SessionValidator
 from core.exceptions.custom_exceptions import EntityNotFoundError
+from patients.core.domain.repository.patient_repository import PatientRepository
 from ..models import TherapySession as DjangoTherapySession
 
 class SessionService:
-    def __init__(self, repository: ISessionRepository):
+    def __init__(self, repository: ISessionRepository, patient_repository: PatientRepository = None):
         self.repository = repository
+        self.patient_repository = patient_repository
         self.validator = SessionValidator()
 
     def get_session(self, session_id: int) -> DjangoTherapySession:
@@ -53,17 +55,31 @@ class SessionService:
         """
         self.__update_schedule(session, data)
 
+        completed = False
         if session.status != data['status']:
             self.__update_status(session, data['status'])
+            completed = data['status'] == 'COMPLETED'
 
         self.__update_patients(session, data.get('patients'))
 
         session.notes = data['notes']
 
         updated_session = self.repository.update(session)
+
+        if completed:
+            self.__record_completed_therapy(updated_session)
         
         return self._convert_to_model(updated_session)
 
+    def __record_completed_therapy(self, session: TherapySession):
+        """
+        Mantiene first_therapy/last_therapy de los pacientes al completarse la sesión.
+        """
+        if self.patient_repository is None:
+            return
+
+        self.patient_repository.record_completed_therapy(session.patients, session.start_time)
+
     def __update_status(self, session, new_status: str):
         self.validator.validate_status_transition(session.status, new_status)
         session.status = new_status
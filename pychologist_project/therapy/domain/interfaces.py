@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
 from .entities import TherapySession
 
 class ISessionRepository(ABC):
@@ -21,4 +22,11 @@ class ISessionRepository(ABC):
 
     @abstractmethod
     def delete(self, session_id: int) -> None:
-        pass
\ No newline at end of file
+        pass
+    @abstractmethod
+    def iter_feed_sessions(self, since: datetime, therapist_id: Optional[int] = None, patient_id: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def get_therapist_ids_by_patient(self, patient_id: int, since: datetime) -> List[int]:
+        pass
@@ -1,14 +1,16 @@
 from django.db.models import Q
-from ..models import TherapySession as DjangoTherapySession
+from ..models import TherapySession as DjangoTherapySession, TherapyParticipant
 from ..domain.interfaces import ISessionRepository
 from ..domain.entities import TherapySession
-from typing import Optional, Dict, List
+from typing import Any, Iterator, Optional, Dict, List
 from datetime import datetime
 from django.utils import timezone
 from core.cache.cache_manager import CacheManager
 from core.exceptions.custom_exceptions import EntityNotFoundError, InvalidOperationError
 
 CACHE_PREFIX = "therapy_session_"
+FEED_FIELDS = ('id', 'start_time', 'end_time', 'status', 'updated_at')
+FEED_CHUNK_SIZE = 500
 
 class DjangoSessionRepository(ISessionRepository):
     def __init__(self):
@@ -23,7 +25,7 @@ class DjangoSessionRepository(ISessionRepository):
             return cached_session
         
         try:
-            session = DjangoTherapySession.objects.get(id=session_id)
+            session = DjangoTherapySession.live.get(id=session_id)
             entity = self._convert_to_entity(session)
             
             self.cache_manager.set(cache_key, entity)
@@ -40,19 +42,41 @@ class DjangoSessionRepository(ISessionRepository):
             return cached_sessions
         
         if incoming:
-            queryset = DjangoTherapySession.objects.filter(
+            queryset = DjangoTherapySession.live.filter(
                 therapist=therapist,
                 status='SCHEDULED',
                 start_time__gte=timezone.now()
             )
         else:
-            queryset = DjangoTherapySession.objects.filter(therapist=therapist).order_by('start_time')
+            queryset = DjangoTherapySession.live.filter(therapist=therapist).order_by('start_time')
         
         sessions = [self._convert_to_entity(s) for s in queryset]
         
         self.cache_manager.set(cache_key, sessions)
         return sessions
 
+    def iter_feed_sessions(self, since: datetime, therapist_id: Optional[int] = None, patient_id: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Live sessions from `since` on, as plain rows and in start order. Rows are fetched in chunks while
+        the caller consumes them, so a feed can be streamed without loading it first.
+        """
+        queryset = DjangoTherapySession.live.filter(start_time__gte=since)
+        if therapist_id is not None:
+            queryset = queryset.filter(therapist_id=therapist_id)
+        if patient_id is not None:
+            queryset = queryset.filter(therapyparticipant__patient_id=patient_id)
+
+        return queryset.order_by('start_time', 'id').values(*FEED_FIELDS).iterator(chunk_size=FEED_CHUNK_SIZE)
+
+    def get_therapist_ids_by_patient(self, patient_id: int, since: datetime) -> List[int]:
+        return list(
+            TherapyParticipant.objects
+            .filter(patient_id=patient_id, therapy_session__start_time__gte=since)
+            .order_by('therapy_session__therapist_id')
+            .values_list('therapy_session__therapist_id', flat=True)
+            .distinct()
+        )
+
     def search(self, filters: Dict) -> List[TherapySession]:
         cache_key = self.cache_manager.generate_search_key(filters)
         
@@ -60,7 +84,7 @@ class DjangoSessionRepository(ISessionRepository):
         if cached_sessions is not None:
             return cached_sessions
         
-        queryset = DjangoTherapySession.objects.all()
+        queryset = DjangoTherapySession.live.all()
 
         if filters.get('status'):
             queryset = queryset.filter(status=filters['status'])
@@ -137,7 +161,7 @@ class DjangoSessionRepository(ISessionRepository):
         return entity
 
     def update(self, session: TherapySession) -> TherapySession:
-        django_session = DjangoTherapySession.objects.get(id=session.id)
+        django_session = DjangoTherapySession.live.get(id=session.id)
         django_session.start_time = session.start_time
         django_session.end_time = session.end_time
         django_session.status = session.status
@@ -0,0 +1,75 @@
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, Iterable, Iterator
+
+# RFC 5545 status of each session status; rescheduled sessions keep their slot until they are moved
+ICS_STATUSES = {
+    'PENDING': 'TENTATIVE',
+    'SCHEDULED': 'CONFIRMED',
+    'RESCHEDULED': 'TENTATIVE',
+    'COMPLETED': 'CONFIRMED',
+    'CANCELLED': 'CANCELLED',
+}
+
+ICS_SUMMARIES = {
+    'PENDING': 'Sesión de terapia (pendiente)',
+    'SCHEDULED': 'Sesión de terapia',
+    'RESCHEDULED': 'Sesión de terapia (reagendada)',
+    'COMPLETED': 'Sesión de terapia',
+    'CANCELLED': 'Sesión de terapia (cancelada)',
+}
+
+
+def stream_sessions_ics(sessions: Iterable[Dict[str, Any]], calendar_name: str) -> Iterator[str]:
+    """
+    Yields an iCalendar document one event at a time, so the response starts before the query ends.
+    Only times and status are published; notes and participants stay out of third-party calendars.
+    """
+    yield _lines(
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//Pychologist//Sesiones//ES',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{_escape(calendar_name)}',
+    )
+
+    for session in sessions:
+        yield _lines(
+            'BEGIN:VEVENT',
+            f"UID:session-{session['id']}@pychologist",
+            f"DTSTAMP:{_format_time(session['updated_at'])}",
+            f"DTSTART:{_format_time(session['start_time'])}",
+            f"DTEND:{_format_time(session['end_time'])}",
+            f"SUMMARY:{ICS_SUMMARIES.get(session['status'], 'Sesión de terapia')}",
+            f"STATUS:{ICS_STATUSES.get(session['status'], 'CONFIRMED')}",
+            'END:VEVENT',
+        )
+
+    yield _lines('END:VCALENDAR')
+
+
+def _lines(*lines: str) -> str:
+    return ''.join(f'{_fold(line)}\r\n' for line in lines)
+
+
+def _fold(line: str) -> str:
+    """Splits lines longer than 75 octets as RFC 5545 asks, without breaking a UTF-8 character."""
+    parts, current, size = [], '', 0
+    for char in line:
+        char_size = len(char.encode('utf-8'))
+        if size + char_size > 75:
+            parts.append(current)
+            # Continuation lines start with a space, which counts towards their 75 octets
+            current, size = ' ', 1
+        current += char
+        size += char_size
+    parts.append(current)
+    return '\r\n'.join(parts)
+
+
+def _format_time(value: datetime) -> str:
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\n', '\\n')
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.2 on 2026-10-19 11:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0003_live_partial_indexes'),
+        ('payments', '0006_live_partial_indexes'),
+        ('therapists', '0001_initial'),
+        ('therapy', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='therapysession',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['start_time'], name='session_live_start_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.2 on 2026-10-19 11:17
+
+from django.db import migrations, models
+
+
+def backfill_session_start_time(apps, schema_editor):
+    TherapySession = apps.get_model('therapy', 'TherapySession')
+    TherapyParticipant = apps.get_model('therapy', 'TherapyParticipant')
+
+    start_time = TherapySession.objects.filter(id=models.OuterRef('therapy_session_id')).values('start_time')[:1]
+    TherapyParticipant.objects.update(session_start_time=models.Subquery(start_time))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0004_patient_last_therapy_index'),
+        ('therapy', '0002_live_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='therapyparticipant',
+            name='session_start_time',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_session_start_time, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='therapyparticipant',
+            index=models.Index(fields=['patient', '-session_start_time', '-therapy_session'], name='participant_patient_time_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.2 on 2026-10-19 11:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0006_patient_duplicate_detection'),
+        ('payments', '0007_payment_patient_time_index'),
+        ('therapists', '0002_therapist_dashboard'),
+        ('therapy', '0003_participant_session_start_time'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='therapysession',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['therapist', 'start_time'], name='session_therapist_start_idx'),
+        ),
+    ]
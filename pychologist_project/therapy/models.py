@@ -1,6 +1,7 @@
 from django.db import models
 from django.forms import ValidationError
 from django.utils import timezone
+from core.managers.live_manager import LiveManager
 
 class TherapySession(models.Model):
     STATUS_CHOICES = [
@@ -24,10 +25,28 @@ class TherapySession(models.Model):
     deleted_at = models.DateTimeField(null=True, blank=True)
     cancelled_at = models.DateTimeField(null=True, blank=True)
 
+    objects = models.Manager()
+    live = LiveManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['start_time'], name='session_live_start_idx', condition=models.Q(deleted_at__isnull=True)),
+            # Per-therapist date ranges: utilization, dashboard counts and calendars
+            models.Index(
+                fields=['therapist', 'start_time'],
+                name='session_therapist_start_idx',
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
+
     def clean(self):
         if self.end_time <= self.start_time:
             raise ValidationError('La hora de finalización debe ser posterior a la de inicio')
         
+    def sync_participant_start_time(self):
+        """Copies start_time to the participant rows, which index it per patient for the timeline."""
+        self.therapyparticipant_set.exclude(session_start_time=self.start_time).update(session_start_time=self.start_time)
+
     def soft_delete(self):
         if self.deleted_at != None:
             raise ValidationError('La sesion ya fue borrada(soft)')
@@ -40,6 +59,14 @@ class TherapyParticipant(models.Model):
     therapy_session = models.ForeignKey(TherapySession, on_delete=models.CASCADE)
     patient = models.ForeignKey('patients.Patient', on_delete=models.CASCADE) 
     attended = models.BooleanField(default=False)
+    # Copy of therapy_session.start_time so a patient's sessions can be read in time order from one index
+    session_start_time = models.DateTimeField(null=True, editable=False)
     
     class Meta:
         unique_together = ('therapy_session', 'patient')
+        indexes = [
+            models.Index(
+                fields=['patient', '-session_start_time', '-therapy_session'],
+                name='participant_patient_time_idx',
+            ),
+        ]
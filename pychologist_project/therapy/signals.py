@@ -0,0 +1,36 @@
+from django.db.models import OuterRef, Subquery
+from django.db.models.signals import m2m_changed, post_save, pre_save
+from django.dispatch import receiver
+from .models import TherapySession, TherapyParticipant
+
+# TherapyParticipant.session_start_time copies the session's start_time for the per-patient timeline
+# index. Participants are written from the repository, the serializers and `patients.set/add` (which
+# bulk-creates the rows without save()), so the copy is kept here rather than in each caller.
+
+
+@receiver(pre_save, sender=TherapyParticipant)
+def copy_session_start_time(sender, instance, **kwargs):
+    instance.session_start_time = instance.therapy_session.start_time
+
+
+@receiver(post_save, sender=TherapySession)
+def sync_start_time_on_session_save(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and 'start_time' not in update_fields):
+        return
+    instance.sync_participant_start_time()
+
+
+@receiver(m2m_changed, sender=TherapySession.patients.through)
+def sync_start_time_on_participants_add(sender, instance, action, reverse, pk_set, **kwargs):
+    if action != 'post_add' or not pk_set:
+        return
+
+    if not reverse:
+        instance.sync_participant_start_time()
+        return
+
+    TherapyParticipant.objects.filter(patient=instance, therapy_session_id__in=pk_set).update(
+        session_start_time=Subquery(
+            TherapySession.objects.filter(pk=OuterRef('therapy_session_id')).values('start_time')[:1]
+        )
+    )
@@ -0,0 +1,82 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from patients.models import Patient
+from therapists.models import Therapist
+from users.models import User
+from ..models import TherapySession
+
+
+class SessionCalendarFeedTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="ana@example.com", password="secret123", role='THERAPIST')
+        cls.therapist = Therapist.objects.create(user=cls.user, name="Ana", license_number="LIC-F1", specialization="Clínica")
+        cls.patient_user = User.objects.create_user(email="luis@example.com", password="secret123", role='PATIENT')
+        cls.patient = Patient.objects.create(user=cls.patient_user, name="Luis")
+
+        start_time = timezone.now() + timedelta(days=1)
+        cls.session = TherapySession.objects.create(
+            therapist=cls.therapist,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=1),
+            status='SCHEDULED',
+            notes="Notas privadas",
+        )
+        cls.session.patients.set([cls.patient])
+
+    def setUp(self):
+        cache.clear()
+
+    def _feed_url(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client.get('/calendar/feed/').data['data']['url']
+
+    def test_feed_streams_sessions_without_notes(self):
+        # Act
+        response = APIClient().get(self._feed_url(self.user))
+        body = b''.join(response.streaming_content).decode('utf-8')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/calendar; charset=utf-8')
+        self.assertIn(f"UID:session-{self.session.id}@pychologist\r\n", body)
+        self.assertIn("STATUS:CONFIRMED\r\n", body)
+        self.assertNotIn("Notas privadas", body)
+
+    def test_unchanged_feed_returns_not_modified_without_queries(self):
+        # Arrange
+        url = self._feed_url(self.user)
+        etag = APIClient().get(url)['ETag']
+
+        # Act
+        with self.assertNumQueries(0):
+            not_modified = APIClient().get(url, HTTP_IF_NONE_MATCH=etag)
+        self.session.status = 'CANCELLED'
+        self.session.save()
+        changed = APIClient().get(url, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertIn("STATUS:CANCELLED", b''.join(changed.streaming_content).decode('utf-8'))
+
+    def test_patient_feed_follows_session_changes(self):
+        # Arrange
+        url = self._feed_url(self.patient_user)
+        first = APIClient().get(url)
+        self.assertIn(f"session-{self.session.id}@", b''.join(first.streaming_content).decode('utf-8'))
+
+        # Act
+        self.session.patients.clear()
+        response = APIClient().get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        tampered = APIClient().get(url.replace('.ics', 'x.ics'))
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("session-", b''.join(response.streaming_content).decode('utf-8'))
+        self.assertEqual(tampered.data['status_code'], 404)
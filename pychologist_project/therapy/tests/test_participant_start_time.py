@@ -0,0 +1,46 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.utils import timezone
+from patients.models import Patient
+from therapists.models import Therapist
+from ..models import TherapySession, TherapyParticipant
+
+
+class ParticipantStartTimeSyncTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.therapist = Therapist.objects.create(name="Ana", license_number="LIC-1", specialization="Clínica")
+        cls.patient = Patient.objects.create(name="Luis Gómez")
+        cls.other_patient = Patient.objects.create(name="Marta Ruiz")
+        cls.start_time = timezone.now().replace(microsecond=0)
+
+    def _create_session(self, start_time):
+        return TherapySession.objects.create(
+            therapist=self.therapist,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=1),
+            status='SCHEDULED',
+        )
+
+    def _start_times(self, session):
+        return set(TherapyParticipant.objects.filter(therapy_session=session).values_list('session_start_time', flat=True))
+
+    def test_every_write_path_copies_the_session_start_time(self):
+        # Arrange
+        session = self._create_session(self.start_time)
+        other_session = self._create_session(self.start_time + timedelta(days=1))
+        moved = self.start_time + timedelta(hours=3)
+
+        # Act
+        session.patients.set([self.patient])
+        self.other_patient.therapysession_set.add(session)
+        TherapyParticipant.objects.create(therapy_session=other_session, patient=self.patient)
+        added = self._start_times(session)
+        session.start_time = moved
+        session.end_time = moved + timedelta(hours=1)
+        session.save()
+
+        # Assert
+        self.assertEqual(added, {self.start_time})
+        self.assertEqual(self._start_times(session), {moved})
+        self.assertEqual(self._start_times(other_session), {other_session.start_time})
@@ -0,0 +1,100 @@
+from datetime import timedelta
+from io import StringIO
+from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from patients.models import Patient
+from patients.infrastructure.repositories.django_patient_repository import DjangoPatientRepository
+from therapists.models import Therapist
+from ..application.service import SessionService
+from ..infrastructure.django_session_repository import DjangoSessionRepository
+from ..models import TherapySession
+
+
+class SessionCompletionTherapyDatesTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.therapist = Therapist.objects.create(name="Ana", license_number="LIC-1", specialization="Clínica")
+        cls.patient = Patient.objects.create(name="Luis Gómez")
+        cls.other_patient = Patient.objects.create(name="Marta Ruiz")
+
+    def setUp(self):
+        cache.clear()
+        self.service = SessionService(DjangoSessionRepository(), DjangoPatientRepository())
+
+    def _create_session(self, start_time, status='SCHEDULED', patients=None):
+        session = TherapySession.objects.create(
+            therapist=self.therapist,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=1),
+            status=status,
+        )
+        session.patients.set(patients or [self.patient])
+        return session
+
+    def _complete(self, session):
+        return self.service.update(session, {
+            'therapist': self.therapist,
+            'start_time': session.start_time,
+            'end_time': session.end_time,
+            'status': 'COMPLETED',
+            'notes': '',
+            'patients': [self.patient.id],
+        })
+
+    def test_completing_sessions_updates_first_and_last_therapy(self):
+        # Arrange
+        recent = self._create_session(timezone.now() - timedelta(days=1))
+        older = self._create_session(timezone.now() - timedelta(days=30))
+
+        # Act
+        self._complete(recent)
+        self._complete(older)
+
+        # Assert
+        self.patient.refresh_from_db()
+        self.assertEqual(self.patient.first_therapy, older.start_time)
+        self.assertEqual(self.patient.last_therapy, recent.start_time)
+
+    def test_backfill_recomputes_from_completed_sessions(self):
+        # Arrange
+        first = self._create_session(timezone.now() - timedelta(days=60), status='COMPLETED', patients=[self.patient, self.other_patient])
+        last = self._create_session(timezone.now() - timedelta(days=2), status='COMPLETED')
+        self._create_session(timezone.now() - timedelta(days=1), status='CANCELLED')
+
+        # Act
+        call_command('backfill_therapy_dates', batch_size=1, stdout=StringIO())
+
+        # Assert
+        self.patient.refresh_from_db()
+        self.other_patient.refresh_from_db()
+        self.assertEqual((self.patient.first_therapy, self.patient.last_therapy), (first.start_time, last.start_time))
+        self.assertEqual((self.other_patient.first_therapy, self.other_patient.last_therapy), (first.start_time, first.start_time))
+
+    def test_backfill_clears_dates_of_patients_without_completed_sessions(self):
+        # Arrange
+        self._create_session(timezone.now() - timedelta(days=3), status='CANCELLED', patients=[self.other_patient])
+        Patient.objects.filter(id=self.other_patient.id).update(
+            first_therapy=timezone.now() - timedelta(days=3),
+            last_therapy=timezone.now() - timedelta(days=3),
+        )
+
+        # Act
+        call_command('backfill_therapy_dates', batch_size=1, stdout=StringIO())
+
+        # Assert
+        self.other_patient.refresh_from_db()
+        self.assertIsNone(self.other_patient.first_therapy)
+        self.assertIsNone(self.other_patient.last_therapy)
+
+    def test_completing_a_session_invalidates_cached_patient_lists(self):
+        # Arrange
+        repository = DjangoPatientRepository()
+        version = repository.cache_manager.get_version()
+
+        # Act
+        repository.record_completed_therapy([self.patient.id], timezone.now())
+
+        # Assert
+        self.assertNotEqual(repository.cache_manager.get_version(), version)
@@ -1,13 +1,24 @@
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from rest_framework import status
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.decorators import action
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 import logging
 from .application.service import SessionService
 from .models import TherapySession
 from .serializers import TherapySessionSerializer
 from .infrastructure.django_session_repository import DjangoSessionRepository as sessionRepository
+from .infrastructure.ics import stream_sessions_ics
+from .application.calendar_feed import CalendarFeedService
+from therapists.core.infrastructure.repositories.django_therapist_calendar_repository import DjangoTherapistCalendarRepository
+from users.core.presentation.api.authentication import get_user_principal
+from patients.infrastructure.repositories.django_patient_repository import DjangoPatientRepository
 from core.api_response.response import DjangoResponseWrapper as ResponseWrapper
 from core.swagger.schemas import TherapySessionResponseSchema
 
@@ -23,7 +34,7 @@ class TherapySessionViewSet(ModelViewSet):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.service = SessionService(sessionRepository())
+        self.service = SessionService(sessionRepository(), DjangoPatientRepository())
 
     @extend_schema(
         summary="Retrieves a therapy session by ID",
@@ -250,3 +261,68 @@ class TherapySessionViewSet(ModelViewSet):
         audit_logger.info(f"Search successful, Results count: {len(sessions)}, User: {user}, IP: {ip_address}")
         
         return ResponseWrapper.found(data=self.get_serializer(sessions, many=True).data, entity='Therapy Sessions')
+
+
+def build_calendar_feed_service() -> CalendarFeedService:
+    return CalendarFeedService(sessionRepository(), DjangoTherapistCalendarRepository())
+
+
+class SessionCalendarFeedLinkView(APIView):
+    """
+    Returns the private iCalendar feed URL of the authenticated therapist or patient.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Calendar feed URL",
+        description="Private URL of the authenticated therapist's or patient's session feed, to subscribe "
+                    "to from a calendar app. Anyone holding the URL can read the session times.",
+        responses={
+            200: OpenApiTypes.OBJECT,
+            401: OpenApiTypes.OBJECT,
+            404: OpenApiTypes.OBJECT,
+        },
+    )
+    def get(self, request):
+        token = build_calendar_feed_service().build_token(get_user_principal(request.user))
+        url = request.build_absolute_uri(reverse('session_calendar_feed', kwargs={'token': token}))
+
+        return ResponseWrapper.found({'url': url}, 'Calendar Feed')
+
+
+class SessionCalendarFeedView(APIView):
+    """
+    iCalendar feed of a therapist's or patient's sessions, polled by calendar apps.
+    """
+    # Calendar apps cannot send a bearer token; the signed token in the URL is the credential
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        summary="Session calendar feed",
+        description="Sessions from the last 90 days on, as text/calendar. The response is streamed and "
+                    "carries ETag and Last-Modified; send If-None-Match or If-Modified-Since to get "
+                    "304 Not Modified while no session changed.",
+        responses={
+            200: OpenApiTypes.BINARY,
+            304: None,
+            404: OpenApiTypes.OBJECT,
+        },
+    )
+    def get(self, request, token):
+        service = build_calendar_feed_service()
+        owner = service.read_token(token)
+        version = service.get_version(owner)
+
+        not_modified = get_conditional_response(request, etag=version.etag, last_modified=version.last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = StreamingHttpResponse(
+            stream_sessions_ics(service.iter_sessions(owner), 'Sesiones de terapia'),
+            content_type='text/calendar; charset=utf-8'
+        )
+        response['ETag'] = version.etag
+        response['Last-Modified'] = http_date(version.last_modified)
+        response['Cache-Control'] = 'private, no-cache'
+        return response
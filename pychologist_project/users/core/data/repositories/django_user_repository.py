@@ -1,11 +1,28 @@
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Upper
+from datetime import datetime, time, timedelta
 from django.utils import timezone
 from ....core.domain.repositories import UserRepository
-from ....core.domain.entities import UserEntity
+from ....core.domain.entities import ProvisionedUser, UserEntity, UserPrincipal, UserProvisioningEntry, UserSummary
 from users.models import User
+from patients.models import Patient
+from patients.infrastructure.repositories.django_patient_repository import CACHE_PREFIX as PATIENT_CACHE_PREFIX
+from therapists.models import Therapist
+from therapists.core.infrastructure.repositories.django_therapist_repository import CACHE_PREFIX as THERAPIST_CACHE_PREFIX
 from core.cache.cache_manager import CacheManager
-from typing import Optional
+from core.exceptions.custom_exceptions import BusinessLogicError, InvalidOperationError
+from core.pagination.page_helper import CursorPaginatedResponse, CursorPaginationHelper, PaginationInput
+from ..service.password_hashing import hash_password, hash_passwords
+from ..service.registered_email_filter import RegisteredEmailFilter, normalize_email_key
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 CACHE_PREFIX = "user_"
+# Principals are read on every authenticated request; a short TTL bounds changes made outside this repository
+PRINCIPAL_CACHE_TTL = 300
+BULK_BATCH_SIZE = 500
+
+LIST_FILTERS = ('role', 'is_active', 'created_after', 'created_before', 'email')
+SUMMARY_FIELDS = ('id', 'email', 'role', 'is_active', 'created_at', 'patient_profile__name', 'therapist_profile__name')
 
 class DjangoUserRepository(UserRepository):
     """
@@ -38,7 +55,7 @@ class DjangoUserRepository(UserRepository):
         if cached_user:
             return cached_user
 
-        user = User.objects.filter(id=user_id).first()
+        user = User.objects.with_profiles().filter(id=user_id).first()
         if not user:
             return None
 
@@ -46,6 +63,142 @@ class DjangoUserRepository(UserRepository):
         self.cache_manager.set(cache_key, user_entity)
         return user_entity
 
+    def get_many_by_ids(self, user_ids: Iterable[int]) -> Dict[int, UserEntity]:
+        """
+        Retrieves several users by ID.
+        Cached users are read with a single cache round trip; the rest are fetched
+        with one query and written back to the cache together.
+
+        Args:
+            user_ids (Iterable[int]): The IDs of the users.
+
+        Returns:
+            Dict[int, UserEntity]: The found users keyed by ID. Unknown IDs are left out.
+        """
+        return self.cache_manager.get_or_load_many(user_ids, self._load_many)
+
+    def _load_many(self, user_ids: List[int]) -> Dict[int, UserEntity]:
+        users = User.objects.with_profiles().in_bulk(user_ids)
+        return {user_id: self._map_to_entity(user) for user_id, user in users.items()}
+
+    def get_all(self, filters: Dict[str, Any], pagination_input: PaginationInput) -> CursorPaginatedResponse[UserSummary]:
+        """
+        Lists users by ascending ID with keyset pagination, filtered by role, is_active, creation date
+        (created_after / created_before, YYYY-MM-DD) and email prefix (case insensitive).
+        Pages are cached per filter set and cursor; any user write drops them all (bump_version).
+
+        Args:
+            filters (Dict[str, Any]): The filters to apply; unknown keys are ignored.
+            pagination_input (PaginationInput): Page size and the cursor of the previous page.
+
+        Returns:
+            CursorPaginatedResponse[UserSummary]: The page of users and the cursor of the next one.
+        """
+        filters = {key: value for key, value in filters.items() if key in LIST_FILTERS and value not in (None, '')}
+        cache_key = self.cache_manager.generate_versioned_search_key({
+            **filters,
+            "page_size": pagination_input.page_size,
+            "cursor": pagination_input.cursor,
+        })
+
+        cached_page = self.cache_manager.get(cache_key)
+        if cached_page is not None:
+            return cached_page
+
+        queryset = self._apply_filters(User.objects.all(), filters).values(*SUMMARY_FIELDS)
+        page = CursorPaginationHelper.get_cursor_response(pagination_input, queryset, self._to_summary)
+
+        self.cache_manager.set(cache_key, page)
+        return page
+
+    def invalidate_listing(self) -> None:
+        """Drops every cached page of get_all at once."""
+        self.cache_manager.bump_version()
+
+    def _apply_filters(self, queryset, filters: Dict[str, Any]):
+        if 'role' in filters:
+            role = str(filters['role']).upper()
+            if role not in dict(User.ROLE_CHOICES):
+                raise ValueError(f"Rol inválido: {filters['role']}")
+            queryset = queryset.filter(role=role)
+
+        if 'is_active' in filters:
+            is_active = filters['is_active']
+            if isinstance(is_active, str):
+                is_active = is_active.lower() in ('true', '1')
+            queryset = queryset.filter(is_active=is_active)
+
+        for key, lookup in (('created_after', 'created_at__gte'), ('created_before', 'created_at__lt')):
+            if key in filters:
+                try:
+                    day = datetime.strptime(filters[key], '%Y-%m-%d').date()
+                except (TypeError, ValueError):
+                    raise ValueError(f"The format of '{key}' must be 'YYYY-MM-DD'.")
+                # created_before includes the whole day
+                if key == 'created_before':
+                    day += timedelta(days=1)
+                queryset = queryset.filter(**{lookup: timezone.make_aware(datetime.combine(day, time.min))})
+
+        if 'email' in filters:
+            # UPPER(email) LIKE 'PREFIX%', served by user_email_upper_idx (text_pattern_ops on PostgreSQL)
+            queryset = queryset.filter(email__istartswith=normalize_email_key(filters['email']))
+
+        return queryset
+
+    def _to_summary(self, row: Dict[str, Any]) -> UserSummary:
+        if row['role'] == 'ADMIN':
+            name = 'ADMIN'
+        else:
+            name = row['patient_profile__name'] or row['therapist_profile__name'] or ''
+        return UserSummary(
+            id=row['id'],
+            email=row['email'],
+            role=row['role'],
+            name=name,
+            is_active=row['is_active'],
+            created_at=row['created_at'],
+        )
+
+    def get_principal(self, user_id: int) -> Optional[UserPrincipal]:
+        """
+        Retrieves what request authentication and permissions need: email, role, is_active and
+        the IDs of the user's therapist and live patient profiles, joined in a single query.
+        They are cached for a few minutes and dropped whenever the user or one of its profiles is saved.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            Optional[UserPrincipal]: The principal if the user exists, otherwise None.
+        """
+        cache_key = self._principal_cache_key(user_id)
+
+        cached_principal = self.cache_manager.get(cache_key)
+        if cached_principal:
+            return cached_principal
+
+        row = User.objects.filter(id=user_id).values(
+            'id', 'email', 'role', 'is_active',
+            'therapist_profile__id', 'patient_profile__id', 'patient_profile__deleted_at'
+        ).first()
+        if not row:
+            return None
+
+        principal = UserPrincipal(
+            id=row['id'],
+            email=row['email'],
+            role=row['role'],
+            is_active=row['is_active'],
+            therapist_id=row['therapist_profile__id'],
+            patient_id=row['patient_profile__id'] if row['patient_profile__deleted_at'] is None else None
+        )
+        self.cache_manager.set(cache_key, principal, PRINCIPAL_CACHE_TTL)
+        return principal
+
+    def invalidate_principal(self, user_id: int) -> None:
+        """Drops the cached principal, e.g. after the user's role or profiles changed."""
+        self.cache_manager.delete(self._principal_cache_key(user_id))
+
     def get_by_email(self, email: str) -> Optional[UserEntity]:
         """
         Retrieves a user by their email.
@@ -64,7 +217,7 @@ class DjangoUserRepository(UserRepository):
         if cached_user:
             return cached_user
 
-        user = User.objects.filter(email=email).first()
+        user = User.objects.with_profiles().filter(email=email).first()
         if not user:
             return None
 
@@ -83,14 +236,22 @@ class DjangoUserRepository(UserRepository):
         Returns:
             UserEntity: The newly created user entity.
         """
-        user = User.objects.create_user(
-            email=user_entity.email,
+        if not user_entity.email:
+            raise ValueError('El email es obligatorio')
+
+        # One hash through the bounded executor and one INSERT
+        user = User(
+            email=User.objects.normalize_email(user_entity.email),
             role=user_entity.role,
             phone=user_entity.phone or ''
         )
-
-        user.set_password(password)
-        user.save()
+        user.password = hash_password(password)
+        try:
+            with transaction.atomic():
+                user.save()
+        except IntegrityError:
+            # Another request registered the email between the existence check and this insert
+            raise BusinessLogicError("El email ya está registrado")
 
         user_entity = self._map_to_entity(user)
         cache_key = self.cache_manager.get_cache_key(user_entity.id)
@@ -108,54 +269,66 @@ class DjangoUserRepository(UserRepository):
         Returns:
             UserEntity: The updated user entity.
         """
-        user = User.objects.get(id=user_entity.id)
+        user = User.objects.with_profiles().get(id=user_entity.id)
 
         if user_entity.email:
             user.email = user_entity.email
         if user_entity.phone:
             user.phone = user_entity.phone
-        if user_entity.name:
-            user.set_name(user_entity.name)
         if user_entity.profile_picture:
             user.profile_picture = user_entity.profile_picture
         if user_entity.is_active is not None:
             user.is_active = user_entity.is_active
 
-        user.save()
+        try:
+            # set_name writes the profile; roll it back with the user row if the email is taken
+            with transaction.atomic():
+                if user_entity.name:
+                    user.set_name(user_entity.name)
+                user.save()
+        except IntegrityError:
+            # Another request took the email between the existence check and this update
+            raise InvalidOperationError("Este email ya está en uso")
 
         user_entity = self._map_to_entity(user)
         cache_key = self.cache_manager.get_cache_key(user_entity.id)
         self.cache_manager.set(cache_key, user_entity)
+        self.invalidate_principal(user_entity.id)
 
         return user_entity
 
     def update_last_login(self, user_entity: UserEntity) -> None:
         """
-        Updates the last login timestamp for a user.
+        Updates the last login timestamp for a user with a single UPDATE.
+        The cached entity does not carry last_login, so it stays valid.
 
         Args:
-            user_entity (UserEntity): The user entity to update.
+            user_entity (UserEntity | User): The user that logged in; only its ID is used.
         """
-        user = User.objects.get(id=user_entity.id)
-
-        user.last_login = timezone.now()
-        user.is_active = True
-        user.save(update_fields=['last_login', 'is_active'])
-
-        cache_key = self.cache_manager.get_cache_key(user_entity.id)
-        self.cache_manager.delete(cache_key)
+        User.objects.filter(id=user_entity.id).update(last_login=timezone.now())
 
-    def exists_by_email(self, email: str) -> bool:
+    def exists_by_email(self, email: str, use_filter: bool = True) -> bool:
         """
-        Checks if a user with the given email exists.
+        Checks if a user with the given email exists, ignoring case and surrounding spaces.
+        Emails the in-memory filter has never seen are answered without a query; the rest
+        are confirmed against the case-insensitive email index.
+
+        The filter is per process and misses users created by other workers, so paths that cannot
+        rely on the insert's unique constraint to catch a stale answer pass use_filter=False.
 
         Args:
             email (str): The email to check.
+            use_filter (bool): Whether a filter miss may answer False without a query.
 
         Returns:
             bool: True if a user with the given email exists, False otherwise.
         """
-        return User.objects.filter(email=email).exists()
+        email = normalize_email_key(email)
+        if not email:
+            return False
+        if use_filter and not RegisteredEmailFilter.might_exist(email):
+            return False
+        return User.objects.filter(email__iexact=email).exists()
 
     def exists_by_phone(self, phone: str) -> bool:
         """
@@ -167,8 +340,123 @@ class DjangoUserRepository(UserRepository):
         Returns:
             bool: True if a user with the given phone number exists, False otherwise.
         """
+        # PhoneNumberField stores numbers in E.164, so the lookup value is normalized the same way
+        # and the phone index is used
+        if not phone:
+            return False
         return User.objects.filter(phone=phone).exists()
 
+    def find_provisioning_conflicts(self, emails: List[str], phones: List[str], license_numbers: List[str]) -> Dict[str, Set[str]]:
+        """
+        Finds which of the given emails, phones and license numbers are already taken, with one
+        query per field whatever the size of the batch.
+
+        Args:
+            emails (List[str]): Emails to check, compared ignoring case.
+            phones (List[str]): Phone numbers in E.164 format.
+            license_numbers (List[str]): Therapist license numbers.
+
+        Returns:
+            Dict[str, Set[str]]: The taken values by field ('email', 'phone' and 'license_number').
+                Emails are returned normalized (see normalize_email_key).
+        """
+        conflicts = {'email': set(), 'phone': set(), 'license_number': set()}
+
+        email_keys = {normalize_email_key(email) for email in emails if email}
+        if email_keys:
+            # Upper(email) matches the user_email_upper_idx expression
+            taken = User.objects.annotate(email_upper=Upper('email')).filter(
+                email_upper__in=[email.upper() for email in email_keys]
+            ).values_list('email', flat=True)
+            conflicts['email'] = {normalize_email_key(email) for email in taken}
+
+        phones = {phone for phone in phones if phone}
+        if phones:
+            taken = User.objects.filter(phone__in=phones).values_list('phone', flat=True)
+            conflicts['phone'] = {phone.as_e164 for phone in taken}
+
+        license_numbers = {license_number for license_number in license_numbers if license_number}
+        if license_numbers:
+            conflicts['license_number'] = set(
+                Therapist.objects.filter(license_number__in=license_numbers).values_list('license_number', flat=True)
+            )
+
+        return conflicts
+
+    def bulk_provision(self, entries: List[UserProvisioningEntry]) -> List[ProvisionedUser]:
+        """
+        Creates the users and their patient or therapist profiles in one transaction: passwords are
+        hashed in a process pool and every table gets a single bulk INSERT.
+        Save signals do not run, so the email filter and the patient and therapist
+        search caches are updated here.
+
+        Args:
+            entries (List[UserProvisioningEntry]): Users already validated and free of conflicts.
+
+        Returns:
+            List[ProvisionedUser]: The created users, in the order of entries.
+        """
+        password_hashes = hash_passwords([entry.password for entry in entries])
+        users = [
+            User(
+                email=User.objects.normalize_email(entry.email),
+                password=password_hash,
+                role=entry.role,
+                phone=entry.phone or ''
+            )
+            for entry, password_hash in zip(entries, password_hashes)
+        ]
+
+        profiles = {}
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users, batch_size=BULK_BATCH_SIZE)
+
+                patients, therapists = [], []
+                for entry, user in zip(entries, users):
+                    if entry.role == 'PATIENT':
+                        profile = Patient(user=user, name=entry.name, description=entry.description or '')
+                        patients.append(profile)
+                    elif entry.role == 'THERAPIST':
+                        profile = Therapist(
+                            user=user,
+                            name=entry.name,
+                            license_number=entry.license_number,
+                            specialization=entry.specialization
+                        )
+                        therapists.append(profile)
+                    else:
+                        continue
+                    profile.refresh_search_fields()
+                    profiles[user.email] = profile
+
+                Patient.objects.bulk_create(patients, batch_size=BULK_BATCH_SIZE)
+                Therapist.objects.bulk_create(therapists, batch_size=BULK_BATCH_SIZE)
+        except IntegrityError:
+            # Someone took one of the values after find_provisioning_conflicts; nothing was inserted
+            raise BusinessLogicError("Otro registro tomó un email, teléfono o cédula del lote; vuelve a intentarlo")
+
+        for user in users:
+            RegisteredEmailFilter.add(user.email)
+        self.invalidate_listing()
+        if patients:
+            CacheManager(PATIENT_CACHE_PREFIX).bump_version()
+        if therapists:
+            CacheManager(THERAPIST_CACHE_PREFIX).bump_version()
+
+        return [
+            ProvisionedUser(
+                id=user.id,
+                email=user.email,
+                role=user.role,
+                profile_id=profiles[user.email].id if user.email in profiles else None
+            )
+            for user in users
+        ]
+
+    def _principal_cache_key(self, user_id: int) -> str:
+        return self.cache_manager.get_cache_key(f"principal_{user_id}")
+
     def _map_to_entity(self, user_model: User) -> UserEntity:
         """
         Maps a User model instance to a UserEntity.
@@ -186,5 +474,6 @@ class DjangoUserRepository(UserRepository):
             role=user_model.role,
             is_active=user_model.is_active,
             profile_picture=user_model.profile_picture,
-            name=getattr(user_model, 'name', None)
+            # Only free of queries for users loaded through User.objects.with_profiles()
+            name=user_model.name
         )
@@ -1,22 +1,12 @@
-from django.contrib.auth import authenticate
+from .password_hashing import authenticate_credentials
 
 class DjangoAuthService:
     def authenticate(self, email, password):
         """
-        Autentica a un usuario usando Django
+        Autentica a un usuario usando Django.
+
+        Devuelve la instancia de usuario ya cargada por el backend para que el login la reutilice
+        al emitir los tokens, sin volver a consultarla. El hash de la contraseña pasa por el ejecutor
+        acotado: si está saturado se lanza ServiceUnavailableError (503) en lugar de bloquear al worker.
         """
-        user = authenticate(email=email, password=password)
-        
-        if not user:
-            return None
-        
-        from ...domain.entities import UserEntity
-        return UserEntity(
-            id=user.id,
-            email=user.email,
-            phone=user.phone,
-            role=user.role,
-            is_active=user.is_active,
-            profile_picture=user.profile_picture,
-            name=getattr(user, 'name', None)
-        )
\ No newline at end of file
+        return authenticate_credentials(email, password)
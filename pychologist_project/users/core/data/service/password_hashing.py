@@ -0,0 +1,59 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import get_hasher, make_password
+from core.concurrency.bounded_executor import BoundedExecutor
+
+# Below this many passwords a batch is hashed inline
+MIN_POOL_BATCH = 16
+
+
+@lru_cache(maxsize=None)
+def get_password_hashing_executor() -> BoundedExecutor:
+    """Executor shared by every password hash and check of the process; see PASSWORD_HASHING_* settings."""
+    return BoundedExecutor(
+        'password-hashing',
+        max_concurrency=settings.PASSWORD_HASHING_CONCURRENCY,
+        queue_timeout=settings.PASSWORD_HASHING_QUEUE_TIMEOUT,
+        lock_dir=settings.PASSWORD_HASHING_LOCK_DIR,
+    )
+
+
+def hash_password(raw_password: str) -> str:
+    return get_password_hashing_executor().run(make_password, raw_password)
+
+
+def hash_passwords(raw_passwords: List[str]) -> List[str]:
+    """
+    Hashes a batch of passwords, in order, inside the host-wide hashing slots.
+
+    The batch holds as many executor slots as are free (up to PASSWORD_HASHING_CONCURRENCY) for its whole
+    run and starts one pool process per slot, so logins and other batches on the host still see the
+    configured limit. With a single slot, or a batch too small to pay for the pool, it hashes inline.
+    Raises ServiceUnavailableError when no slot frees up within the queue timeout.
+    """
+    hasher = get_hasher()
+    jobs = [(hasher, raw_password, hasher.salt()) for raw_password in raw_passwords]
+    if not jobs:
+        return []
+
+    wanted = 1 if len(jobs) < MIN_POOL_BATCH else min(settings.PASSWORD_HASHING_CONCURRENCY, len(jobs))
+    with get_password_hashing_executor().reserve(wanted) as workers:
+        if workers <= 1:
+            return [_encode(job) for job in jobs]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_encode, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+
+def _encode(job) -> str:
+    # Hashers encode without touching settings, so pool workers need no Django setup
+    hasher, raw_password, salt = job
+    return hasher.encode(raw_password, salt)
+
+
+def authenticate_credentials(email: str, password: str):
+    # The backend hashes even for unknown emails, so the whole call goes through the executor
+    return get_password_hashing_executor().run(authenticate, email=email, password=password)
@@ -0,0 +1,116 @@
+import logging
+import threading
+from typing import List, Optional
+from django.conf import settings
+from django.db import DatabaseError, connection
+from core.cache.bloom_filter import BloomFilter
+from users.models import User
+
+# Room left for signups before the filter has to be rebuilt
+CAPACITY_HEADROOM = 2
+MIN_CAPACITY = 10000
+ERROR_RATE = 0.01
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_email_key(email: str) -> str:
+    return (email or '').strip().lower()
+
+
+class RegisteredEmailFilter:
+    """
+    Bloom filter of every registered email, so most "email not taken" answers skip the database.
+
+    Built from the users table when a worker starts (see warm_up, called from the WSGI/ASGI entry points)
+    and fed by User post_save (see users.signals). Once saturated it is rebuilt in a background thread;
+    until a filter is ready every check is answered by the database, so no request pays for a build.
+    Users created by another worker are not in it, so a stale "not taken" can get through: the unique
+    constraint on User.email stays the source of truth and DjangoUserRepository turns its IntegrityError
+    into the usual "already registered" error.
+    """
+    _filter: Optional[BloomFilter] = None
+    _building = False
+    # Emails saved while a build reads the table, added to the new filter once it is installed
+    _pending: List[str] = []
+    _lock = threading.Lock()
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return settings.USER_EMAIL_FILTER_ENABLED
+
+    @classmethod
+    def might_exist(cls, email: str) -> bool:
+        bloom = cls._filter
+        if not cls.enabled() or bloom is None:
+            return True
+        return bloom.might_contain(normalize_email_key(email))
+
+    @classmethod
+    def add(cls, email: str) -> None:
+        key = normalize_email_key(email)
+        with cls._lock:
+            if cls._building:
+                cls._pending.append(key)
+                return
+            bloom = cls._filter
+        # Without a filter there is nothing to update: the next build reads it from the table
+        if bloom is None:
+            return
+        bloom.add(key)
+        if bloom.is_saturated():
+            cls.reset()
+            cls.rebuild_in_background()
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._filter = None
+
+    @classmethod
+    def warm_up(cls) -> None:
+        """Builds the filter in the calling thread; meant for worker start-up, before any request."""
+        if cls._start_build():
+            cls._finish_build()
+
+    @classmethod
+    def rebuild_in_background(cls) -> None:
+        if cls._start_build():
+            threading.Thread(target=cls._build_in_thread, name='registered-email-filter', daemon=True).start()
+
+    @classmethod
+    def _start_build(cls) -> bool:
+        with cls._lock:
+            if not cls.enabled() or cls._building or cls._filter is not None:
+                return False
+            cls._building = True
+            cls._pending = []
+            return True
+
+    @classmethod
+    def _finish_build(cls) -> None:
+        bloom = None
+        try:
+            bloom = cls._build()
+        except DatabaseError:
+            # The database keeps answering every check; the next saturation or worker start retries
+            logger.exception("Could not build the registered email filter")
+        finally:
+            with cls._lock:
+                if bloom is not None:
+                    bloom.update(cls._pending)
+                    cls._filter = bloom
+                cls._building = False
+                cls._pending = []
+
+    @classmethod
+    def _build_in_thread(cls) -> None:
+        try:
+            cls._finish_build()
+        finally:
+            connection.close()
+
+    @classmethod
+    def _build(cls) -> BloomFilter:
+        bloom = BloomFilter(max(MIN_CAPACITY, User.objects.count() * CAPACITY_HEADROOM), ERROR_RATE)
+        bloom.update(normalize_email_key(email) for email in User.objects.values_list('email', flat=True).iterator(chunk_size=2000))
+        return bloom
@@ -0,0 +1,27 @@
+import time
+from core.cache.cache_manager import CacheManager
+
+CACHE_PREFIX = "token_blacklist_"
+
+
+class TokenBlacklistCache:
+    """
+    Blacklist state of refresh tokens by JTI, kept until each token expires.
+
+    Every blacklisting or unblacklisting through the ORM updates it (see users.signals), so a cached
+    "not blacklisted" can be trusted as well and a refresh only reads the blacklist tables when the entry
+    was evicted. Those updates reach every worker because CACHES must point to a shared backend
+    (deploy check core.W001), the same guarantee the cached user principals rely on.
+    """
+    def __init__(self):
+        self.cache_manager = CacheManager(CACHE_PREFIX)
+
+    def is_blacklisted(self, jti: str):
+        """True or False when known, None when the database has to be asked."""
+        return self.cache_manager.get(self.cache_manager.get_cache_key(jti))
+
+    def remember(self, jti: str, exp: int, blacklisted: bool) -> None:
+        remaining = int(exp - time.time())
+        if remaining <= 0:
+            return
+        self.cache_manager.set(self.cache_manager.get_cache_key(jti), blacklisted, remaining)
@@ -1,5 +1,35 @@
-from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from typing import Tuple, Union
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import aware_utcnow
+from rest_framework_simplejwt.tokens import RefreshToken
 from ....core.domain.entities import UserEntity
+from .token_blacklist_cache import TokenBlacklistCache
+from users.models import User
+
+PRUNE_BATCH_SIZE = 5000
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    """
+    Refresh token whose blacklist check reads TokenBlacklistCache first. The token_blacklist tables are
+    only queried when the JTI is not cached, and the answer is kept until the token expires.
+    """
+    blacklist_cache = TokenBlacklistCache()
+
+    def check_blacklist(self) -> None:
+        jti = self.payload[api_settings.JTI_CLAIM]
+
+        blacklisted = self.blacklist_cache.is_blacklisted(jti)
+        if blacklisted is None:
+            blacklisted = BlacklistedToken.objects.filter(token__jti=jti).exists()
+            self.blacklist_cache.remember(jti, self.payload['exp'], blacklisted)
+
+        if blacklisted:
+            raise TokenError(_("Token is blacklisted"))
+
 
 class TokenService:
     """
@@ -7,24 +37,31 @@ class TokenService:
     This service provides methods for creating, refreshing, and invalidating tokens.
     """
 
-    def create_tokens(self, user_entity: UserEntity) -> dict:
+    def create_tokens(self, user: Union[UserEntity, "User"]) -> dict:
         """
         Creates access and refresh tokens for a user.
+        The access token is derived from the refresh token, so both share the same issue time and
+        only the refresh token is recorded as outstanding.
 
         Args:
-            user_entity (UserEntity): The user entity for whom tokens are being created.
+            user (UserEntity | User): The user for whom tokens are being created. An already loaded
+                User instance, like the one returned on authentication, is used as is.
 
         Returns:
             dict: A dictionary containing the access token and refresh token.
         """
-        user_model = self._get_user_model(user_entity.id)
+        user_model = user if isinstance(user, User) else self._get_user_model(user.id)
 
-        refresh_token = RefreshToken.for_user(user_model)
-        access_token = AccessToken.for_user(user_model)
+        refresh_token = CachedBlacklistRefreshToken.for_user(user_model)
+        access_token = refresh_token.access_token
+        # A new token cannot be blacklisted yet, so its first refresh needs no lookup
+        CachedBlacklistRefreshToken.blacklist_cache.remember(
+            refresh_token[api_settings.JTI_CLAIM], refresh_token['exp'], False
+        )
 
-        access_token['user_id'] = user_entity.id
-        access_token['email'] = user_entity.email
-        access_token['role'] = user_entity.role
+        access_token['user_id'] = user_model.id
+        access_token['email'] = user_model.email
+        access_token['role'] = user_model.role
 
         return {
             'refresh_token': str(refresh_token),
@@ -38,7 +75,7 @@ class TokenService:
         Args:
             refresh_token_str (str): The refresh token string to invalidate.
         """
-        token = RefreshToken(refresh_token_str)
+        token = CachedBlacklistRefreshToken(refresh_token_str)
         token.blacklist()
 
     def refresh_token(self, refresh_token_str: str, user_repository) -> dict:
@@ -52,7 +89,7 @@ class TokenService:
         Returns:
             dict: A dictionary containing the new access token and refresh token.
         """
-        refresh = RefreshToken(refresh_token_str)
+        refresh = CachedBlacklistRefreshToken(refresh_token_str)
         new_access_token = refresh.access_token
 
         user_id = refresh.payload.get('user_id')
@@ -67,6 +104,31 @@ class TokenService:
             'access_token': str(new_access_token),
         }
 
+    def prune_expired_tokens(self, batch_size: int = PRUNE_BATCH_SIZE) -> Tuple[int, int]:
+        """
+        Deletes expired outstanding tokens and their blacklist entries in batches, so the tables stay
+        small without long locks. An expired token fails verification anyway, blacklisted or not.
+
+        Args:
+            batch_size (int): Rows deleted per statement.
+
+        Returns:
+            Tuple[int, int]: Deleted outstanding and blacklisted rows.
+        """
+        now = aware_utcnow()
+        # Tokens expire in creation order, so walking the primary key finds the expired ones first
+        expired = OutstandingToken.objects.filter(expires_at__lte=now).order_by('id').values_list('id', flat=True)
+
+        outstanding_deleted = blacklisted_deleted = 0
+        while True:
+            token_ids = list(expired[:batch_size])
+            if not token_ids:
+                return outstanding_deleted, blacklisted_deleted
+
+            # Plain DELETEs: the cascade and the per-row blacklist signals would load every row first
+            blacklisted_deleted += BlacklistedToken.objects.filter(token_id__in=token_ids)._raw_delete(BlacklistedToken.objects.db)
+            outstanding_deleted += OutstandingToken.objects.filter(id__in=token_ids)._raw_delete(OutstandingToken.objects.db)
+
     def _get_user_model(self, user_id: int):
         """
         Retrieves the Django User model instance for a given user ID.
@@ -77,5 +139,4 @@ class TokenService:
         Returns:
             User: The Django User model instance.
         """
-        from users.models import User
         return User.objects.get(id=user_id)
\ No newline at end of file
@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from datetime import datetime
+
 class UserEntity:
     def __init__(self, id=None, email=None, phone=None, role=None, is_active=True, profile_picture=None, name=None):
         self.id = id
@@ -6,4 +9,57 @@ class UserEntity:
         self.role = role
         self.is_active = is_active
         self.profile_picture = profile_picture
-        self.name = name
\ No newline at end of file
+        self.name = name
+
+class UserPrincipal:
+    """
+    Lo mínimo que necesita una petición autenticada sobre su usuario, incluidos los IDs de sus perfiles
+    de terapeuta y paciente (None si no los tiene); se cachea por poco tiempo para no consultar la tabla
+    de usuarios ni los perfiles en cada llamada.
+    """
+    def __init__(self, id, email, role, is_active=True, therapist_id=None, patient_id=None):
+        self.id = id
+        self.email = email
+        self.role = role
+        self.is_active = is_active
+        self.therapist_id = therapist_id
+        self.patient_id = patient_id
+
+    @property
+    def roles(self):
+        return [self.role.lower()] if self.role else []
+
+class UserProvisioningEntry:
+    """
+    Un usuario del alta masiva junto con los datos de su perfil: nombre y descripción para
+    pacientes, nombre, cédula y especialidad para terapeutas.
+    """
+    def __init__(self, email, password, role, phone='', name='', description='', license_number='', specialization=''):
+        self.email = email
+        self.password = password
+        self.role = role
+        self.phone = phone
+        self.name = name
+        self.description = description
+        self.license_number = license_number
+        self.specialization = specialization
+
+class ProvisionedUser:
+    def __init__(self, id, email, role, profile_id=None):
+        self.id = id
+        self.email = email
+        self.role = role
+        self.profile_id = profile_id
+
+    def to_dict(self):
+        return {'id': self.id, 'email': self.email, 'role': self.role, 'profile_id': self.profile_id}
+
+@dataclass
+class UserSummary:
+    """Proyección ligera de un usuario para el listado de administración."""
+    id: int
+    email: str
+    role: str
+    name: str
+    is_active: bool
+    created_at: datetime
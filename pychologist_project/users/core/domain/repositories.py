@@ -5,10 +5,26 @@ class UserRepository(ABC):
     def get_by_id(self, user_id):
         pass
     
+    @abstractmethod
+    def get_many_by_ids(self, user_ids):
+        pass
+    
     @abstractmethod
     def get_by_email(self, email):
         pass
 
+    @abstractmethod
+    def get_all(self, filters, pagination_input):
+        pass
+
+    @abstractmethod
+    def get_principal(self, user_id):
+        pass
+
+    @abstractmethod
+    def invalidate_principal(self, user_id):
+        pass
+
     @abstractmethod
     def create(self, user_entity, password):
         pass
@@ -18,9 +34,18 @@ class UserRepository(ABC):
         pass
     
     @abstractmethod
-    def exists_by_email(self, email):
+    def exists_by_email(self, email, use_filter=True):
+        """Con use_filter=False se consulta siempre la base de datos, sin el filtro en memoria."""
         pass
     
     @abstractmethod
     def exists_by_phone(self, phone):
         pass
+
+    @abstractmethod
+    def find_provisioning_conflicts(self, emails, phones, license_numbers):
+        pass
+
+    @abstractmethod
+    def bulk_provision(self, entries):
+        pass
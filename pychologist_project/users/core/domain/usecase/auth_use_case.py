@@ -73,10 +73,10 @@ class LoginUseCase:
         if not user.is_active:
             raise BusinessLogicError("El usuario está inactivo.")
         
-        # Actualizar último login
+        # Actualizar último login (un único UPDATE)
         self.user_repository.update_last_login(user)
         
-        # Crear tokens de sesión
+        # Crear tokens de sesión con el mismo usuario autenticado, sin volver a cargarlo
         return self.token_service.create_tokens(user)
 
 class LogoutUseCase:
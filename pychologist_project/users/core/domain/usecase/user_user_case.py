@@ -1,9 +1,15 @@
 from core.exceptions.custom_exceptions import EntityNotFoundError, InvalidOperationError, BusinessLogicError
+from core.pagination.page_helper import PaginationInput
+
+
+def _is_other_email(email, current_email) -> bool:
+    # Emails are unique regardless of case, so changing only the letter case keeps the user's own address
+    return (email or '').strip().lower() != (current_email or '').strip().lower()
 
 class GetUserHomeDataUseCase:
-    def __init__(self, user_repository, therapist_repository, patient_repository):
+    def __init__(self, user_repository, therapist_home_data_use_case, patient_repository=None):
         self.user_repository = user_repository
-        self.therapist_repository = therapist_repository
+        self.therapist_home_data_use_case = therapist_home_data_use_case
         self.patient_repository = patient_repository
     
     def execute(self, user):
@@ -11,7 +17,7 @@ class GetUserHomeDataUseCase:
         if user.role == 'ADMIN':
             return {"type": "ADMIN", "data": {}}
         elif user.role == 'THERAPIST':
-            return self.therapist_repository.get_home_data(user)
+            return self.therapist_home_data_use_case.execute(user.id)
         elif user.role == 'PATIENT':
             return self.patient_repository.get_home_data(user)
         else:
@@ -63,11 +69,23 @@ class GetUserUseCase:
 
 
 class GetAllUsersUseCase:
+    """
+    Listado de usuarios para la consola de administración, siempre con paginación por cursor:
+    sin OFFSET ni COUNT, cada página cuesta lo mismo aunque haya cientos de miles de usuarios.
+    """
+    MAX_PAGE_SIZE = 100
+
     def __init__(self, user_repository):
         self.user_repository = user_repository
     
-    def execute(self, filters=None, page=1, page_size=20):
-        return self.user_repository.get_all(filters, page, page_size)
+    def execute(self, filters, pagination_input):
+        if not 1 <= pagination_input.page_size <= self.MAX_PAGE_SIZE:
+            raise ValueError(f"El tamaño de página debe estar entre 1 y {self.MAX_PAGE_SIZE}")
+
+        # Without a cursor this is the first page
+        pagination_input = PaginationInput(page_size=pagination_input.page_size, cursor=pagination_input.cursor or '')
+
+        return self.user_repository.get_all(filters or {}, pagination_input)
 
 
 class UpdateUserUseCase:
@@ -81,7 +99,7 @@ class UpdateUserUseCase:
         
         email = data.get('email')
         if email and email != user.email:
-            if self.user_repository.exists_by_email(email):
+            if _is_other_email(email, user.email) and self.user_repository.exists_by_email(email, use_filter=False):
                 raise InvalidOperationError("Este email ya está en uso")
             user.email = email
         
@@ -146,6 +164,61 @@ class ChangePasswordUseCase:
             )
 
 
+class BulkProvisionUsersUseCase:
+    """
+    Alta masiva de usuarios (por ejemplo al incorporar una clínica) con sus perfiles de paciente o terapeuta.
+    Es todo o nada: si alguna fila tiene errores no se crea ninguna y se devuelven todos los errores juntos.
+    """
+    MAX_USERS = 1000
+    PASSWORD_REGEX = r"^(?=.*[A-Za-z])(?=.*\d)[A-Za-z\d]{8,}$"
+
+    def __init__(self, user_repository):
+        self.user_repository = user_repository
+
+    def execute(self, entries):
+        """
+        Returns:
+            tuple: (usuarios creados, errores). Cada error es un dict con la fila, el campo y el mensaje.
+        """
+        import re
+        if not entries:
+            raise BusinessLogicError("No hay usuarios que crear")
+        if len(entries) > self.MAX_USERS:
+            raise BusinessLogicError(f"No se pueden crear más de {self.MAX_USERS} usuarios a la vez")
+
+        errors = []
+        for index, entry in enumerate(entries):
+            if not re.match(self.PASSWORD_REGEX, entry.password or ''):
+                errors.append(self._error(index, 'password', "La contraseña debe tener al menos 8 caracteres, incluir al menos una letra y un número."))
+
+        fields = {
+            'email': lambda entry: (entry.email or '').strip().lower(),
+            'phone': lambda entry: entry.phone,
+            'license_number': lambda entry: entry.license_number if entry.role == 'THERAPIST' else '',
+        }
+        values = {field: [key(entry) for entry in entries] for field, key in fields.items()}
+        conflicts = self.user_repository.find_provisioning_conflicts(values['email'], values['phone'], values['license_number'])
+
+        for field, field_values in values.items():
+            seen = set()
+            for index, value in enumerate(field_values):
+                if not value:
+                    continue
+                if value in conflicts[field]:
+                    errors.append(self._error(index, field, "Ya está registrado"))
+                elif value in seen:
+                    errors.append(self._error(index, field, "Está repetido en el lote"))
+                seen.add(value)
+
+        if errors:
+            return [], sorted(errors, key=lambda error: error['row'])
+
+        return self.user_repository.bulk_provision(entries), []
+
+    def _error(self, index, field, message):
+        return {'row': index, 'field': field, 'message': message}
+
+
 class UpdateProfileUseCase:
     def __init__(self, user_repository):
         self.user_repository = user_repository
@@ -156,7 +229,7 @@ class UpdateProfileUseCase:
         
         email = data.get('email')
         if email and email != user.email:
-            if self.user_repository.exists_by_email(email):
+            if _is_other_email(email, user.email) and self.user_repository.exists_by_email(email, use_filter=False):
                 raise ValueError("Este email ya está en uso")
             user.email = email
         
@@ -0,0 +1,79 @@
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from ...data.repositories.django_user_repository import DjangoUserRepository
+from users.models import User
+
+# Loaded from the principal; any other field is fetched from the database the first time it is read
+PRINCIPAL_FIELDS = ('id', 'email', 'role', 'is_active')
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that resolves the user from the cached principal instead of loading the User row
+    on every request.
+
+    request.user is a real User instance with only the principal fields loaded. Reading any other field
+    (name, phone, profile_picture...) falls back to the database through Django's deferred loading,
+    so views that need the full user keep working unchanged. The principal itself, with the profile
+    IDs, is available as request.user.principal (see get_user_principal).
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user_repository = DjangoUserRepository()
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Revocation compares the password hash, which is never cached
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        principal = self.user_repository.get_principal(user_id)
+        if principal is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not principal.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        # from_db expects the values in the model's field order
+        field_names = [field.attname for field in User._meta.concrete_fields if field.attname in PRINCIPAL_FIELDS]
+        user = User.from_db(
+            router.db_for_read(User),
+            field_names,
+            [getattr(principal, field_name) for field_name in field_names]
+        )
+        attach_principal(user, principal)
+        return user
+
+
+def attach_principal(user, principal) -> None:
+    user.principal = principal
+    # User.roles, read by the permission classes
+    user._roles = principal.roles
+
+
+def get_user_principal(user):
+    """
+    The principal of an authenticated user: role plus therapist and patient profile IDs.
+
+    Users authenticated by CachedJWTAuthentication already carry it. Others (session auth, revocation
+    checks, force_authenticate in tests) load it once from the cache or a single joined query and keep
+    it on the user object for the rest of the request. Returns None for anonymous users.
+    """
+    principal = getattr(user, 'principal', None)
+    if principal is not None:
+        return principal
+
+    if not getattr(user, 'is_authenticated', False):
+        return None
+
+    principal = DjangoUserRepository().get_principal(user.id)
+    if principal is not None:
+        attach_principal(user, principal)
+    return principal
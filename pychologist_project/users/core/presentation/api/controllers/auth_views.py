@@ -90,8 +90,7 @@ class LoginView(APIView):
         if not serializer.is_valid():
             audit_logger.warning(f"LoginView: Invalid input data: {serializer.errors}")
             
-            formatted_response = ApiResponse.format_response(data=serializer.errors, success=False, message="Invalid input data.")
-            return Response(formatted_response, status=status.HTTP_400_BAD_REQUEST)
+            return ResponseWrapper.bad_request(data=serializer.errors, message="Invalid input data.")
         
         from .....core.domain.usecase.auth_use_case import LoginUseCase
         from .....core.data.service.token_service import TokenService
@@ -112,8 +111,7 @@ class LoginView(APIView):
         
         audit_logger.info(f"LoginView: User successfully logged in.")
         
-        formatted_response = ApiResponse.format_response(data=session, success=True, message="User successfully logged in.")
-        return Response(formatted_response, status=status.HTTP_200_OK)
+        return ResponseWrapper.success(session, message="User successfully logged in.")
 
 
 class LogoutView(APIView):
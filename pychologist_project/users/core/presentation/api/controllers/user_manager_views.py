@@ -1,16 +1,22 @@
 from rest_framework import status
 from rest_framework.viewsets import ModelViewSet
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from core.api_response.response import DjangoResponseWrapper as ResponseWrapper
 from core.api_response.response import ApiResponse
-from ..serializers.serializers import UserSerializer
+from ..serializers.serializers import UserSerializer, BulkProvisionSerializer
 from .....models import User
 from ....domain.usecase.user_user_case import CreateUserUseCase
 from ....data.repositories.django_user_repository import DjangoUserRepository
 from ....domain.usecase.user_user_case import UpdateUserUseCase
 from ....domain.usecase.user_user_case import DeleteUserUseCase
+from ....domain.usecase.user_user_case import BulkProvisionUsersUseCase
+from ....domain.usecase.user_user_case import GetAllUsersUseCase
+from core.pagination.page_helper import get_pagination_data
+from dataclasses import asdict
+from ....domain.entities import UserProvisioningEntry
 
 import logging
 
@@ -25,12 +31,20 @@ class UserViewSet(ModelViewSet):
         self.create_user_use_case = CreateUserUseCase(self.user_repository)
         self.update_user_use_case = UpdateUserUseCase(self.user_repository)
         self.user_delete_use_case = DeleteUserUseCase(self.user_repository)
+        self.bulk_provision_use_case = BulkProvisionUsersUseCase(self.user_repository)
+        self.get_all_users_use_case = GetAllUsersUseCase(self.user_repository)
         super().__init__(**kwargs)
 
-    queryset = User.objects.all()
+    queryset = User.objects.with_profiles()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_permissions(self):
+        # Browsing every user is for the admin console only
+        if self.action == 'list':
+            return [IsAdminUser()]
+        return super().get_permissions()
+
     @swagger_auto_schema(
         operation_summary="Create a new user",
         operation_description="Creates a new user record.",
@@ -74,6 +88,84 @@ class UserViewSet(ModelViewSet):
         return ResponseWrapper.created(data=self.get_serializer(user).data, entity='User')
 
 
+    @swagger_auto_schema(
+        operation_summary="List users",
+        operation_description="Admin listing of users ordered by ID, with keyset pagination: pass the `next_cursor` "
+                              "of a page as `cursor` to get the next one. Every page costs the same however deep "
+                              "the client goes. Admins only.",
+        responses={
+            200: openapi.Response(description="A page of users and the cursor of the next one."),
+            400: openapi.Response(description="Invalid filter, cursor or page size."),
+            403: openapi.Response(description="Only admins can list users."),
+        },
+        security=[{"Bearer": []}],
+        manual_parameters=[
+            openapi.Parameter(name='role', in_=openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              enum=['ADMIN', 'THERAPIST', 'PATIENT'], description='Filter by role'),
+            openapi.Parameter(name='is_active', in_=openapi.IN_QUERY, type=openapi.TYPE_BOOLEAN,
+                              description='Filter by active status'),
+            openapi.Parameter(name='created_after', in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, format='date',
+                              description='Users created on or after this day (YYYY-MM-DD)'),
+            openapi.Parameter(name='created_before', in_=openapi.IN_QUERY, type=openapi.TYPE_STRING, format='date',
+                              description='Users created on or before this day (YYYY-MM-DD)'),
+            openapi.Parameter(name='email', in_=openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description='Beginning of the email, case insensitive'),
+            openapi.Parameter(name='page_size', in_=openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                              description='Number of users per page (max 100)'),
+            openapi.Parameter(name='cursor', in_=openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description='Cursor returned as next_cursor by the previous page'),
+        ]
+    )
+    def list(self, request, *args, **kwargs):
+        filters = request.query_params.dict()
+        users_page = self.get_all_users_use_case.execute(filters, get_pagination_data(request))
+
+        return ResponseWrapper.found(asdict(users_page), 'Users')
+
+    @swagger_auto_schema(
+        operation_summary="Bulk create users",
+        operation_description="Creates up to 1000 users with their patient or therapist profiles in one request. "
+                              "All or nothing: if any row is invalid, or its email, phone or license number is taken "
+                              "or repeated in the batch, nothing is created and every problem is returned in "
+                              "`data.errors` as `{row, field, message}`. Admins only.",
+        request_body=BulkProvisionSerializer,
+        responses={
+            201: openapi.Response(
+                description="Users created, in request order.",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        properties={
+                            "id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                            "email": openapi.Schema(type=openapi.TYPE_STRING),
+                            "role": openapi.Schema(type=openapi.TYPE_STRING),
+                            "profile_id": openapi.Schema(type=openapi.TYPE_INTEGER, description="Patient or therapist ID, null for admins."),
+                        },
+                    ),
+                ),
+            ),
+            400: openapi.Response(description="Invalid rows; nothing was created."),
+            403: openapi.Response(description="Only admins can provision users."),
+        },
+        security=[{"Bearer": []}],
+    )
+    @action(detail=False, methods=['post'], permission_classes=[IsAdminUser])
+    def bulk(self, request):
+        serializer = BulkProvisionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        entries = [UserProvisioningEntry(**user) for user in serializer.validated_data['users']]
+        audit_logger.info(f"UserViewSet: Bulk creating {len(entries)} users, User: {request.user.id}")
+
+        created, errors = self.bulk_provision_use_case.execute(entries)
+        if errors:
+            return ResponseWrapper.bad_request(data={'errors': errors}, message="No user was created")
+
+        audit_logger.info(f"UserViewSet: Bulk created {len(created)} users")
+
+        return ResponseWrapper.created(data=[user.to_dict() for user in created], entity='Users')
+
     @swagger_auto_schema(
         operation_summary="Retrieve a user",
         operation_description="Retrieves a single user by ID.",
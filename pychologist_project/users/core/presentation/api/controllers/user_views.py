@@ -3,6 +3,8 @@ from rest_framework.views import APIView
 from core.api_response.response import DjangoResponseWrapper as ResponseWrapper
 from rest_framework import status
 from therapists.core.infrastructure.adapters.serializers.serializers import HomeDataSerializer
+from therapists.core.application.therapist_use_case import GetTherapistHomeDataUseCase
+from therapists.core.infrastructure.repositories.django_therapist_dashboard_repository import DjangoTherapistDashboardRepository
 from ....data.repositories.django_user_repository import DjangoUserRepository
 from ....domain.usecase.user_user_case import GetUserHomeDataUseCase
 from ..serializers.serializers import UserSerializer, UserProfileSerializer
@@ -11,18 +13,21 @@ from ....domain.usecase.user_user_case import UpdateProfileUseCase
 class HomeView(APIView):
     def __init__(self, **kwargs):
         self.user_repository = DjangoUserRepository()
-        self.home_use_case = GetUserHomeDataUseCase(self.user_repository)
+        self.home_use_case = GetUserHomeDataUseCase(
+            self.user_repository,
+            GetTherapistHomeDataUseCase(DjangoTherapistDashboardRepository())
+        )
         super().__init__(**kwargs)
 
     permission_classes = [IsAuthenticated]
 
 
     def get(self, request):
-        user = request.get_user()
-                        
-        home_data = self.home_use_case.execute(user)
+        home_data = self.home_use_case.execute(request.user)
 
-        return ResponseWrapper(HomeDataSerializer(home_data).data, status=status.HTTP_200_OK)
+        if isinstance(home_data, dict):
+            return ResponseWrapper.found(home_data, 'Home Data')
+        return ResponseWrapper.found(HomeDataSerializer(home_data).data, 'Home Data')
     
 class ProfileView(APIView):
     def __init__(self, **kwargs):
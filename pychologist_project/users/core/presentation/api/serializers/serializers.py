@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from phonenumber_field.serializerfields import PhoneNumberField
 from .....models import User, Patient, Therapist
 
 class SignupSerializer(serializers.Serializer):
@@ -60,6 +61,37 @@ class SignupSerializer(serializers.Serializer):
         return data
 
 
+class BulkUserSerializer(serializers.Serializer):
+    email = serializers.EmailField(help_text="Email address of the user.")
+    password = serializers.CharField(write_only=True, help_text="Password for the user (write-only).")
+    role = serializers.ChoiceField(choices=['ADMIN', 'THERAPIST', 'PATIENT'], help_text="Role of the user.")
+    phone = PhoneNumberField(required=False, allow_blank=True, help_text="Phone number in international format.")
+    name = serializers.CharField(required=False, allow_blank=True, max_length=100, help_text="Name of the patient or therapist.")
+    description = serializers.CharField(required=False, allow_blank=True, help_text="Description of the patient.")
+    license_number = serializers.CharField(required=False, allow_blank=True, max_length=50, help_text="License number for therapists.")
+    specialization = serializers.CharField(required=False, allow_blank=True, max_length=100, help_text="Specialization of the therapist.")
+
+    def validate(self, data):
+        role = data.get('role')
+
+        if role == 'THERAPIST':
+            if not data.get('license_number'):
+                raise serializers.ValidationError("License number is required for therapists.")
+            if not data.get('specialization'):
+                raise serializers.ValidationError("Specialization is required for therapists.")
+        if role in ('THERAPIST', 'PATIENT') and not data.get('name'):
+            raise serializers.ValidationError("Name is required for patients and therapists.")
+
+        if data.get('phone'):
+            data['phone'] = data['phone'].as_e164
+
+        return data
+
+
+class BulkProvisionSerializer(serializers.Serializer):
+    users = BulkUserSerializer(many=True, allow_empty=False, help_text="Users to create, at most 1000.")
+
+
 class LoginSerializer(serializers.Serializer):
     email = serializers.EmailField(
         required=True, 
@@ -102,22 +134,7 @@ class UserSerializer(serializers.ModelSerializer):
         """
         Método para calcular el valor del campo 'name'.
         """
-        if obj.role == 'ADMIN':
-            return 'ADMIN'
-        elif obj.role == 'PATIENT':
-            try:
-                patient = Patient.objects.get(user=obj)
-                return patient.name
-            except Patient.DoesNotExist:
-                return ""
-        elif obj.role == 'THERAPIST':
-            try:
-                therapist = Therapist.objects.get(user=obj)
-                return therapist.name
-            except Therapist.DoesNotExist:
-                return ""
-        else:
-            return ""
+        return obj.name
 
 class HomeData:
     def __init__(self, therapist_patient_count, incoming_session_count, therapist_name, therapist_photo):
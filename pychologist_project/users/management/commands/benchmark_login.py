@@ -0,0 +1,61 @@
+import statistics
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from users.core.data.repositories.django_user_repository import DjangoUserRepository
+from users.core.data.service.django_auth_service import DjangoAuthService
+from users.core.data.service.token_service import TokenService
+from users.core.domain.usecase.auth_use_case import LoginUseCase
+from users.models import User
+
+BENCHMARK_EMAIL = 'benchmark.login@example.com'
+BENCHMARK_PASSWORD = 'benchmark123'
+
+
+class RollbackBenchmark(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Mide las consultas y la latencia de cada login (autenticación, último acceso y emisión de tokens)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        login_use_case = LoginUseCase(
+            user_repository=DjangoUserRepository(),
+            auth_service=DjangoAuthService(),
+            token_service=TokenService()
+        )
+        credentials = {'email': BENCHMARK_EMAIL, 'password': BENCHMARK_PASSWORD}
+
+        # Everything runs inside a transaction that is rolled back, so the database is left untouched
+        try:
+            with transaction.atomic():
+                User.objects.create_user(email=BENCHMARK_EMAIL, password=BENCHMARK_PASSWORD, role='ADMIN')
+
+                samples, queries = [], []
+                for _ in range(options['repeat']):
+                    with CaptureQueriesContext(connection) as captured:
+                        start = time.perf_counter()
+                        login_use_case.execute(credentials)
+                        samples.append((time.perf_counter() - start) * 1000)
+                    queries.append(len(captured.captured_queries))
+
+                raise RollbackBenchmark()
+        except RollbackBenchmark:
+            pass
+
+        self.stdout.write(f"{'logins':>7} {'queries/login':>14} {'median ms':>10} {'p95 ms':>8}")
+        self.stdout.write(
+            f"{len(samples):>7} {statistics.mean(queries):>14.1f} {statistics.median(samples):>10.2f} "
+            f"{self._percentile(samples, 0.95):>8.2f}"
+        )
+        for query in captured.captured_queries:
+            self.stdout.write(f"  {query['sql'][:120]}")
+
+    def _percentile(self, samples, fraction):
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
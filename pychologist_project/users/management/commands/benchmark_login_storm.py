@@ -0,0 +1,121 @@
+import statistics
+import tempfile
+import threading
+import time
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIRequestFactory
+from core.concurrency.bounded_executor import BoundedExecutor
+from core.exceptions.custom_exceptions import ServiceUnavailableError
+from users.core.data.service.token_service import TokenService
+from users.core.presentation.api.authentication import CachedJWTAuthentication
+from users.models import User
+
+BENCHMARK_EMAIL = 'benchmark.storm@example.com'
+BENCHMARK_PASSWORD = 'benchmark123'
+
+
+class RollbackBenchmark(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ('Simula una ráfaga de logins (PBKDF2) y mide la latencia de las peticiones autenticadas baratas '
+            'con y sin el ejecutor acotado de hashing')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=16, help='Hilos haciendo logins en paralelo')
+        parser.add_argument('--readers', type=int, default=4, help='Hilos haciendo lecturas autenticadas')
+        parser.add_argument('--seconds', type=float, default=3.0)
+        parser.add_argument('--concurrency', type=int, default=1, help='Hashes simultáneos con el ejecutor')
+        parser.add_argument('--queue-timeout', type=float, default=settings.PASSWORD_HASHING_QUEUE_TIMEOUT)
+
+    def handle(self, *args, **options):
+        # The real hasher, whatever PASSWORD_HASHERS says (tests and CI use MD5)
+        hasher = PBKDF2PasswordHasher()
+        encoded = hasher.encode(BENCHMARK_PASSWORD, hasher.salt())
+
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(email=BENCHMARK_EMAIL, password=None, role='ADMIN')
+                token = TokenService().create_tokens(user)['access_token']
+                request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}')
+                authentication = CachedJWTAuthentication()
+                # Warm the principal cache so readers never touch the database
+                authentication.authenticate(request)
+
+                executor = BoundedExecutor(
+                    'benchmark-hashing',
+                    max_concurrency=options['concurrency'],
+                    queue_timeout=options['queue_timeout'],
+                    lock_dir=tempfile.mkdtemp(prefix='pychologist-benchmark-')
+                )
+                results = [
+                    ('unbounded', self._storm(options, lambda: hasher.verify(BENCHMARK_PASSWORD, encoded), authentication, request)),
+                    ('bounded', self._storm(options, lambda: executor.run(hasher.verify, BENCHMARK_PASSWORD, encoded), authentication, request)),
+                ]
+                raise RollbackBenchmark()
+        except RollbackBenchmark:
+            pass
+
+        # A queued login holds its worker for up to the queue timeout; compare it with the worker's request budget
+        self.stdout.write(f"queue timeout: {options['queue_timeout'] * 1000:.0f} ms")
+        self.stdout.write(
+            f"{'mode':>10} {'logins':>7} {'rejected':>9} {'login p99 ms':>13} {'login max ms':>13} "
+            f"{'reads':>7} {'read p50 ms':>12} {'read p99 ms':>12}"
+        )
+        for mode, (logins, rejected, attempts, reads) in results:
+            self.stdout.write(
+                f"{mode:>10} {logins:>7} {rejected:>9} {self._percentile(attempts, 0.99):>13.2f} {max(attempts):>13.2f} "
+                f"{len(reads):>7} {statistics.median(reads):>12.2f} {self._percentile(reads, 0.99):>12.2f}"
+            )
+
+    def _storm(self, options, login, authentication, request):
+        stop = threading.Event()
+        counters = {'logins': 0, 'rejected': 0}
+        # Time each login attempt held its thread, queueing included, whether it succeeded or got a 503
+        attempts = []
+        reads = []
+        lock = threading.Lock()
+
+        def log_in():
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    login()
+                    outcome = 'logins'
+                except ServiceUnavailableError:
+                    outcome = 'rejected'
+                elapsed = (time.perf_counter() - start) * 1000
+                with lock:
+                    counters[outcome] += 1
+                    attempts.append(elapsed)
+                if outcome == 'rejected':
+                    # A rejected client backs off before retrying, as it would after a 503
+                    stop.wait(0.05)
+
+        def read():
+            while not stop.is_set():
+                start = time.perf_counter()
+                authentication.authenticate(request)
+                elapsed = (time.perf_counter() - start) * 1000
+                with lock:
+                    reads.append(elapsed)
+                stop.wait(0.005)
+
+        threads = [threading.Thread(target=log_in) for _ in range(options['logins'])]
+        threads += [threading.Thread(target=read) for _ in range(options['readers'])]
+        for thread in threads:
+            thread.start()
+        time.sleep(options['seconds'])
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        return counters['logins'], counters['rejected'], attempts, reads
+
+    def _percentile(self, samples, fraction):
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
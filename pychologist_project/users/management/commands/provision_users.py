@@ -0,0 +1,34 @@
+import csv
+from django.core.management.base import BaseCommand, CommandError
+from users.core.data.repositories.django_user_repository import DjangoUserRepository
+from users.core.domain.entities import UserProvisioningEntry
+from users.core.domain.usecase.user_user_case import BulkProvisionUsersUseCase
+from users.core.presentation.api.serializers.serializers import BulkProvisionSerializer
+
+
+class Command(BaseCommand):
+    help = ('Crea usuarios y sus perfiles de paciente o terapeuta desde un CSV con las columnas email, password, '
+            'role, phone, name, description, license_number y specialization. Si alguna fila falla no se crea ninguna')
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path')
+
+    def handle(self, *args, **options):
+        with open(options['csv_path'], newline='', encoding='utf-8') as csv_file:
+            rows = [{field: value for field, value in row.items() if value} for row in csv.DictReader(csv_file)]
+
+        serializer = BulkProvisionSerializer(data={'users': rows})
+        if not serializer.is_valid():
+            for row, row_errors in enumerate(serializer.errors.get('users', [])):
+                if row_errors:
+                    self.stderr.write(f"Fila {row + 1}: {row_errors}")
+            raise CommandError(f"El archivo no es válido: {serializer.errors.get('non_field_errors', '')}")
+
+        entries = [UserProvisioningEntry(**user) for user in serializer.validated_data['users']]
+        created, errors = BulkProvisionUsersUseCase(DjangoUserRepository()).execute(entries)
+        if errors:
+            for error in errors:
+                self.stderr.write(f"Fila {error['row'] + 1}, {error['field']}: {error['message']}")
+            raise CommandError("No se creó ningún usuario")
+
+        self.stdout.write(self.style.SUCCESS(f"Usuarios creados: {len(created)}"))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from users.core.data.service.token_service import TokenService, PRUNE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Borra por lotes los tokens de refresco caducados y sus entradas en la lista negra'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=PRUNE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        outstanding, blacklisted = TokenService().prune_expired_tokens(options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Tokens caducados borrados: {outstanding}, entradas de la lista negra borradas: {blacklisted}"
+        ))
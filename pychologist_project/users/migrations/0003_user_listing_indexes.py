@@ -0,0 +1,45 @@
+# Generated by Django 5.1.2 on 2026-10-19 11:53
+
+from django.db import migrations, models
+
+EMAIL_INDEX_NAME = 'user_email_upper_idx'
+
+
+def use_pattern_ops_for_email_index(apps, schema_editor):
+    # UPPER(email) returns text, and the default operator class only serves LIKE 'PREFIX%' under
+    # the C collation. text_pattern_ops serves both the equality lookups and the admin email search.
+    # The name is kept, so Django still manages the index as declared in User.Meta.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {EMAIL_INDEX_NAME}')
+    schema_editor.execute(f'CREATE INDEX {EMAIL_INDEX_NAME} ON users_user (UPPER(email::text) text_pattern_ops)')
+
+
+def use_default_ops_for_email_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {EMAIL_INDEX_NAME}')
+    schema_editor.execute(f'CREATE INDEX {EMAIL_INDEX_NAME} ON users_user (UPPER(email::text))')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', 'id'], name='user_role_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['created_at'], name='user_created_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_active', False)), fields=['id'], name='user_inactive_idx'),
+        ),
+        migrations.RunPython(use_pattern_ops_for_email_index, use_default_ops_for_email_index),
+    ]
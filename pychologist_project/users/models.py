@@ -1,4 +1,6 @@
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
+from django.db.models.functions import Upper
 from django.forms import ValidationError
 from django.utils import timezone
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager
@@ -7,7 +9,14 @@ from core.exceptions.custom_exceptions import EntityNotFoundError
 from therapists.models import Therapist
 from patients.models import Patient
 
+PROFILE_ACCESSORS = {'PATIENT': 'patient_profile', 'THERAPIST': 'therapist_profile'}
+
+
 class UserManager(BaseUserManager):
+    def with_profiles(self):
+        """Users with their patient and therapist profiles joined, so User.name needs no extra query."""
+        return self.get_queryset().select_related(*PROFILE_ACCESSORS.values())
+
     def create_user(self, email, password=None, **extra_fields):
         if not email:
             raise ValueError('El email es obligatorio')
@@ -41,6 +50,21 @@ class User(AbstractBaseUser):
 
     objects = UserManager()
 
+    class Meta:
+        constraints = [
+            # The email column is unique case-sensitively; this keeps "Ana@x.com" and "ana@x.com" apart too
+            models.UniqueConstraint(Upper('email'), name='user_email_upper_uniq'),
+        ]
+        indexes = [
+            # email__iexact compiles to UPPER(email) = UPPER(%s), which this index serves
+            models.Index(Upper('email'), name='user_email_upper_idx'),
+            models.Index(fields=['phone'], name='user_phone_idx'),
+            # Admin listing: keyset pages by id within a role, date ranges and the few inactive users
+            models.Index(fields=['role', 'id'], name='user_role_id_idx'),
+            models.Index(fields=['created_at'], name='user_created_at_idx'),
+            models.Index(fields=['id'], name='user_inactive_idx', condition=models.Q(is_active=False)),
+        ]
+
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = []
 
@@ -53,40 +77,34 @@ class User(AbstractBaseUser):
     
     @property
     def name(self) -> str:
+        """
+        Name from the patient or therapist profile. Load users with User.objects.with_profiles()
+        so reading it does not query the profile tables for every user.
+        """
         if self.role == 'ADMIN':
             return 'ADMIN'
-        elif self.role == 'PATIENT':
-            try:
-                Patient.objects.get(user=self.user)
-            except Patient.DoesNotExist:
-                return ""
-        elif self.role == 'THERAPSIT':
-            try:
-                Therapist.objects.get(user=self.user)
-            except Therapist.DoesNotExist:
-                return ""
-        else:
-            return ""
-        
-    # TODO: Move?
-    @property
+        profile = self._get_profile()
+        return profile.name if profile else ""
+
     def set_name(self, new_name):
         if self.role == 'ADMIN':
             return
-        elif self.role == 'PATIENT':
-            try:
-                patient = Patient.objects.get(user=self.user)
-                patient.name = new_name
-                patient.save()
-            except Patient.DoesNotExist:
-                raise EntityNotFoundError("Patient don't found")
-        elif self.role == 'THERAPSIT':
-            try:
-                Therapist.objects.get(user=self.user)
-            except Therapist.DoesNotExist:
-                raise EntityNotFoundError("Therapist don't found")
-        else:
-            return ""
+        profile = self._get_profile()
+        if profile is None:
+            entity = 'Patient' if self.role == 'PATIENT' else 'Therapist'
+            raise EntityNotFoundError(f"{entity} don't found")
+        profile.name = new_name
+        profile.save(update_fields=['name', 'updated_at'])
+
+    def _get_profile(self):
+        # Reverse one-to-one accessors cache their result, a missing profile included
+        accessor = PROFILE_ACCESSORS.get(self.role)
+        if accessor is None:
+            return None
+        try:
+            return getattr(self, accessor)
+        except ObjectDoesNotExist:
+            return None
 
     def _get_jwt_roles(self):
         return getattr(self, '_roles', [])
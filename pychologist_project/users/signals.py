@@ -0,0 +1,56 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from patients.models import Patient
+from therapists.models import Therapist
+from .core.data.repositories.django_user_repository import DjangoUserRepository
+from .core.data.service.registered_email_filter import RegisteredEmailFilter
+from .core.data.service.token_blacklist_cache import TokenBlacklistCache
+from .models import User
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def cache_blacklisted_token(sender, instance, created, **kwargs):
+    # Covers logout, rotation and the admin alike, which keeps cached "not blacklisted" answers safe
+    token = instance.token
+    TokenBlacklistCache().remember(token.jti, token.expires_at.timestamp(), True)
+
+
+@receiver(post_delete, sender=BlacklistedToken)
+def cache_unblacklisted_token(sender, instance, **kwargs):
+    token = instance.token
+    TokenBlacklistCache().remember(token.jti, token.expires_at.timestamp(), False)
+
+
+@receiver(post_save, sender=User)
+def add_registered_email(sender, instance, **kwargs):
+    # Signups and email changes alike; a replaced email stays in the filter as a harmless false positive
+    RegisteredEmailFilter.add(instance.email)
+
+
+@receiver(post_save, sender=User)
+def refresh_caches_on_user_save(sender, instance, created, **kwargs):
+    repository = DjangoUserRepository()
+    repository.invalidate_listing()
+    if not created:
+        repository.invalidate_principal(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def refresh_listing_on_user_delete(sender, instance, **kwargs):
+    DjangoUserRepository().invalidate_listing()
+
+
+@receiver(post_save, sender=Therapist)
+@receiver(post_delete, sender=Therapist)
+@receiver(post_save, sender=Patient)
+@receiver(post_delete, sender=Patient)
+def refresh_principal_on_profile_change(sender, instance, update_fields=None, **kwargs):
+    # The principal carries the profile IDs; linking, soft-deleting or removing a profile changes them
+    if not instance.user_id:
+        return
+    repository = DjangoUserRepository()
+    repository.invalidate_principal(instance.user_id)
+    # The user listing shows profile names
+    if update_fields is None or 'name' in update_fields:
+        repository.invalidate_listing()
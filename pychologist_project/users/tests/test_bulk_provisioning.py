@@ -0,0 +1,108 @@
+import os
+import tempfile
+from io import StringIO
+from django.test import TestCase, override_settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.contrib.auth.hashers import check_password
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework import status
+from patients.models import Patient
+from therapists.models import Therapist
+from ..core.data.service.password_hashing import hash_passwords
+from ..core.data.service.registered_email_filter import RegisteredEmailFilter
+from ..models import User
+
+
+def patient_rows(count, prefix="p"):
+    return [{'email': f"{prefix}{index}@clinic.com", 'password': "secret123", 'role': 'PATIENT', 'name': f"Paciente {index}"}
+            for index in range(count)]
+
+
+class BulkProvisioningTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(email="admin@example.com", password="secret123")
+        cls.existing = User.objects.create_user(email="ana@example.com", password="secret123", role='THERAPIST')
+        Therapist.objects.create(user=cls.existing, name="Ana", license_number="LIC-1", specialization="Clínica")
+
+    def setUp(self):
+        cache.clear()
+        RegisteredEmailFilter.reset()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_creates_users_and_profiles_with_a_constant_number_of_queries(self):
+        # Arrange
+        users = [
+            {'email': "Luis@Clinic.com", 'password': "secret123", 'role': 'THERAPIST', 'name': "Luis Pérez",
+             'license_number': "LIC-2", 'specialization': "Familiar", 'phone': "+525512345678"},
+            {'email': "root@clinic.com", 'password': "secret123", 'role': 'ADMIN'},
+        ] + patient_rows(3)
+
+        # Act
+        with CaptureQueriesContext(connection) as small_batch:
+            response = self.client.post('/users/bulk/', {'users': users}, format='json')
+        with CaptureQueriesContext(connection) as large_batch:
+            self.client.post('/users/bulk/', {'users': patient_rows(40, prefix="q")}, format='json')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        created = response.data['data']
+        self.assertEqual([user['email'] for user in created[:2]], ["Luis@clinic.com", "root@clinic.com"])
+        therapist = Therapist.objects.get(id=created[0]['profile_id'])
+        self.assertEqual((therapist.user_id, therapist.name_key), (created[0]['id'], "luis perez"))
+        self.assertEqual(Patient.objects.get(id=created[2]['profile_id']).user_id, created[2]['id'])
+        self.assertIsNone(created[1]['profile_id'])
+        self.assertTrue(User.objects.get(id=created[1]['id']).check_password("secret123"))
+        self.assertEqual(Patient.objects.filter(user__email__startswith="q").count(), 40)
+        self.assertLessEqual(len(large_batch), len(small_batch))
+
+    def test_rejects_the_whole_batch_when_any_row_conflicts(self):
+        # Arrange
+        users = patient_rows(2) + [
+            {'email': "ANA@example.com", 'password': "secret123", 'role': 'PATIENT', 'name': "Ana"},
+            {'email': "p0@clinic.com", 'password': "short", 'role': 'PATIENT', 'name': "Otro"},
+            {'email': "x@clinic.com", 'password': "secret123", 'role': 'THERAPIST', 'name': "X",
+             'license_number': "LIC-1", 'specialization': "Clínica"},
+        ]
+
+        # Act
+        response = self.client.post('/users/bulk/', {'users': users}, format='json')
+
+        # Assert
+        self.assertEqual(response.data['status_code'], status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [(error['row'], error['field']) for error in response.data['data']['errors']],
+            [(2, 'email'), (3, 'password'), (3, 'email'), (4, 'license_number')]
+        )
+        self.assertFalse(User.objects.filter(email__endswith="@clinic.com").exists())
+
+    def test_only_admins_can_provision(self):
+        # Arrange
+        client = APIClient()
+        client.force_authenticate(self.existing)
+
+        # Act
+        response = client.post('/users/bulk/', {'users': patient_rows(1)}, format='json')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_command_and_process_pool_hashing(self):
+        # Arrange
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as csv_file:
+            csv_file.write("email,password,role,name\n")
+            csv_file.writelines(f"c{index}@clinic.com,secret{index}a,PATIENT,Paciente {index}\n" for index in range(20))
+        self.addCleanup(os.remove, csv_file.name)
+
+        # Act
+        with override_settings(PASSWORD_HASHING_CONCURRENCY=2):
+            hashes = hash_passwords([f"secret{index}a" for index in range(20)])
+            call_command('provision_users', csv_file.name, stdout=StringIO())
+
+        # Assert
+        self.assertTrue(all(check_password(f"secret{index}a", encoded) for index, encoded in enumerate(hashes)))
+        self.assertEqual(Patient.objects.filter(user__email__startswith="c").count(), 20)
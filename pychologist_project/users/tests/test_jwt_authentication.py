@@ -0,0 +1,61 @@
+from django.db import connection
+from django.test import TestCase
+from django.core.cache import cache
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework import status
+from therapists.models import Therapist
+from ..core.data.repositories.django_user_repository import DjangoUserRepository
+from ..core.data.service.token_service import TokenService
+from ..core.domain.entities import UserEntity
+from ..models import User
+
+
+class CachedJWTAuthenticationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="ana@example.com", password="secret123", role='THERAPIST')
+        Therapist.objects.create(user=cls.user, name="Ana", license_number="LIC-J1", specialization="Clínica")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {TokenService().create_tokens(self.user)['access_token']}")
+
+    def _user_queries(self, captured):
+        return [query['sql'] for query in captured.captured_queries if 'FROM "users_user"' in query['sql']]
+
+    def test_authenticated_requests_do_not_load_the_user_row(self):
+        # Arrange
+        self.client.get('/calendar/feed/')
+
+        # Act
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get('/calendar/feed/')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._user_queries(captured), [])
+
+    def test_fields_outside_the_principal_are_loaded_on_demand(self):
+        # Arrange
+        request_user = self.client.get('/calendar/feed/').wsgi_request.user
+
+        # Act
+        with CaptureQueriesContext(connection) as captured:
+            profile_picture = request_user.profile_picture
+
+        # Assert
+        self.assertEqual((request_user.role, profile_picture), ('THERAPIST', ''))
+        self.assertEqual(len(self._user_queries(captured)), 1)
+
+    def test_repository_update_drops_the_cached_principal(self):
+        # Arrange
+        self.client.get('/calendar/feed/')
+
+        # Act
+        DjangoUserRepository().update(UserEntity(id=self.user.id, is_active=False))
+        response = self.client.get('/calendar/feed/')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
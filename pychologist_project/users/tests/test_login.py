@@ -0,0 +1,38 @@
+from django.test import TestCase
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from ..models import User
+
+
+class LoginTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="ana@example.com", password="secret123", role='ADMIN')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_login_reuses_the_authenticated_user(self):
+        # Act
+        # Authentication, last_login UPDATE, outstanding token INSERT and the audit log row
+        with self.assertNumQueries(4):
+            response = APIClient().post('/login/', {'email': "ana@example.com", 'password': "secret123"}, format='json')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tokens = response.data['data']
+        access_token = AccessToken(tokens['access_token'])
+        self.assertEqual((access_token['email'], access_token['role']), ("ana@example.com", 'ADMIN'))
+        self.assertEqual(access_token['iat'], RefreshToken(tokens['refresh_token'])['iat'])
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
+
+    def test_login_rejects_wrong_password(self):
+        # Act
+        response = APIClient().post('/login/', {'email': "ana@example.com", 'password': "wrong1234"}, format='json')
+
+        # Assert
+        self.assertNotEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status_code'], 400)
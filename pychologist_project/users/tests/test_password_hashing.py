@@ -0,0 +1,97 @@
+import tempfile
+from unittest import mock
+from django.test import TestCase, override_settings
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from rest_framework import status
+from core.concurrency.bounded_executor import BoundedExecutor
+from core.exceptions.custom_exceptions import ServiceUnavailableError
+from ..core.data.repositories.django_user_repository import DjangoUserRepository
+from ..core.data.service import password_hashing
+from ..core.domain.entities import UserEntity
+from ..models import User
+
+
+class PasswordHashingExecutorTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="ana@example.com", password="secret123", role='ADMIN')
+
+    def setUp(self):
+        cache.clear()
+        password_hashing.get_password_hashing_executor.cache_clear()
+        self.addCleanup(password_hashing.get_password_hashing_executor.cache_clear)
+
+    def test_executor_rejects_when_every_slot_is_taken(self):
+        # Arrange
+        lock_dir = tempfile.mkdtemp()
+        holder = BoundedExecutor('test', max_concurrency=1, queue_timeout=0.01, lock_dir=lock_dir)
+        waiter = BoundedExecutor('test', max_concurrency=1, queue_timeout=0.01, lock_dir=lock_dir)
+
+        # Act / Assert
+        with self.assertRaises(ServiceUnavailableError):
+            holder.run(waiter.run, len, "busy")
+        self.assertEqual(waiter.run(len, "free"), 4)
+
+    def test_login_answers_503_while_hashing_is_saturated(self):
+        # Arrange
+        with override_settings(PASSWORD_HASHING_CONCURRENCY=1, PASSWORD_HASHING_QUEUE_TIMEOUT=0.01,
+                               PASSWORD_HASHING_LOCK_DIR=tempfile.mkdtemp()):
+            executor = password_hashing.get_password_hashing_executor()
+            slot = executor._acquire()
+            try:
+                # Act
+                response = APIClient().post('/login/', {'email': "ana@example.com", 'password': "secret123"}, format='json')
+            finally:
+                executor._release(slot)
+            retried = APIClient().post('/login/', {'email': "ana@example.com", 'password': "secret123"}, format='json')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response['Retry-After'], '1')
+        self.assertEqual(retried.status_code, status.HTTP_200_OK)
+
+    def test_create_hashes_the_password_once(self):
+        # Act
+        with mock.patch.object(password_hashing, 'make_password', wraps=password_hashing.make_password) as make_password:
+            created = DjangoUserRepository().create(UserEntity(email="Luis@EXAMPLE.com", role='PATIENT'), "secret123")
+
+        # Assert
+        make_password.assert_called_once_with("secret123")
+        user = User.objects.get(id=created.id)
+        self.assertEqual(user.email, "Luis@example.com")
+        self.assertTrue(user.check_password("secret123"))
+
+    def test_reserve_holds_only_the_free_slots(self):
+        # Arrange
+        executor = BoundedExecutor('test', max_concurrency=2, queue_timeout=0.01, lock_dir=tempfile.mkdtemp())
+        slot = executor._acquire()
+
+        # Act
+        try:
+            with executor.reserve(2) as held:
+                with self.assertRaises(ServiceUnavailableError):
+                    executor.run(len, "busy")
+        finally:
+            executor._release(slot)
+
+        # Assert
+        self.assertEqual(held, 1)
+        self.assertEqual(executor.run(len, "free"), 4)
+
+    def test_bulk_hashing_waits_for_the_shared_slots(self):
+        # Arrange
+        with override_settings(PASSWORD_HASHING_CONCURRENCY=1, PASSWORD_HASHING_QUEUE_TIMEOUT=0.01,
+                               PASSWORD_HASHING_LOCK_DIR=tempfile.mkdtemp()):
+            executor = password_hashing.get_password_hashing_executor()
+            slot = executor._acquire()
+            try:
+                # Act / Assert
+                with self.assertRaises(ServiceUnavailableError):
+                    password_hashing.hash_passwords([f"secret{index}a" for index in range(20)])
+            finally:
+                executor._release(slot)
+            hashes = password_hashing.hash_passwords(["secret123"])
+
+        # Assert
+        self.assertEqual(len(hashes), 1)
@@ -0,0 +1,65 @@
+from datetime import timedelta
+from io import StringIO
+from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import aware_utcnow
+from ..core.data.service.token_service import CachedBlacklistRefreshToken, TokenService
+from ..models import User
+
+
+class TokenBlacklistCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="ana@example.com", password="secret123", role='ADMIN')
+
+    def setUp(self):
+        cache.clear()
+        self.token_service = TokenService()
+        self.refresh_token = self.token_service.create_tokens(self.user)['refresh_token']
+
+    def test_refresh_reads_the_blacklist_from_cache(self):
+        # Act / Assert
+        with self.assertNumQueries(0):
+            CachedBlacklistRefreshToken(self.refresh_token)
+        cache.clear()
+        with self.assertNumQueries(1):
+            CachedBlacklistRefreshToken(self.refresh_token)
+        with self.assertNumQueries(0):
+            CachedBlacklistRefreshToken(self.refresh_token)
+
+    def test_removing_a_token_from_the_blacklist_is_cached(self):
+        # Arrange
+        self.token_service.invalidate_token(self.refresh_token)
+
+        # Act
+        BlacklistedToken.objects.all().delete()
+
+        # Assert
+        with self.assertNumQueries(0):
+            CachedBlacklistRefreshToken(self.refresh_token)
+
+    def test_blacklisted_token_is_rejected_without_queries(self):
+        # Arrange
+        self.token_service.invalidate_token(self.refresh_token)
+
+        # Act / Assert
+        with self.assertNumQueries(0), self.assertRaises(TokenError):
+            CachedBlacklistRefreshToken(self.refresh_token)
+
+    def test_prune_removes_only_expired_tokens(self):
+        # Arrange
+        self.token_service.invalidate_token(self.refresh_token)
+        OutstandingToken.objects.update(expires_at=aware_utcnow() - timedelta(minutes=1))
+        self.token_service.create_tokens(self.user)
+
+        # Act
+        out = StringIO()
+        call_command('prune_expired_tokens', batch_size=1, stdout=out)
+
+        # Assert
+        self.assertEqual(OutstandingToken.objects.count(), 1)
+        self.assertFalse(BlacklistedToken.objects.exists())
+        self.assertIn("borrados: 1", out.getvalue())
@@ -0,0 +1,141 @@
+from django.test import TestCase, SimpleTestCase
+from django.core.cache import cache
+from unittest.mock import patch
+from core.cache.bloom_filter import BloomFilter
+from core.exceptions.custom_exceptions import BusinessLogicError, InvalidOperationError
+from ..core.data.repositories.django_user_repository import DjangoUserRepository
+from ..core.data.service.registered_email_filter import RegisteredEmailFilter
+from ..core.domain.entities import UserEntity
+from ..core.domain.usecase.user_user_case import UpdateProfileUseCase, UpdateUserUseCase
+from ..models import User
+
+
+class UserExistenceTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="ana@example.com", password="secret123", role='ADMIN', phone="+525512345678")
+
+    def setUp(self):
+        cache.clear()
+        RegisteredEmailFilter.reset()
+        self.addCleanup(RegisteredEmailFilter.reset)
+        self.repository = DjangoUserRepository()
+
+    def test_unknown_email_is_answered_without_a_query(self):
+        # Arrange
+        RegisteredEmailFilter.warm_up()
+
+        # Act
+        with self.assertNumQueries(0):
+            free = self.repository.exists_by_email("nobody@example.com")
+        with self.assertNumQueries(1):
+            taken = self.repository.exists_by_email("  ANA@Example.com ")
+
+        # Assert
+        self.assertFalse(free)
+        self.assertTrue(taken)
+
+    def test_checks_are_answered_by_the_database_until_the_filter_is_built(self):
+        # Act
+        with self.assertNumQueries(1):
+            free = self.repository.exists_by_email("nobody@example.com")
+
+        # Assert
+        self.assertFalse(free)
+        self.assertIsNone(RegisteredEmailFilter._filter)
+
+    def test_saturated_filter_is_rebuilt_outside_the_request(self):
+        # Arrange
+        RegisteredEmailFilter._filter = BloomFilter(1)
+
+        # Act
+        with patch('users.core.data.service.registered_email_filter.threading.Thread') as thread:
+            RegisteredEmailFilter.add("luis@example.com")
+            RegisteredEmailFilter.add("eva@example.com")
+            with self.assertNumQueries(1):
+                during_rebuild = self.repository.exists_by_email("nobody@example.com")
+            RegisteredEmailFilter.add("saved-during-rebuild@example.com")
+        # What the background thread runs
+        RegisteredEmailFilter._finish_build()
+
+        # Assert
+        thread.return_value.start.assert_called_once_with()
+        self.assertFalse(during_rebuild)
+        self.assertTrue(RegisteredEmailFilter.might_exist("ANA@example.com"))
+        self.assertTrue(RegisteredEmailFilter.might_exist("saved-during-rebuild@example.com"))
+        self.assertFalse(RegisteredEmailFilter.might_exist("nobody@example.com"))
+
+    def test_new_users_are_added_to_the_filter(self):
+        # Arrange
+        RegisteredEmailFilter.warm_up()
+
+        # Act
+        self.repository.create(UserEntity(email="luis@example.com", role='PATIENT'), "secret123")
+
+        # Assert
+        self.assertTrue(self.repository.exists_by_email("Luis@example.com"))
+        self.assertTrue(self.repository.exists_by_phone("+525512345678"))
+        self.assertFalse(self.repository.exists_by_phone("+525587654321"))
+
+    def test_unique_constraint_catches_what_the_filter_missed(self):
+        # Arrange: a filter built before another worker registered the email
+        RegisteredEmailFilter._filter = BloomFilter(10)
+
+        # Act
+        stale_answer = self.repository.exists_by_email("ana@example.com")
+        with self.assertRaises(BusinessLogicError):
+            self.repository.create(UserEntity(email="ana@example.com", role='ADMIN'), "secret123")
+
+        # Assert
+        self.assertFalse(stale_answer)
+        self.assertEqual(User.objects.filter(email="ana@example.com").count(), 1)
+
+    def test_case_variant_of_a_registered_email_is_rejected(self):
+        # Arrange
+        RegisteredEmailFilter._filter = BloomFilter(10)
+
+        # Act / Assert
+        with self.assertRaises(BusinessLogicError):
+            self.repository.create(UserEntity(email="ANA@example.com", role='ADMIN'), "secret123")
+
+    def test_update_to_a_taken_email_skips_the_stale_filter(self):
+        # Arrange
+        other = User.objects.create_user(email="luis@example.com", password="secret123", role='PATIENT')
+        RegisteredEmailFilter._filter = BloomFilter(10)
+
+        # Act / Assert
+        with self.assertRaises(InvalidOperationError):
+            UpdateUserUseCase(self.repository).execute(other.id, {'email': "Ana@Example.com"})
+        self.assertEqual(User.objects.get(id=other.id).email, "luis@example.com")
+
+    def test_changing_the_case_of_the_own_email_is_allowed(self):
+        # Act
+        UpdateUserUseCase(self.repository).execute(self.user.id, {'email': "Ana@Example.com"})
+        UpdateProfileUseCase(self.repository).execute(self.repository.get_by_id(self.user.id), {'email': "ANA@example.com"})
+
+        # Assert
+        self.assertEqual(User.objects.get(id=self.user.id).email, "ANA@example.com")
+
+    def test_update_maps_the_unique_constraint_to_email_in_use(self):
+        # Arrange
+        other = User.objects.create_user(email="luis@example.com", password="secret123", role='PATIENT')
+        entity = self.repository.get_by_id(other.id)
+        entity.email = "ana@example.com"
+
+        # Act / Assert
+        with self.assertRaises(InvalidOperationError):
+            self.repository.update(entity)
+
+
+class BloomFilterTest(SimpleTestCase):
+    def test_has_no_false_negatives_and_few_false_positives(self):
+        # Arrange
+        bloom = BloomFilter(1000, 0.01)
+        bloom.update(f"user{index}@example.com" for index in range(1000))
+
+        # Act
+        false_positives = sum(bloom.might_contain(f"other{index}@example.com") for index in range(10000))
+
+        # Assert
+        self.assertTrue(all(bloom.might_contain(f"user{index}@example.com") for index in range(1000)))
+        self.assertLess(false_positives, 300)
@@ -0,0 +1,70 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from patients.models import Patient
+from ..models import User
+
+
+class UserListingTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(email="admin@example.com", password="secret123")
+        cls.patients = [User.objects.create_user(email=f"paciente{index}@example.com", password="secret123", role='PATIENT') for index in range(5)]
+        Patient.objects.create(user=cls.patients[0], name="Luis")
+        cls.therapist = User.objects.create_user(email="Terapeuta@example.com", password="secret123", role='THERAPIST', is_active=False)
+        User.objects.filter(id=cls.therapist.id).update(created_at=timezone.now() - timedelta(days=30))
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_walks_every_page_with_the_cursor(self):
+        # Act
+        pages, cursor = [], ''
+        while cursor is not None:
+            response = self.client.get('/users/', {'role': 'patient', 'page_size': 2, 'cursor': cursor})
+            page = response.data['data']
+            pages.append([user['email'] for user in page['items']])
+            cursor = page['next_cursor']
+
+        # Assert
+        self.assertEqual(sum(pages, []), [user.email for user in self.patients])
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(response.data['data']['items'][0]['role'], 'PATIENT')
+
+    def test_filters_and_cached_pages(self):
+        # Act
+        inactive = self.client.get('/users/', {'is_active': 'false', 'created_before': (timezone.now() - timedelta(days=1)).date().isoformat()})
+        by_email = self.client.get('/users/', {'email': 'TERAP'})
+        first_page = self.client.get('/users/', {'email': 'paciente0'})
+        with self.assertNumQueries(1):  # only the audit log row
+            self.client.get('/users/', {'email': 'paciente0'})
+        patient = Patient.objects.get(user=self.patients[0])
+        patient.name = "Luis Pérez"
+        patient.save()
+        renamed = self.client.get('/users/', {'email': 'paciente0'})
+
+        # Assert
+        self.assertEqual([user['id'] for user in inactive.data['data']['items']], [self.therapist.id])
+        self.assertEqual([user['email'] for user in by_email.data['data']['items']], ["Terapeuta@example.com"])
+        self.assertEqual(first_page.data['data']['items'][0]['name'], "Luis")
+        self.assertEqual(renamed.data['data']['items'][0]['name'], "Luis Pérez")
+
+    def test_rejects_invalid_input_and_non_admins(self):
+        # Arrange
+        client = APIClient()
+        client.force_authenticate(self.patients[0])
+
+        # Act
+        forbidden = client.get('/users/')
+        bad_role = self.client.get('/users/', {'role': 'ROOT'})
+        too_big = self.client.get('/users/', {'page_size': 500})
+
+        # Assert
+        self.assertEqual(forbidden.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(bad_role.data['status_code'], status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(too_big.data['status_code'], status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,59 @@
+from django.test import TestCase
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from patients.models import Patient
+from therapists.models import Therapist
+from ..core.data.repositories.django_user_repository import DjangoUserRepository
+from ..core.domain.entities import UserEntity
+from ..models import User
+
+
+class UserNameTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(email="admin@example.com", password="secret123")
+        cls.patients = [User.objects.create_user(email=f"p{index}@example.com", password="secret123", role='PATIENT') for index in range(3)]
+        for index, user in enumerate(cls.patients):
+            Patient.objects.create(user=user, name=f"Paciente {index}")
+        cls.therapist = User.objects.create_user(email="t@example.com", password="secret123", role='THERAPIST')
+        Therapist.objects.create(user=cls.therapist, name="Ana", license_number="LIC-N1", specialization="Clínica")
+        cls.orphan = User.objects.create_user(email="sin.perfil@example.com", password="secret123", role='PATIENT')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_batch_mapping_reads_names_without_extra_queries(self):
+        # Arrange
+        user_ids = [self.admin.id, self.therapist.id, self.orphan.id] + [user.id for user in self.patients]
+
+        # Act
+        with self.assertNumQueries(1):
+            users = DjangoUserRepository().get_many_by_ids(user_ids)
+
+        # Assert
+        self.assertEqual(users[self.admin.id].name, 'ADMIN')
+        self.assertEqual(users[self.therapist.id].name, "Ana")
+        self.assertEqual(users[self.patients[2].id].name, "Paciente 2")
+        self.assertEqual(users[self.orphan.id].name, "")
+
+    def test_user_list_costs_the_same_whatever_its_size(self):
+        # Arrange
+        client = APIClient()
+        client.force_authenticate(self.admin)
+
+        # Act
+        # The user query and the audit log row
+        with self.assertNumQueries(2):
+            response = client.get('/users/')
+
+        # Assert
+        names = {user['email']: user['name'] for user in response.data['data']['items']}
+        self.assertEqual((names["t@example.com"], names["p1@example.com"]), ("Ana", "Paciente 1"))
+
+    def test_update_renames_the_profile(self):
+        # Act
+        updated = DjangoUserRepository().update(UserEntity(id=self.therapist.id, name="Ana María"))
+
+        # Assert
+        self.assertEqual(updated.name, "Ana María")
+        self.assertEqual(Therapist.objects.get(user=self.therapist).name_key, "ana maria")
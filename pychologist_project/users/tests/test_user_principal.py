@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+from django.db import connection
+from django.test import TestCase
+from django.core.cache import cache
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from core.permissions import IsTherapistOrAdmin
+from patients.models import Patient
+from therapists.models import Therapist
+from ..core.data.repositories.django_user_repository import DjangoUserRepository
+from ..core.data.service.token_service import TokenService
+from ..models import User
+
+
+class UserPrincipalTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.therapist_user = User.objects.create_user(email="ana@example.com", password="secret123", role='THERAPIST')
+        cls.therapist = Therapist.objects.create(user=cls.therapist_user, name="Ana", license_number="LIC-P1", specialization="Clínica")
+        cls.patient_user = User.objects.create_user(email="luis@example.com", password="secret123", role='PATIENT')
+
+    def setUp(self):
+        cache.clear()
+        self.repository = DjangoUserRepository()
+
+    def test_profiles_are_resolved_with_one_joined_query_and_cached(self):
+        # Act
+        with self.assertNumQueries(1):
+            principal = self.repository.get_principal(self.therapist_user.id)
+        with self.assertNumQueries(0):
+            cached = self.repository.get_principal(self.therapist_user.id)
+
+        # Assert
+        self.assertEqual((principal.role, principal.therapist_id, principal.patient_id), ('THERAPIST', self.therapist.id, None))
+        self.assertEqual(cached.therapist_id, self.therapist.id)
+
+    def test_profile_changes_refresh_the_principal(self):
+        # Arrange
+        self.assertIsNone(self.repository.get_principal(self.patient_user.id).patient_id)
+
+        # Act
+        patient = Patient.objects.create(user=self.patient_user, name="Luis")
+        linked = self.repository.get_principal(self.patient_user.id)
+        patient.deleted_at = timezone.now()
+        patient.save()
+        deleted = self.repository.get_principal(self.patient_user.id)
+
+        # Assert
+        self.assertEqual(linked.patient_id, patient.id)
+        self.assertIsNone(deleted.patient_id)
+
+    def test_permission_and_views_use_the_principal_instead_of_profile_queries(self):
+        # Arrange
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {TokenService().create_tokens(self.therapist_user)['access_token']}")
+        client.get('/calendar/feed/')
+
+        # Act
+        with CaptureQueriesContext(connection) as captured:
+            response = client.get('/calendar/feed/')
+        request_user = response.wsgi_request.user
+        with self.assertNumQueries(0):
+            allowed = IsTherapistOrAdmin().has_permission(SimpleNamespace(user=request_user), None)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([query['sql'] for query in captured.captured_queries if 'therapists_therapist' in query['sql']], [])
+        self.assertTrue(allowed)
+        self.assertEqual(request_user.roles, ['therapist'])